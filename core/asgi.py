@@ -0,0 +1,38 @@
+"""
+ASGI-Konfiguration: Django für HTTP, Live-Feed per WebSocket im selben Prozess.
+
+Start z.B. mit ``uvicorn core.asgi:application``.
+"""
+
+import os
+
+from django.core.asgi import get_asgi_application
+
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "core.settings")
+
+django_application = get_asgi_application()
+
+# Erst nach get_asgi_application() importieren (Apps müssen geladen sein)
+from insight_ui.websocket import (  # noqa: E402
+    lifespan_application,
+    websocket_application,
+)
+
+websocket_routes = {
+    "/ws/live/": websocket_application,
+}
+
+
+async def application(scope, receive, send):
+    """Verteilt HTTP an Django, WebSockets an die Routen und den Lifespan."""
+    if scope["type"] == "websocket":
+        route = websocket_routes.get(scope["path"])
+        if route is None:
+            # Schließen vor dem Accept beantwortet der Server mit 403
+            await send({"type": "websocket.close", "code": 1008})
+            return
+        await route(scope, receive, send)
+    elif scope["type"] == "lifespan":
+        await lifespan_application(scope, receive, send)
+    else:
+        await django_application(scope, receive, send)
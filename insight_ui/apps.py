@@ -1,6 +1,7 @@
 """Django App-Konfiguration für Insight UI."""
 
 from django.apps import AppConfig
+from django.core import checks
 
 
 class InsightUiConfig(AppConfig):
@@ -9,3 +10,13 @@ class InsightUiConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "insight_ui"
     verbose_name = "Django Insight UI"
+
+    def ready(self) -> None:
+        """Registriert die Komponenten und löst ``INSIGHT_UI`` einmalig auf."""
+        from . import conf
+        from .templatetags import insight_tags  # noqa: F401 – registriert die Tags
+
+        # Ungültige Werte schlagen hier fehl, nicht beim ersten Request;
+        # unbekannte Schlüssel meldet der Systemcheck als Warnung
+        conf.configure()
+        checks.register(conf.check_settings, checks.Tags.compatibility)
@@ -0,0 +1,186 @@
+"""Benchmark der Komponenten-Tags: Inclusion-Tag-Pfad gegen kompilierten Pfad."""
+
+import copy
+import gc
+import time
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from django import template
+from django.template import Context, Engine, engines
+
+from .components import Collection, _components
+
+# Jeder Messkontext enthält ein CSRF-Token, wie bei RequestContext; sonst
+# warnen Templates mit {% csrf_token %} (form, language_selector, navbar)
+CSRF_TOKEN = "benchmark-token"
+
+# Tag-Argumente und Kontext je Komponente
+SAMPLES: Dict[str, Tuple[str, Dict[str, Any]]] = {
+    "navbar": (
+        'brand="Insight" links=links theme="dark"',
+        {
+            "links": [
+                {"url": "/", "title": "Start", "active": True},
+                {"url": "/reports/", "title": "Berichte"},
+                {"url": "/settings/", "title": "Einstellungen"},
+            ]
+        },
+    ),
+    "live_content": ('url="/api/live-data/orders/" interval=5000', {}),
+    "insight_websocket": (
+        'id="dashboard" ws_url="/ws/live/?target=dashboard" topics="cpu,memory"',
+        {},
+    ),
+    "infinite_scroll": (
+        'items=entries next_url="/api/items/?cursor=abc"',
+        {"entries": [f"Eintrag {i}" for i in range(5)]},
+    ),
+    "language_selector": ('current_language="de"', {}),
+    "alert": ('message="Gespeichert" type="success" id="notice"', {}),
+    "sidebar": (
+        'title="Navigation" items=links collapsible=True',
+        {
+            "links": [
+                {"url": "/", "title": "Start", "active": True},
+                {"url": "/reports/", "title": "Berichte"},
+            ]
+        },
+    ),
+    "breadcrumbs": (
+        "items=trail",
+        {"trail": [{"url": "/", "title": "Start"}, {"title": "Berichte"}]},
+    ),
+    "table": (
+        'headers=headers rows=rows caption="Bestellungen"',
+        {
+            "headers": ["Nummer", "Kunde", "Summe"],
+            "rows": [[i, f"Kunde {i}", f"{i * 10} €"] for i in range(5)],
+        },
+    ),
+    "modal": (
+        'id="confirm" title="Löschen?" content="Wirklich löschen?" actions=actions',
+        {
+            "actions": [
+                {"text": "Abbrechen", "type": "secondary", "action": "close"},
+                {"text": "Löschen", "type": "danger"},
+            ]
+        },
+    ),
+    "card": (
+        'title="Umsatz" subtitle="Heute" content="<p>1.234 €</p>" actions=actions',
+        {
+            "actions": [
+                {"url": "/orders/", "text": "Details"},
+                {"url": "https://example.com", "text": "Extern", "external": True},
+            ]
+        },
+    ),
+    "form": (
+        'fields=fields title="Kontakt" actions=actions htmx_url="/submit/"',
+        {
+            "fields": [
+                {"name": "name", "label": "Name", "type": "text", "required": True},
+                {"name": "email", "label": "E-Mail", "type": "email"},
+            ],
+            "actions": [{"text": "Senden", "type": "submit"}],
+        },
+    ),
+    "footer": ('theme="dark"', {}),
+}
+
+
+def inclusion_engine(engine: Optional[Engine] = None) -> Engine:
+    """
+    Kopie der Engine, in der ``insight_tags`` über Djangos ``inclusion_tag`` läuft.
+
+    Die Kontext-Funktionen und Templates sind dieselben wie im kompilierten
+    Pfad; nur der Render-Weg unterscheidet sich.
+    """
+    if engine is None:
+        engine = engines["django"].engine
+    library = template.Library()
+    for component in _components.values():
+        if isinstance(component, Collection):
+            continue
+        library.inclusion_tag(component.template_name, name=component.name)(
+            component.func
+        )
+    generic = copy.copy(engine)
+    generic.template_libraries = {**engine.template_libraries, "insight_tags": library}
+    return generic
+
+
+def loop_template(engine: Engine, name: str, args: str) -> template.Template:
+    """Template, das die Komponente einmal pro Element von ``items`` rendert."""
+    return engine.from_string(
+        "{% load insight_tags %}{% for i in items %}"
+        f"{{% {name} {args} %}}"
+        "{% endfor %}"
+    )
+
+
+def measure(
+    templates: List[template.Template], context: Dict[str, Any], repeat: int
+) -> List[float]:
+    """
+    Gibt pro Template die beste von ``repeat`` Laufzeiten in Sekunden zurück.
+
+    Die Templates laufen abwechselnd, damit Schwankungen der Maschine beide
+    Pfade gleich treffen; wie bei ``timeit`` ist die Garbage Collection
+    während der Messung abgeschaltet.
+    """
+    best = [float("inf")] * len(templates)
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        for _ in range(repeat):
+            for index, compiled in enumerate(templates):
+                start = time.perf_counter()
+                compiled.render(Context(context))
+                best[index] = min(best[index], time.perf_counter() - start)
+    finally:
+        if enabled:
+            gc.enable()
+    return best
+
+
+def benchmark_components(
+    count: int = 500, repeat: int = 11, names: Optional[Iterable[str]] = None
+) -> List[Dict[str, Any]]:
+    """
+    Misst pro Komponente ``count`` Aufrufe in einer Schleife auf beiden Pfaden.
+
+    Args:
+        count: Aufrufe pro Messung
+        repeat: Wiederholungen; gewertet wird die schnellste
+        names: Zu messende Tags (Standard: alle aus ``SAMPLES``)
+
+    Returns:
+        Eine Zeile pro Tag mit Laufzeiten in Millisekunden, Faktor und
+        ``identical`` (beide Pfade liefern dieselbe Ausgabe)
+    """
+    engine = engines["django"].engine
+    generic = inclusion_engine(engine)
+    results = []
+    for name in names or SAMPLES:
+        args, values = SAMPLES[name]
+        context = {"csrf_token": CSRF_TOKEN, **values, "items": range(count)}
+        baseline = loop_template(generic, name, args)
+        compiled = loop_template(engine, name, args)
+        identical = baseline.render(Context(context)) == compiled.render(
+            Context(context)
+        )
+        inclusion_seconds, compiled_seconds = measure(
+            [baseline, compiled], context, repeat
+        )
+        results.append(
+            {
+                "tag": name,
+                "count": count,
+                "inclusion_ms": round(inclusion_seconds * 1000, 2),
+                "compiled_ms": round(compiled_seconds * 1000, 2),
+                "speedup": round(inclusion_seconds / compiled_seconds, 2),
+                "identical": identical,
+            }
+        )
+    return results
@@ -0,0 +1,187 @@
+"""In-Process-Broadcast für Live-Updates per Server-Sent Events."""
+
+import asyncio
+import logging
+import threading
+from typing import Any, AsyncIterator, Dict, List, Optional, Set, Tuple
+
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+from django.utils import translation
+
+from .conf import get_config
+from .live import LiveDataProvider, arender_live_fragment
+
+logger = logging.getLogger(__name__)
+
+KEEPALIVE = ": keepalive\n\n"
+
+
+def format_sse(data: str, event: str = "", id: str = "") -> str:
+    """
+    Formatiert eine Nachricht im ``text/event-stream``-Format.
+
+    Args:
+        data: Der Inhalt; mehrzeilige Inhalte werden auf ``data:``-Zeilen verteilt
+        event: Optionaler Ereignistyp (Standard im Browser: 'message')
+        id: Optionale Ereignis-ID
+
+    Returns:
+        Die Nachricht einschließlich abschließender Leerzeile
+    """
+    lines = []
+    if id:
+        lines.append(f"id: {id}")
+    if event:
+        lines.append(f"event: {event}")
+    lines.extend(f"data: {line}" for line in data.splitlines() or [""])
+    return "\n".join(lines) + "\n\n"
+
+
+class LiveChannel:
+    """
+    Ein Kanal pro Datenquelle und Sprache.
+
+    Ein einzelner Task prüft im Abstand von ``interval`` Sekunden die Version
+    der Datenquelle, rendert bei einer Änderung genau einmal und verteilt die
+    fertige Nachricht an alle Abonnenten.
+    """
+
+    def __init__(
+        self, provider: LiveDataProvider, language: str, interval: float
+    ) -> None:
+        self.provider = provider
+        self.language = language
+        self.interval = interval
+        self.subscribers: Set["asyncio.Queue[str]"] = set()
+        self.message: Optional[str] = None
+        self.version: Optional[str] = None
+        self.renders = 0
+        self.task: Optional["asyncio.Task[None]"] = None
+
+    def publish(self, message: str) -> None:
+        """Stellt eine Nachricht allen Abonnenten zu."""
+        self.message = message
+        for queue in self.subscribers:
+            if queue.full():
+                # Langsame Abonnenten erhalten nur den neuesten Stand
+                queue.get_nowait()
+            queue.put_nowait(message)
+
+    async def refresh(self) -> None:
+        """Rendert und verteilt, falls sich die Version geändert hat."""
+        version = await self.provider.aversion()
+        if version == self.version:
+            return
+        with translation.override(self.language):
+            fragment = await arender_live_fragment(self.provider, version)
+        self.version = version
+        self.renders += 1
+        self.publish(format_sse(fragment.content, id=version))
+
+    async def run(self) -> None:
+        while self.subscribers:
+            try:
+                await self.refresh()
+            except Exception:
+                logger.exception(
+                    "Live-Update für %s fehlgeschlagen", self.provider.name
+                )
+            await asyncio.sleep(self.interval)
+
+
+class LiveBroadcastHub:
+    """
+    Verwaltet die Live-Kanäle eines Prozesses.
+
+    Kanäle entstehen mit dem ersten Abonnenten und werden mit dem letzten
+    wieder entfernt. Sie sind an den Event-Loop gebunden, in dem sie
+    angelegt wurden.
+
+    Args:
+        interval: Abstand der Versionsprüfungen in Sekunden
+        keepalive: Sekunden ohne Nachricht, nach denen ein Kommentar gesendet wird
+    """
+
+    def __init__(self, interval: float = 1.0, keepalive: float = 15.0) -> None:
+        self.interval = interval
+        self.keepalive = keepalive
+        self._channels: Dict[Tuple[int, str, str], LiveChannel] = {}
+
+    async def subscribe(
+        self, provider: LiveDataProvider, language: str
+    ) -> AsyncIterator[str]:
+        """
+        Abonniert eine Datenquelle und liefert fertige SSE-Nachrichten.
+
+        Der zuletzt verteilte Stand wird sofort geliefert. Danach folgen
+        Änderungen bzw. Keepalive-Kommentare, bis der Aufrufer den Generator
+        schließt.
+        """
+        loop = asyncio.get_running_loop()
+        key = (id(loop), provider.name, language)
+        channel = self._channels.get(key)
+        if channel is None:
+            channel = self._channels[key] = LiveChannel(
+                provider, language, self.interval
+            )
+
+        queue: "asyncio.Queue[str]" = asyncio.Queue(maxsize=1)
+        if channel.message is not None:
+            queue.put_nowait(channel.message)
+        channel.subscribers.add(queue)
+        if channel.task is None or channel.task.done():
+            channel.task = loop.create_task(channel.run())
+
+        try:
+            while True:
+                try:
+                    yield await asyncio.wait_for(queue.get(), self.keepalive)
+                except asyncio.TimeoutError:
+                    yield KEEPALIVE
+        finally:
+            channel.subscribers.discard(queue)
+            if not channel.subscribers:
+                channel.task.cancel()
+                if self._channels.get(key) is channel:
+                    del self._channels[key]
+
+    def metrics(self) -> List[Dict[str, Any]]:
+        """Gibt Abonnenten und Render-Anzahl pro Kanal zurück."""
+        return [
+            {
+                "source": channel.provider.name,
+                "language": channel.language,
+                "subscribers": len(channel.subscribers),
+                "renders": channel.renders,
+                "version": channel.version,
+            }
+            for channel in list(self._channels.values())
+        ]
+
+
+_hub: Optional[LiveBroadcastHub] = None
+_hub_lock = threading.Lock()
+
+
+def get_live_hub() -> LiveBroadcastHub:
+    """
+    Gibt den prozessweiten Hub zurück.
+
+    Konfigurierbar über ``INSIGHT_UI["live_hub"]`` mit den Schlüsseln
+    ``interval`` und ``keepalive``.
+    """
+    global _hub
+    if _hub is None:
+        with _hub_lock:
+            if _hub is None:
+                _hub = LiveBroadcastHub(**get_config().live_hub)
+    return _hub
+
+
+@receiver(setting_changed, dispatch_uid="insight_ui_live_hub_setting_changed")
+def live_hub_setting_changed(sender: Any, setting: str, **kwargs: Any) -> None:
+    """Legt den Hub neu an, wenn sich ``INSIGHT_UI`` ändert."""
+    global _hub
+    if setting == "INSIGHT_UI":
+        _hub = None
@@ -0,0 +1,232 @@
+"""Fragment-Cache für gerenderte Insight UI-Komponenten."""
+
+import hashlib
+import json
+from typing import Any, Callable, Mapping, NamedTuple, Optional
+
+from django.core.cache import BaseCache, caches
+from django.dispatch import receiver
+from django.http import HttpRequest, HttpResponse
+from django.utils.cache import get_conditional_response, patch_vary_headers
+from django.utils.functional import Promise
+from django.utils.http import quote_etag
+from django.utils.safestring import SafeData
+
+from .conf import get_config
+from .context import translations_reloaded
+
+KEY_PREFIX = "insight_ui"
+
+
+class RenderedFragment(NamedTuple):
+    """Ein gerendertes HTML-Fragment samt starkem ETag."""
+
+    etag: str
+    content: str
+
+
+def fragment_cache_settings() -> Mapping[str, Any]:
+    """Gibt die Einstellungen für den Fragment-Cache zurück."""
+    return get_config().fragment_cache
+
+
+def get_fragment_cache() -> BaseCache:
+    """Gibt das konfigurierte Django-Cache-Backend zurück."""
+    return caches[fragment_cache_settings()["alias"]]
+
+
+def make_etag(content: str) -> str:
+    """Erzeugt einen starken, in Anführungszeichen gesetzten ETag."""
+    return quote_etag(hashlib.sha256(content.encode("utf-8")).hexdigest()[:32])
+
+
+def _namespace_key(namespace: str) -> str:
+    return f"{KEY_PREFIX}:ns:{namespace}"
+
+
+def namespace_version(namespace: str, cache: Optional[BaseCache] = None) -> int:
+    """
+    Gibt die aktuelle Version eines Cache-Namensraums zurück.
+
+    Der Zähler liegt im Backend der Einträge (Standard: Fragment-Cache).
+    """
+    if cache is None:
+        cache = get_fragment_cache()
+    key = _namespace_key(namespace)
+    version = cache.get(key)
+    if version is None:
+        cache.add(key, 1, timeout=None)
+        version = cache.get(key, 1)
+    return version
+
+
+def bump_namespace_version(namespace: str, cache: Optional[BaseCache] = None) -> int:
+    """
+    Invalidiert alle Fragmente eines Namensraums.
+
+    Alte Einträge werden nicht gelöscht, sondern über die neue Version im
+    Schlüssel unerreichbar und laufen über ihr Timeout aus. Für Komponenten
+    siehe :func:`bump_component_namespace`.
+    """
+    if cache is None:
+        cache = get_fragment_cache()
+    key = _namespace_key(namespace)
+    try:
+        return cache.incr(key)
+    except ValueError:
+        cache.set(key, 2, timeout=None)
+        return 2
+
+
+def fragment_cache_key(
+    namespace: str, *parts: Any, cache: Optional[BaseCache] = None
+) -> str:
+    """
+    Baut einen versionierten Cache-Schlüssel für einen Namensraum.
+
+    ``cache`` ist das Backend, in dem Zähler und Einträge liegen
+    (Standard: Fragment-Cache).
+    """
+    suffix = ":".join(str(part) for part in parts)
+    version = namespace_version(namespace, cache)
+    return f"{KEY_PREFIX}:{namespace}:v{version}:{suffix}"
+
+
+def _digest_value(value: Any) -> Any:
+    """
+    Bildet einen Wert eindeutig auf JSON ab.
+
+    Texte bleiben Strings; sichere Strings, Listen und Dicts erhalten eine
+    Markierung, damit ``mark_safe("<b>")`` und ``"<b>"`` oder eine Liste
+    und ein markierter String nicht denselben Schlüssel ergeben.
+    """
+    if isinstance(value, Promise):
+        # Übersetzbare Strings in der aktiven Sprache (Teil des Schlüssels)
+        value = str(value)
+    if value is None or isinstance(value, (bool, int, float)):
+        return value
+    if isinstance(value, str):
+        return ["s", str(value)] if isinstance(value, SafeData) else value
+    if isinstance(value, (list, tuple)):
+        return ["l", [_digest_value(item) for item in value]]
+    if isinstance(value, dict):
+        if not all(isinstance(key, str) for key in value):
+            raise TypeError("Nur String-Schlüssel lassen sich cachen")
+        return ["d", {key: _digest_value(item) for key, item in value.items()}]
+    # QuerySets, Modelle, Generatoren & Co. haben keine stabile Darstellung
+    raise TypeError(
+        f"{type(value).__name__} lässt sich nicht als Cache-Schlüssel abbilden"
+    )
+
+
+def arguments_digest(*values: Any) -> str:
+    """
+    Bildet einen stabilen Hash über Tag-Argumente.
+
+    Erlaubt sind ``None``, Zahlen, Strings (auch übersetzbare und sichere),
+    Listen, Tupel und Dicts mit String-Schlüsseln.
+
+    Raises:
+        TypeError: Für alle anderen Werte, z.B. QuerySets, Modell-Instanzen
+            oder Generatoren; der Aufrufer rendert dann ungecacht
+    """
+    encoded = json.dumps(
+        [_digest_value(value) for value in values],
+        sort_keys=True,
+        separators=(",", ":"),
+    )
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()[:32]
+
+
+def component_cache_settings() -> Mapping[str, Any]:
+    """Gibt die Einstellungen für den Komponenten-Cache zurück."""
+    return get_config().component_cache
+
+
+def get_component_cache() -> BaseCache:
+    """Gibt das Cache-Backend für Komponenten zurück."""
+    return caches[component_cache_settings()["alias"]]
+
+
+def bump_component_namespace(namespace: str) -> int:
+    """Invalidiert alle gecachten Komponenten eines Namensraums."""
+    return bump_namespace_version(namespace, get_component_cache())
+
+
+def cached_component(
+    key: str, render: Callable[[], str], timeout: Optional[int] = None
+) -> str:
+    """
+    Liefert das HTML einer Komponente aus dem Cache oder rendert und speichert es.
+
+    Args:
+        key: Der Cache-Schlüssel (siehe :func:`fragment_cache_key` mit
+            ``cache=get_component_cache()``)
+        render: Funktion, die das HTML bei einem Cache-Miss erzeugt
+        timeout: Gültigkeit in Sekunden (Standard: ``component_cache.timeout``)
+
+    Returns:
+        Das gerenderte HTML
+    """
+    config = component_cache_settings()
+    cache = get_component_cache()
+    content = cache.get(key)
+    if content is None:
+        content = str(render())
+        if timeout is None:
+            timeout = config["timeout"]
+        cache.set(key, content, timeout=timeout)
+    return content
+
+
+def get_cached_fragment(key: str) -> RenderedFragment | None:
+    """Liest ein Fragment aus dem Cache, ohne es zu rendern."""
+    version = fragment_cache_settings()["version"]
+    cached = get_fragment_cache().get(key, version=version)
+    return RenderedFragment(*cached) if cached is not None else None
+
+
+def cached_fragment(key: str, render: Callable[[], str]) -> RenderedFragment:
+    """
+    Liefert ein Fragment aus dem Cache oder rendert und speichert es.
+
+    Args:
+        key: Der Cache-Schlüssel (siehe :func:`fragment_cache_key`)
+        render: Funktion, die das HTML bei einem Cache-Miss erzeugt
+
+    Returns:
+        Das gerenderte Fragment mit ETag
+    """
+    fragment = get_cached_fragment(key)
+    if fragment is None:
+        content = str(render())
+        fragment = RenderedFragment(make_etag(content), content)
+        config = fragment_cache_settings()
+        get_fragment_cache().set(
+            key, tuple(fragment), timeout=config["timeout"], version=config["version"]
+        )
+    return fragment
+
+
+def fragment_response(
+    request: HttpRequest, key: str, render: Callable[[], str]
+) -> HttpResponse:
+    """
+    Beantwortet einen Request mit einem gecachten Fragment.
+
+    Stimmt ``If-None-Match`` mit dem ETag eines gecachten Eintrags überein,
+    wird ohne Rendern mit 304 geantwortet.
+    """
+    fragment = cached_fragment(key, render)
+    response = get_conditional_response(request, etag=fragment.etag)
+    if response is None:
+        response = HttpResponse(fragment.content)
+    response["ETag"] = fragment.etag
+    patch_vary_headers(response, ("HX-Request", "Accept-Language"))
+    return response
+
+
+@receiver(translations_reloaded, dispatch_uid="insight_ui_fragment_cache_reload")
+def invalidate_component_fragments(sender: Any, **kwargs: Any) -> None:
+    """Verwirft gecachte Komponenten nach einem Neuladen der Übersetzungen."""
+    bump_component_namespace("components")
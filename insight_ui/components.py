@@ -0,0 +1,710 @@
+"""Kompilierter Render-Pfad für die Insight UI-Komponenten."""
+
+import hashlib
+import json
+import logging
+import threading
+from functools import wraps
+from inspect import getfullargspec, unwrap
+from itertools import islice
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+)
+from weakref import WeakKeyDictionary
+
+from django import template
+from django.core import signing
+from django.dispatch import receiver
+from django.http import StreamingHttpResponse
+from django.template import Context, Engine, engines
+from django.template.base import Template
+from django.template.library import TagHelperNode, parse_bits
+from django.urls import reverse
+from django.utils import translation
+from django.utils.autoreload import file_changed
+from django.utils.functional import Promise
+from django.utils.html import escape
+from django.utils.safestring import SafeData, mark_safe
+
+from .cache import (
+    KEY_PREFIX,
+    arguments_digest,
+    cached_component,
+    fragment_cache_key,
+    get_component_cache,
+)
+from .conf import InsightConfig, component_defaults, get_config
+
+logger = logging.getLogger(__name__)
+
+# Verschachtelungstiefe, bis zu der Dicts im Kontext vorbereitet werden
+# (z.B. ``options`` oder ``actions[i]``)
+PREPARE_DEPTH = 2
+
+# Schließendes Markup der Rahmen-Templates von Sammel-Komponenten
+COLLECTION_CLOSE = "</div>"
+
+# Namensraum für ``cache=``; wird beim Neuladen der Übersetzungen erhöht
+CACHE_NAMESPACE = "components"
+
+# Gecachte Formulare enthalten statt des CSRF-Tokens diesen Platzhalter
+CSRF_PLACEHOLDER = "insight-ui-csrf-token"
+CSRF_INPUT = '<input type="hidden" name="csrfmiddlewaretoken" value="{}">'
+
+# Platzhalter und Signatur für ``lazy=``
+LAZY_TEMPLATE = "insight_ui/components/lazy.html"
+LAZY_SALT = "insight_ui.components.lazy"
+LAZY_TRIGGERS = {True: "revealed", "load": "load", "revealed": "revealed"}
+
+# Größere Argumente (JSON, Bytes) liegen im Komponenten-Cache statt in der URL
+LAZY_INLINE_LIMIT = 512
+LAZY_TIMEOUT = 60 * 60 * 24
+
+# Markiert mit ``mark_safe`` erzeugte Strings im JSON verzögerter Komponenten
+SAFE_MARKER = "__safe__"
+
+# Tag-Argumente, die das Rendern steuern und nicht an die Komponente gehen
+CONTROL_ARGUMENTS = frozenset({"lazy", "cache", "cache_namespace"})
+
+# Nur diese Typen muss prepare() ansehen
+PREPARED_TYPES = (dict, list, tuple)
+
+
+class Options(dict):
+    """
+    Dict, dessen fehlende Schlüssel als leerer String aufgelöst werden.
+
+    Djangos Variablenauflösung probiert bei einem fehlenden Schlüssel
+    nacheinander Index-, Attribut- und Listenzugriff und fängt dabei mehrere
+    Exceptions. Optionale Angaben wie ``options.id`` kosten so ein Vielfaches
+    eines Treffers. Mit ``__missing__`` liefert bereits der erste Zugriff ``''``
+    – dasselbe Ergebnis wie ``string_if_invalid`` in der Standardeinstellung.
+    Namen von Dict-Methoden (z.B. ``errors.items``) werden weiterhin als
+    Attribut aufgelöst.
+    """
+
+    def __missing__(self, key: Any) -> str:
+        if isinstance(key, str) and hasattr(dict, key):
+            raise KeyError(key)
+        return ""
+
+
+def insert_csrf_token(content: str, csrf_token: Any) -> str:
+    """Ersetzt den CSRF-Platzhalter gecachter Fragmente durch das Token des Requests."""
+    if CSRF_PLACEHOLDER not in content:
+        return content
+    if not csrf_token or csrf_token == "NOTPROVIDED":
+        # Wie ``{% csrf_token %}`` ohne Token: Feld entfällt
+        return content.replace(CSRF_INPUT.format(CSRF_PLACEHOLDER), "")
+    return content.replace(CSRF_PLACEHOLDER, escape(csrf_token))
+
+
+class DeferredSerializer:
+    """
+    JSON-Serializer für ``signing``, der übersetzbare Strings als Text ablegt.
+
+    Sichere Strings (``mark_safe``) werden als ``{"__safe__": text}`` abgelegt
+    und beim Laden wieder markiert, damit die verzögerte Komponente genauso
+    escaped wie die sofort gerenderte.
+    """
+
+    @staticmethod
+    def _default(value: Any) -> Any:
+        if isinstance(value, Promise):
+            return str(value)
+        raise TypeError(f"{type(value).__name__} lässt sich nicht signieren")
+
+    @classmethod
+    def _encode(cls, value: Any) -> Any:
+        if isinstance(value, SafeData) and isinstance(value, str):
+            return {SAFE_MARKER: str(value)}
+        if isinstance(value, dict):
+            return {key: cls._encode(item) for key, item in value.items()}
+        if isinstance(value, (list, tuple)):
+            return [cls._encode(item) for item in value]
+        return value
+
+    @staticmethod
+    def _decode(obj: Dict[str, Any]) -> Any:
+        if len(obj) == 1 and SAFE_MARKER in obj:
+            return mark_safe(obj[SAFE_MARKER])
+        return obj
+
+    def dumps(self, obj: Any) -> bytes:
+        return json.dumps(
+            self._encode(obj), separators=(",", ":"), default=self._default
+        ).encode("latin-1")
+
+    def loads(self, data: bytes) -> Any:
+        return json.loads(data.decode("latin-1"), object_hook=self._decode)
+
+
+class DeferredComponent(NamedTuple):
+    """Eine per ``lazy=`` verzögerte Komponente, wie sie im Token steht."""
+
+    component: "Component"
+    args: List[Any]
+    kwargs: Dict[str, Any]
+    language: Optional[str]
+    cache: Any
+    namespace: str
+
+    def render(self, context: Context) -> str:
+        """Rendert die Komponente wie der ursprüngliche Tag, in dessen Sprache."""
+        with translation.override(self.language):
+            if self.cache:
+                return self.component.render_cached(
+                    self.args, self.kwargs, context, self.cache, self.namespace
+                )
+            return self.component.render_context(
+                self.component.get_context(*self.args, **self.kwargs), context
+            )
+
+
+def _deferred_key(reference: str) -> str:
+    return f"{KEY_PREFIX}:lazy:{reference}"
+
+
+def dump_deferred_component(payload: Dict[str, Any]) -> str:
+    """
+    Erzeugt das signierte Token einer verzögerten Komponente.
+
+    Kleine Payloads stehen vollständig im Token. Größere werden unter ihrem
+    Hash für ``LAZY_TIMEOUT`` Sekunden im Komponenten-Cache abgelegt; das
+    Token enthält dann nur diese Referenz und die URL bleibt kurz.
+
+    Raises:
+        TypeError: Wenn sich die Argumente nicht als JSON ablegen lassen
+    """
+    data = DeferredSerializer().dumps(payload)
+    if len(data) > LAZY_INLINE_LIMIT:
+        reference = hashlib.sha256(data).hexdigest()[:32]
+        get_component_cache().set(_deferred_key(reference), data, timeout=LAZY_TIMEOUT)
+        payload = {"ref": reference}
+    return signing.dumps(
+        payload, salt=LAZY_SALT, serializer=DeferredSerializer, compress=True
+    )
+
+
+def load_deferred_component(token: str) -> DeferredComponent:
+    """
+    Prüft und entpackt das Token einer verzögerten Komponente.
+
+    Raises:
+        signing.BadSignature: Wenn das Token verändert wurde
+        KeyError: Wenn die Komponente nicht (mehr) registriert ist oder die
+            abgelegten Argumente abgelaufen sind
+    """
+    data = signing.loads(token, salt=LAZY_SALT, serializer=DeferredSerializer)
+    if "ref" in data:
+        stored = get_component_cache().get(_deferred_key(data["ref"]))
+        if stored is None:
+            raise KeyError(data["ref"])
+        data = DeferredSerializer().loads(stored)
+    return DeferredComponent(
+        get_component(data["c"]),
+        data["a"],
+        data["k"],
+        data["l"],
+        data.get("cache"),
+        data.get("ns", CACHE_NAMESPACE),
+    )
+
+
+def prepare(value: Any, depth: int = PREPARE_DEPTH) -> Any:
+    """
+    Bereitet einen Kontextwert für das Rendern vor.
+
+    Einfache Dicts werden (bis ``depth`` Ebenen tief) zu :class:`Options`,
+    Listen mit Dicts werden elementweise vorbereitet. Andere Objekte bleiben
+    unverändert.
+    """
+    if depth <= 0:
+        return value
+    if type(value) is dict:
+        options = Options(value)
+        for key, item in value.items():
+            if isinstance(item, PREPARED_TYPES):
+                options[key] = prepare(item, depth - 1)
+        return options
+    if isinstance(value, (list, tuple)) and any(type(item) is dict for item in value):
+        return [prepare(item, depth - 1) for item in value]
+    return value
+
+
+class Component:
+    """
+    Eine Komponente: Kontext-Funktion plus Template.
+
+    Das Template wird pro Engine einmal geladen und danach direkt gerendert,
+    ohne Lookup über ``render_context``.
+
+    Args:
+        name: Der Tag-Name
+        template_name: Pfad des Komponenten-Templates
+        func: Funktion, die aus den Tag-Argumenten den Kontext erzeugt
+    """
+
+    def __init__(
+        self, name: str, template_name: str, func: Callable[..., Dict]
+    ) -> None:
+        self.name = name
+        self.template_name = template_name
+        self.func = func
+        self.spec = getfullargspec(unwrap(func))
+        # Parameter, die auch positional übergeben werden können
+        self.positional = tuple(self.spec.args)
+        self._templates: "WeakKeyDictionary[Engine, Template]" = WeakKeyDictionary()
+        # Zuletzt verwendete Engine und ihr Template; spart den Lookup im
+        # WeakKeyDictionary, der bei kleinen Templates ins Gewicht fällt
+        self._last: Tuple[Optional[Engine], Optional[Template]] = (None, None)
+        # Standardwerte als einfaches Dict, gültig für eine InsightConfig
+        self._defaults: Tuple[Optional[InsightConfig], Dict[str, Any]] = (None, {})
+        self._lock = threading.Lock()
+
+    def get_template(self, engine: Optional[Engine] = None) -> Template:
+        """Gibt das vorab geladene Template für eine Engine zurück."""
+        if engine is None:
+            engine = engines["django"].engine
+        last_engine, compiled = self._last
+        if last_engine is engine:
+            return compiled
+        compiled = self._templates.get(engine)
+        if compiled is None:
+            with self._lock:
+                compiled = self._templates.get(engine)
+                if compiled is None:
+                    compiled = engine.get_template(self.template_name)
+                    self._templates[engine] = compiled
+        self._last = (engine, compiled)
+        return compiled
+
+    def clear(self) -> None:
+        """Verwirft die geladenen Templates."""
+        with self._lock:
+            self._templates = WeakKeyDictionary()
+            self._last = (None, None)
+
+    def parameters(self) -> Tuple[str, ...]:
+        """Gibt die benannten Parameter der Kontext-Funktion zurück."""
+        return (*self.spec.args, *self.spec.kwonlyargs)
+
+    def arguments(
+        self, args: Tuple[Any, ...], kwargs: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Ergänzt die Argumente um die Standardwerte aus ``INSIGHT_UI``."""
+        config = get_config()
+        cached_config, defaults = self._defaults
+        if cached_config is not config:
+            # Kopie als dict: Entpacken eines MappingProxyType ist deutlich langsamer
+            defaults = dict(config.components.get(self.name, {}))
+            self._defaults = (config, defaults)
+        if not defaults:
+            return kwargs
+        merged = defaults.copy()
+        merged.update(kwargs)
+        if args:
+            for name in self.positional[: len(args)]:
+                merged.pop(name, None)
+        return merged
+
+    def get_context(self, *args: Any, **kwargs: Any) -> Dict[str, Any]:
+        """Erzeugt den flachen, vorbereiteten Kontext für das Template."""
+        values = self.func(*args, **self.arguments(args, kwargs))
+        # Die Funktion liefert ein neues Dict; es wird direkt vorbereitet
+        for key, value in values.items():
+            if isinstance(value, PREPARED_TYPES):
+                values[key] = prepare(value)
+        return values
+
+    def new_context(
+        self, context: Context, values: Optional[Dict[str, Any]] = None
+    ) -> Context:
+        """
+        Neuer Kontext für das Template; übernimmt wie Inclusion-Tags das CSRF-Token.
+
+        Entspricht ``context.new(values)``, wird aber direkt angelegt:
+        ``new()`` kopiert zusätzlich den Render-Kontext, den
+        ``Template.render`` ohnehin isoliert.
+        """
+        new_context = Context(
+            values,
+            autoescape=context.autoescape,
+            use_l10n=context.use_l10n,
+            use_tz=context.use_tz,
+        )
+        new_context.template = context.template
+        new_context.template_name = context.template_name
+        request = getattr(context, "request", None)
+        if request is not None:
+            new_context.request = request
+        csrf_token = context.get("csrf_token")
+        if csrf_token is not None:
+            new_context["csrf_token"] = csrf_token
+        return new_context
+
+    def template_for(self, context: Context) -> Template:
+        """Gibt das Template für die Engine des umgebenden Kontexts zurück."""
+        engine = context.template.engine if context.template is not None else None
+        return self.get_template(engine)
+
+    def render_context(self, values: Dict[str, Any], context: Context) -> str:
+        """Rendert vorbereitete Werte; ``context`` ist der umgebende Kontext."""
+        return self.template_for(context).render(self.new_context(context, values))
+
+    def render_cached(
+        self,
+        args: List[Any],
+        kwargs: Dict[str, Any],
+        context: Context,
+        cache: Any = True,
+        namespace: str = CACHE_NAMESPACE,
+    ) -> str:
+        """
+        Rendert die Komponente über den Komponenten-Cache.
+
+        Der Schlüssel enthält Tag-Name, aktive Sprache, ``theme``, den Stand
+        der Konfiguration und einen Hash der aufgelösten Argumente sowie die
+        Version des Namensraums
+        (siehe :func:`~insight_ui.cache.bump_component_namespace`). Lassen sich
+        die Argumente nicht eindeutig abbilden (z.B. QuerySets, Modelle oder
+        Generatoren, siehe :func:`~insight_ui.cache.arguments_digest`), wird
+        ungecacht gerendert.
+
+        Args:
+            args: Aufgelöste Positionsargumente des Tags
+            kwargs: Aufgelöste Schlüsselwortargumente des Tags
+            context: Der umgebende Kontext
+            cache: ``True`` (Timeout aus ``component_cache``) oder Sekunden
+            namespace: Namensraum für die Invalidierung
+        """
+        try:
+            digest = arguments_digest(args, kwargs)
+        except TypeError:
+            return self.render_context(self.get_context(*args, **kwargs), context)
+        key = fragment_cache_key(
+            namespace,
+            self.name,
+            translation.get_language(),
+            kwargs.get("theme") or component_defaults(self.name).get("theme", ""),
+            get_config().digest,
+            digest,
+            cache=get_component_cache(),
+        )
+
+        def render() -> str:
+            with context.push(csrf_token=CSRF_PLACEHOLDER):
+                return self.render_context(self.get_context(*args, **kwargs), context)
+
+        timeout = None if cache is True else int(cache)
+        return insert_csrf_token(
+            cached_component(key, render, timeout), context.get("csrf_token")
+        )
+
+    def render_deferred(
+        self,
+        args: List[Any],
+        kwargs: Dict[str, Any],
+        context: Context,
+        lazy: Any,
+        cache: Any = None,
+        namespace: str = CACHE_NAMESPACE,
+    ) -> str:
+        """
+        Rendert statt der Komponente einen Platzhalter, der sie per HTMX nachlädt.
+
+        Die aufgelösten Argumente werden signiert in die URL des Endpoints
+        ``component_render`` geschrieben, größere über eine Referenz in den
+        Komponenten-Cache (siehe :func:`dump_deferred_component`); gerendert
+        wird erst, wenn der Platzhalter sichtbar wird (``lazy=True``) bzw.
+        nach dem Laden der Seite (``lazy="load"``). Andere Strings werden als
+        ``hx-trigger`` übernommen. Lassen sich die Argumente nicht als JSON
+        ablegen, wird die Komponente sofort gerendert.
+        """
+        payload = {
+            "c": self.name,
+            "a": list(args),
+            "k": kwargs,
+            "l": translation.get_language(),
+        }
+        if cache:
+            payload["cache"] = cache
+            payload["ns"] = namespace
+        try:
+            token = dump_deferred_component(payload)
+        except TypeError as error:
+            logger.warning("lazy für %s nicht möglich: %s", self.name, error)
+            if cache:
+                return self.render_cached(args, kwargs, context, cache, namespace)
+            return self.render_context(self.get_context(*args, **kwargs), context)
+
+        placeholder = self.template_for(context).engine.get_template(LAZY_TEMPLATE)
+        return placeholder.render(
+            context.new(
+                {
+                    "url": reverse("component_render", args=[token]),
+                    "trigger": LAZY_TRIGGERS.get(lazy, lazy),
+                    "component": self.name,
+                }
+            )
+        )
+
+    def iter_render(
+        self, items: Iterable[Dict[str, Any]], context: Context, chunk_size: int
+    ) -> Iterator[str]:
+        """
+        Rendert die Komponente einmal pro Eintrag.
+
+        Template und Kontext werden für alle Einträge geteilt; pro Eintrag
+        wird nur dessen vorbereiteter Kontext auf den Stack gelegt.
+
+        Args:
+            items: Tag-Argumente je Eintrag als Dictionaries
+            context: Der umgebende Kontext
+            chunk_size: Anzahl der Einträge pro ausgegebenem Block
+
+        Yields:
+            HTML-Blöcke mit je bis zu ``chunk_size`` Einträgen
+        """
+        if chunk_size < 1:
+            raise ValueError("chunk_size muss mindestens 1 sein")
+        template_ = self.template_for(context)
+        new_context = self.new_context(context)
+        iterator = iter(items)
+        while chunk := list(islice(iterator, chunk_size)):
+            parts = []
+            for kwargs in chunk:
+                with new_context.push(self.get_context(**kwargs)):
+                    parts.append(template_.render(new_context))
+            yield "".join(parts)
+
+    def standalone_context(self) -> Context:
+        """Umgebender Kontext für das Rendern außerhalb eines Templates."""
+        template_ = self.get_template()
+        context = Context(autoescape=template_.engine.autoescape)
+        context.template = template_
+        return context
+
+    def render(self, *args: Any, **kwargs: Any) -> str:
+        """Rendert die Komponente außerhalb eines Templates (z.B. in Views)."""
+        return self.render_context(
+            self.get_context(*args, **kwargs), self.standalone_context()
+        )
+
+
+class Collection(Component):
+    """
+    Sammel-Variante einer Komponente, z.B. ``card_grid`` für ``card``.
+
+    Die Kontext-Funktion liefert den Kontext des Rahmen-Templates und zusätzlich
+    ``items`` (Tag-Argumente je Eintrag) sowie ``chunk_size``. Alle Einträge
+    werden in einem Durchlauf mit dem Template der Komponente gerendert.
+
+    Args:
+        name: Der Tag-Name
+        template_name: Pfad des Rahmen-Templates; es muss mit ``</div>`` enden
+        func: Funktion, die aus den Tag-Argumenten den Kontext erzeugt
+        item: Die Komponente der Einträge
+    """
+
+    def __init__(
+        self, name: str, template_name: str, func: Callable[..., Dict], item: Component
+    ) -> None:
+        super().__init__(name, template_name, func)
+        self.item = item
+
+    def get_context(self, *args: Any, **kwargs: Any) -> Dict[str, Any]:
+        values = self.func(*args, **self.arguments(args, kwargs))
+        items = values.pop("items")
+        context = {key: prepare(value) for key, value in values.items()}
+        # Einträge bleiben unverändert, damit Generatoren erst beim Rendern laufen
+        context["items"] = items
+        return context
+
+    def iter_chunks(self, values: Dict[str, Any], context: Context) -> Iterator[str]:
+        """
+        Rendert Rahmen und Einträge stückweise.
+
+        Yields:
+            Den öffnenden Rahmen, Blöcke mit je ``chunk_size`` Einträgen und
+            das schließende Markup
+        """
+        values = dict(values)
+        items = values.pop("items")
+        chunk_size = values.pop("chunk_size")
+        shell = super().render_context({**values, "items": ()}, context)
+        head, _, tail = shell.rpartition(COLLECTION_CLOSE)
+        yield head
+        yield from self.item.iter_render(items, context, chunk_size)
+        yield COLLECTION_CLOSE + tail
+
+    def render_context(self, values: Dict[str, Any], context: Context) -> str:
+        return "".join(self.iter_chunks(values, context))
+
+
+_components: Dict[str, Component] = {}
+
+
+def get_component(name: str) -> Component:
+    """
+    Gibt eine registrierte Komponente zurück.
+
+    Raises:
+        KeyError: Wenn keine Komponente mit diesem Namen registriert ist
+    """
+    return _components[name]
+
+
+def component_parameters() -> Dict[str, Tuple[str, ...]]:
+    """Gibt die Parameternamen aller registrierten Komponenten zurück."""
+    return {name: component.parameters() for name, component in _components.items()}
+
+
+def render_component(name: str, *args: Any, **kwargs: Any) -> str:
+    """Rendert eine registrierte Komponente mit den Argumenten ihres Tags."""
+    return get_component(name).render(*args, **kwargs)
+
+
+def iter_collection(name: str, *args: Any, **kwargs: Any) -> Iterator[str]:
+    """Rendert eine Sammel-Komponente stückweise außerhalb eines Templates."""
+    collection = get_component(name)
+    if not isinstance(collection, Collection):
+        raise TypeError(f"{name} ist keine Sammel-Komponente")
+    return collection.iter_chunks(
+        collection.get_context(*args, **kwargs), collection.standalone_context()
+    )
+
+
+def stream_collection(name: str, *args: Any, **kwargs: Any) -> StreamingHttpResponse:
+    """
+    Gibt eine Sammel-Komponente als ``StreamingHttpResponse`` zurück.
+
+    Wie bei ``stream_table`` werden nie mehr als ``chunk_size`` Einträge
+    gleichzeitig gerendert, und die aktive Sprache wird festgehalten.
+    """
+    language = translation.get_language()
+
+    def content() -> Iterator[str]:
+        with translation.override(language):
+            yield from iter_collection(name, *args, **kwargs)
+
+    response = StreamingHttpResponse(
+        content(), content_type="text/html; charset=utf-8"
+    )
+    response["X-Accel-Buffering"] = "no"
+    return response
+
+
+def clear_component_templates() -> None:
+    """Verwirft die geladenen Templates aller Komponenten."""
+    for component in _components.values():
+        component.clear()
+
+
+@receiver(file_changed, dispatch_uid="insight_ui_components_file_changed")
+def component_template_changed(sender: Any, file_path: Any, **kwargs: Any) -> None:
+    """Lädt Templates nach Änderungen im Entwicklungsserver neu."""
+    if str(file_path).endswith(".html"):
+        clear_component_templates()
+
+
+class ComponentNode(TagHelperNode):
+    """Template-Node einer Komponente (ersetzt ``InclusionNode``)."""
+
+    def __init__(
+        self,
+        component: Component,
+        args: List[Any],
+        kwargs: Dict[str, Any],
+    ) -> None:
+        super().__init__(component.func, False, args, kwargs)
+        self.component = component
+        self.controlled = not CONTROL_ARGUMENTS.isdisjoint(kwargs)
+
+    def render(self, context: Context) -> str:
+        resolved_args, resolved_kwargs = self.get_resolved_arguments(context)
+        if not self.controlled:
+            values = self.component.get_context(*resolved_args, **resolved_kwargs)
+            return self.component.render_context(values, context)
+        # ``lazy``, ``cache`` und ``cache_namespace`` steuern das Rendern
+        # und gehen nicht an die Komponente
+        lazy = resolved_kwargs.pop("lazy", None)
+        cache = resolved_kwargs.pop("cache", None)
+        namespace = resolved_kwargs.pop("cache_namespace", CACHE_NAMESPACE)
+        if lazy:
+            return self.component.render_deferred(
+                resolved_args, resolved_kwargs, context, lazy, cache, namespace
+            )
+        if cache:
+            return self.component.render_cached(
+                resolved_args, resolved_kwargs, context, cache, namespace
+            )
+        values = self.component.get_context(*resolved_args, **resolved_kwargs)
+        return self.component.render_context(values, context)
+
+
+class ComponentLibrary(template.Library):
+    """Template-Bibliothek mit :meth:`component` als Ersatz für ``inclusion_tag``."""
+
+    def component(
+        self, template_name: str, name: Optional[str] = None
+    ) -> Callable[[Callable[..., Dict]], Callable[..., Dict]]:
+        """
+        Registriert eine Kontext-Funktion als Komponenten-Tag.
+
+        Die Argumente werden wie bei ``inclusion_tag`` beim Kompilieren des
+        Templates geprüft; die Funktion selbst bleibt unverändert aufrufbar.
+
+        Args:
+            template_name: Pfad des Komponenten-Templates
+            name: Tag-Name (Standard: Name der Funktion)
+        """
+
+        def dec(func: Callable[..., Dict]) -> Callable[..., Dict]:
+            self._register(Component(name or func.__name__, template_name, func))
+            return func
+
+        return dec
+
+    def collection(
+        self, item: str, template_name: str, name: Optional[str] = None
+    ) -> Callable[[Callable[..., Dict]], Callable[..., Dict]]:
+        """
+        Registriert eine Kontext-Funktion als Sammel-Tag einer Komponente.
+
+        Args:
+            item: Name der Komponente, die pro Eintrag gerendert wird
+            template_name: Pfad des Rahmen-Templates
+            name: Tag-Name (Standard: Name der Funktion)
+        """
+
+        def dec(func: Callable[..., Dict]) -> Callable[..., Dict]:
+            self._register(
+                Collection(
+                    name or func.__name__, template_name, func, get_component(item)
+                )
+            )
+            return func
+
+        return dec
+
+    def _register(self, component: Component) -> None:
+        spec: Tuple[Any, ...] = tuple(component.spec)[:6]
+        _components[component.name] = component
+
+        @wraps(component.func)
+        def compile_func(parser: Any, token: Any) -> ComponentNode:
+            bits = token.split_contents()[1:]
+            args, kwargs = parse_bits(parser, bits, *spec, False, component.name)
+            return ComponentNode(component, args, kwargs)
+
+        self.tag(component.name, compile_func)
+        component.func.component = component
@@ -0,0 +1,395 @@
+"""Zugriff auf die ``INSIGHT_UI``-Einstellungen."""
+
+import hashlib
+import json
+import threading
+from types import MappingProxyType
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+from django.conf import settings
+from django.conf.locale import LANG_INFO
+from django.core import checks
+from django.core.exceptions import ImproperlyConfigured
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+
+THEMES = ("light", "dark", "high-contrast")
+
+BRANDING_DEFAULTS: Dict[str, Any] = {
+    "name": "",
+    "logo": None,
+}
+
+FEATURE_DEFAULTS: Dict[str, bool] = {
+    "theme_toggle": True,
+    "language_selector": True,
+}
+
+FRAGMENT_CACHE_DEFAULTS: Dict[str, Any] = {
+    "alias": "default",
+    "timeout": 300,
+    "version": 1,
+}
+
+COMPONENT_CACHE_DEFAULTS: Dict[str, Any] = {
+    "alias": "default",
+    "timeout": 300,
+}
+
+PIPELINE_DEFAULTS: Dict[str, Any] = {
+    "workers": 4,
+    "max_queue": 1000,
+    "max_results": 10000,
+}
+
+HUB_DEFAULTS: Dict[str, Any] = {
+    "interval": 1.0,
+    "keepalive": 15.0,
+}
+
+FEED_DEFAULTS: Dict[str, Any] = {"interval": 5.0}
+
+EVENT_LOGGING_DEFAULTS: Dict[str, Any] = {
+    "stdout": True,
+    "batch_size": 100,
+    "flush_interval": 1.0,
+    "max_queue": 10000,
+}
+
+EMPTY: Mapping[str, Any] = MappingProxyType({})
+
+
+def _is_int(value: Any) -> bool:
+    return isinstance(value, int) and not isinstance(value, bool)
+
+
+def _positive_int(value: Any) -> bool:
+    return _is_int(value) and value > 0
+
+
+def _positive_number(value: Any) -> bool:
+    return (_is_int(value) or isinstance(value, float)) and value > 0
+
+
+def _timeout(value: Any) -> bool:
+    return value is None or (_is_int(value) and value >= 0)
+
+
+def _boolean(value: Any) -> bool:
+    return isinstance(value, bool)
+
+
+Check = Tuple[Callable[[Any], bool], str]
+
+POSITIVE_INT: Check = (_positive_int, "eine positive Ganzzahl")
+POSITIVE_NUMBER: Check = (_positive_number, "eine positive Zahl")
+TIMEOUT: Check = (_timeout, "None oder eine Ganzzahl >= 0")
+
+# Abschnitte aus ``INSIGHT_UI`` mit Standardwerten und Prüfung je Schlüssel
+SECTIONS: Dict[str, Tuple[Dict[str, Any], Dict[str, Check]]] = {
+    "fragment_cache": (
+        FRAGMENT_CACHE_DEFAULTS,
+        {"timeout": TIMEOUT, "version": (_is_int, "eine Ganzzahl")},
+    ),
+    "component_cache": (COMPONENT_CACHE_DEFAULTS, {"timeout": TIMEOUT}),
+    "submission_pipeline": (
+        PIPELINE_DEFAULTS,
+        {
+            "workers": POSITIVE_INT,
+            "max_queue": POSITIVE_INT,
+            "max_results": POSITIVE_INT,
+        },
+    ),
+    "live_hub": (
+        HUB_DEFAULTS,
+        {"interval": POSITIVE_NUMBER, "keepalive": POSITIVE_NUMBER},
+    ),
+    "websocket_feed": (FEED_DEFAULTS, {"interval": POSITIVE_NUMBER}),
+    "event_logging": (
+        EVENT_LOGGING_DEFAULTS,
+        {
+            "stdout": (_boolean, "True oder False"),
+            "batch_size": POSITIVE_INT,
+            "flush_interval": POSITIVE_NUMBER,
+            "max_queue": POSITIVE_INT,
+        },
+    ),
+}
+
+# Alle bekannten Schlüssel in ``INSIGHT_UI``
+SETTINGS = frozenset(
+    {"theme", "branding", "features", "components", "render_pool_size", *SECTIONS}
+)
+
+# Früher dokumentierte Schlüssel; sie werden ignoriert statt abgelehnt
+RETIRED = frozenset(
+    {
+        "branding.favicon",
+        "features.skip_links",
+        "components.navbar.fixed",
+        "components.navbar.container_class",
+        "components.alert.auto_dismiss",
+    }
+)
+
+
+class InsightConfig(NamedTuple):
+    """
+    Aufgelöste, unveränderliche Konfiguration der Komponenten.
+
+    ``components`` enthält pro Tag die Standardwerte seiner Parameter, z.B.
+    ``theme`` aus ``INSIGHT_UI["theme"]`` oder ``available_languages`` aus
+    ``settings.LANGUAGES``. Die übrigen Felder sind die geprüften, um ihre
+    Standardwerte ergänzten Abschnitte aus ``INSIGHT_UI``. ``ignored`` nennt
+    unbekannte Schlüssel, die übergangen wurden. ``digest`` ändert sich mit
+    der Konfiguration und geht in die Schlüssel des Komponenten-Caches ein.
+    """
+
+    theme: str
+    branding: Mapping[str, Any]
+    features: Mapping[str, bool]
+    languages: Tuple[Mapping[str, str], ...]
+    components: Mapping[str, Mapping[str, Any]]
+    fragment_cache: Mapping[str, Any]
+    component_cache: Mapping[str, Any]
+    render_pool_size: Optional[int]
+    submission_pipeline: Mapping[str, Any]
+    live_hub: Mapping[str, Any]
+    websocket_feed: Mapping[str, Any]
+    event_logging: Mapping[str, Any]
+    ignored: Tuple[str, ...]
+    digest: str
+
+
+def _require(condition: bool, message: str) -> None:
+    if not condition:
+        raise ImproperlyConfigured(f"INSIGHT_UI: {message}")
+
+
+def _section(
+    raw: Mapping[str, Any],
+    name: str,
+    defaults: Dict[str, Any],
+    ignored: List[str],
+) -> Dict[str, Any]:
+    value = raw.get(name, {})
+    _require(isinstance(value, dict), f"'{name}' muss ein Dict sein")
+    known = {key: item for key, item in value.items() if key in defaults}
+    ignored.extend(f"{name}.{key}" for key in value if key not in defaults)
+    return {**defaults, **known}
+
+
+def resolve_languages(languages: Sequence[Any]) -> Tuple[Mapping[str, str], ...]:
+    """
+    Wandelt ``settings.LANGUAGES`` in die Sprachliste des Sprachauswählers um.
+
+    ``name`` ist der englische Name aus Djangos ``LANG_INFO``, ``native`` der
+    in den Settings angegebene Name.
+    """
+    resolved = []
+    for entry in languages:
+        if (
+            not isinstance(entry, (list, tuple))
+            or len(entry) != 2
+            or not isinstance(entry[0], str)
+        ):
+            raise ImproperlyConfigured(
+                f"LANGUAGES: Einträge müssen (Code, Name)-Paare sein, nicht {entry!r}"
+            )
+        code, native = entry[0], str(entry[1])
+        name = LANG_INFO.get(code, {}).get("name", native)
+        resolved.append(
+            MappingProxyType({"code": code, "name": name, "native": native})
+        )
+    return tuple(resolved)
+
+
+def build_config(parameters: Mapping[str, Sequence[str]]) -> InsightConfig:
+    """
+    Prüft ``INSIGHT_UI`` und ``LANGUAGES`` und löst sie in Standardwerte auf.
+
+    Standardwerte werden an gleichnamige Tag-Parameter vergeben; Einträge in
+    ``INSIGHT_UI["components"]`` überschreiben sie pro Tag. Unbekannte
+    Schlüssel werden übergangen und von :func:`check_settings` gemeldet.
+
+    Args:
+        parameters: Parameternamen je registriertem Tag
+
+    Raises:
+        ImproperlyConfigured: Bei ungültigen Werten
+    """
+    raw = getattr(settings, "INSIGHT_UI", {})
+    _require(isinstance(raw, dict), "muss ein Dict sein")
+    ignored = [key for key in raw if key not in SETTINGS]
+
+    theme = raw.get("theme", THEMES[0])
+    _require(
+        theme in THEMES,
+        f"'theme' muss einer von {', '.join(THEMES)} sein, nicht {theme!r}",
+    )
+
+    branding = _section(raw, "branding", BRANDING_DEFAULTS, ignored)
+    _require(isinstance(branding["name"], str), "'branding.name' muss ein String sein")
+    _require(
+        branding["logo"] is None or isinstance(branding["logo"], str),
+        "'branding.logo' muss ein String oder None sein",
+    )
+
+    features = _section(raw, "features", FEATURE_DEFAULTS, ignored)
+    for name, enabled in features.items():
+        _require(
+            isinstance(enabled, bool), f"'features.{name}' muss True oder False sein"
+        )
+
+    sections = {}
+    for section, (defaults, checks) in SECTIONS.items():
+        value = _section(raw, section, defaults, ignored)
+        for key, (valid, expected) in checks.items():
+            _require(
+                valid(value[key]),
+                f"'{section}.{key}' muss {expected} sein, nicht {value[key]!r}",
+            )
+        if "alias" in value:
+            _require(
+                value["alias"] in settings.CACHES,
+                f"'{section}.alias' {value['alias']!r} fehlt in CACHES",
+            )
+        sections[section] = MappingProxyType(value)
+
+    render_pool_size = raw.get("render_pool_size")
+    _require(
+        render_pool_size is None or _positive_int(render_pool_size),
+        "'render_pool_size' muss None oder eine positive Ganzzahl sein",
+    )
+
+    languages = resolve_languages(settings.LANGUAGES)
+
+    # Einstellung -> gleichnamiger Tag-Parameter
+    values: Dict[str, Any] = {
+        "theme": theme,
+        "brand": branding["name"],
+        "brand_logo": branding["logo"],
+        "show_theme_toggle": features["theme_toggle"],
+        "show_language_selector": features["language_selector"],
+        "available_languages": languages,
+    }
+
+    raw_overrides = raw.get("components", {})
+    _require(isinstance(raw_overrides, dict), "'components' muss ein Dict sein")
+    overrides: Dict[str, Dict[str, Any]] = {}
+    for name, override in raw_overrides.items():
+        _require(
+            isinstance(override, dict), f"'components.{name}' muss ein Dict sein"
+        )
+        if name not in parameters:
+            ignored.append(f"components.{name}")
+            continue
+        overrides[name] = {}
+        for key, value in override.items():
+            if key in parameters[name]:
+                overrides[name][key] = value
+            else:
+                ignored.append(f"components.{name}.{key}")
+        if "theme" in overrides[name]:
+            _require(
+                override["theme"] in THEMES, f"'components.{name}.theme' ist ungültig"
+            )
+
+    components = {}
+    for name, names in parameters.items():
+        defaults = {key: values[key] for key in names if key in values}
+        defaults.update(overrides.get(name, {}))
+        components[name] = MappingProxyType(defaults)
+
+    encoded = json.dumps(
+        [raw, settings.LANGUAGES], sort_keys=True, default=str
+    ).encode("utf-8")
+    return InsightConfig(
+        theme=theme,
+        branding=MappingProxyType(branding),
+        features=MappingProxyType(features),
+        languages=languages,
+        components=MappingProxyType(components),
+        render_pool_size=render_pool_size,
+        ignored=tuple(ignored),
+        digest=hashlib.sha256(encoded).hexdigest()[:12],
+        **sections,
+    )
+
+
+_config: Optional[InsightConfig] = None
+_config_lock = threading.Lock()
+
+
+def configure() -> InsightConfig:
+    """Löst die Konfiguration für alle registrierten Komponenten (neu) auf."""
+    global _config
+    from .components import component_parameters
+
+    with _config_lock:
+        _config = build_config(component_parameters())
+    return _config
+
+
+def get_config() -> InsightConfig:
+    """
+    Gibt die aufgelöste Konfiguration zurück.
+
+    Sie wird in ``InsightUiConfig.ready()`` angelegt; danach ist der Zugriff
+    ein einfacher Attribut-Lookup.
+    """
+    config = _config
+    if config is None:
+        config = configure()
+    return config
+
+
+def check_settings(app_configs: Any = None, **kwargs: Any) -> List[checks.CheckMessage]:
+    """
+    Systemcheck: Meldet übergangene Schlüssel in ``INSIGHT_UI`` als Warnung.
+
+    Früher dokumentierte Schlüssel (``RETIRED``) erhalten ``insight_ui.W001``,
+    alle übrigen unbekannten Schlüssel – meist Tippfehler – ``insight_ui.W002``.
+    """
+    messages: List[checks.CheckMessage] = []
+    for key in get_config().ignored:
+        if key in RETIRED:
+            messages.append(
+                checks.Warning(
+                    f"INSIGHT_UI: '{key}' wird nicht mehr unterstützt und ignoriert.",
+                    hint="Den Eintrag aus INSIGHT_UI entfernen.",
+                    id="insight_ui.W001",
+                )
+            )
+        else:
+            messages.append(
+                checks.Warning(
+                    f"INSIGHT_UI: Unbekannter Schlüssel '{key}' wird ignoriert.",
+                    hint="Auf Tippfehler prüfen; siehe docs/api-reference.md.",
+                    id="insight_ui.W002",
+                )
+            )
+    return messages
+
+
+def component_defaults(name: str) -> Mapping[str, Any]:
+    """Gibt die Standardwerte der Parameter eines Tags zurück."""
+    return get_config().components.get(name, EMPTY)
+
+
+@receiver(setting_changed, dispatch_uid="insight_ui_config_setting_changed")
+def config_setting_changed(sender: Any, setting: str, **kwargs: Any) -> None:
+    """Löst die Konfiguration neu auf, wenn sich ihre Settings ändern."""
+    global _config
+    if setting in ("INSIGHT_UI", "LANGUAGES", "CACHES"):
+        _config = None
@@ -0,0 +1,252 @@
+"""Kontext-Provider für wiederverwendbare, sprachabhängige Template-Daten."""
+
+import threading
+from types import MappingProxyType
+from typing import Any, Callable, Dict, List, Mapping
+
+from django.core.signals import setting_changed
+from django.dispatch import Signal, receiver
+from django.utils.autoreload import file_changed
+from django.utils.safestring import mark_safe
+from django.utils.translation import get_language
+from django.utils.translation import gettext as _
+
+_providers: List["ContextProvider"] = []
+
+# Wird gesendet, nachdem übersetzte Kontexte verworfen wurden
+translations_reloaded = Signal()
+
+# Einstellungen, deren Änderung die übersetzten Kontexte ungültig macht
+TRANSLATION_SETTINGS = frozenset({"LANGUAGES", "LANGUAGE_CODE", "LOCALE_PATHS"})
+
+
+def freeze(value: Any) -> Any:
+    """
+    Wandelt verschachtelte Dicts und Listen in schreibgeschützte Strukturen um.
+
+    Dicts werden zu ``MappingProxyType``, Listen zu Tupeln. Alle anderen
+    Werte (inklusive ``SafeString``) werden unverändert übernommen.
+    """
+    if isinstance(value, dict):
+        return MappingProxyType({key: freeze(item) for key, item in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze(item) for item in value)
+    return value
+
+
+class ContextProvider:
+    """
+    Baut einen Kontext einmal pro aktiver Sprache und hält ihn schreibgeschützt vor.
+
+    Der Builder wird beim ersten Zugriff in einer Sprache aufgerufen; danach
+    liefert der Provider dieselbe eingefrorene Struktur. Über :meth:`copy`
+    entsteht ein flaches ``dict``, in dem einzelne Schlüssel pro Request
+    überschrieben werden können, ohne den Cache zu verändern.
+    """
+
+    def __init__(self, builder: Callable[[], Dict[str, Any]]) -> None:
+        self._builder = builder
+        self._cache: Dict[str, Mapping[str, Any]] = {}
+        self._lock = threading.Lock()
+        _providers.append(self)
+
+    def get(self) -> Mapping[str, Any]:
+        """Gibt den eingefrorenen Kontext für die aktive Sprache zurück."""
+        language = get_language() or ""
+        try:
+            return self._cache[language]
+        except KeyError:
+            pass
+        with self._lock:
+            if language not in self._cache:
+                self._cache[language] = freeze(self._builder())
+            return self._cache[language]
+
+    def copy(self) -> Dict[str, Any]:
+        """Gibt eine flache, veränderbare Kopie des Kontexts zurück."""
+        return dict(self.get())
+
+    def clear(self) -> None:
+        """Verwirft alle zwischengespeicherten Sprachvarianten."""
+        with self._lock:
+            self._cache.clear()
+
+
+def clear_context_caches() -> None:
+    """Leert die Caches aller registrierten Kontext-Provider."""
+    for provider in _providers:
+        provider.clear()
+
+
+@receiver(file_changed, dispatch_uid="insight_ui_translation_file_changed")
+def translation_file_changed(sender: Any, file_path: Any, **kwargs: Any) -> None:
+    """Invalidiert die Kontexte, wenn der Autoreloader eine .mo-Datei meldet."""
+    if file_path.suffix == ".mo":
+        clear_context_caches()
+        translations_reloaded.send(sender=ContextProvider)
+
+
+@receiver(setting_changed, dispatch_uid="insight_ui_translation_setting_changed")
+def translation_setting_changed(sender: Any, setting: str, **kwargs: Any) -> None:
+    """Invalidiert die Kontexte bei Änderungen an Sprach-Einstellungen."""
+    if setting in TRANSLATION_SETTINGS:
+        clear_context_caches()
+        translations_reloaded.send(sender=ContextProvider)
+
+
+def build_storybook_context() -> Dict[str, Any]:
+    """Baut die Beispieldaten für die Storybook- bzw. Index-Seite."""
+    card_actions = [
+        {"text": _("Mehr erfahren"), "url": "#", "type": "primary"},
+        {"text": _("Teilen"), "url": "#", "type": "secondary"},
+    ]
+    return {
+        "nav_links": [
+            {"text": _("Startseite"), "url": "/", "active": True},
+            {"text": _("Storybook"), "url": "/components/", "active": False},
+            {"text": _("Dokumentation"), "url": "/docs/", "active": False},
+        ],
+        "breadcrumb_items": [
+            {"text": _("Startseite"), "url": "/"},
+            {"text": _("Demo"), "url": "/demo/"},
+            {"text": _("Komponenten"), "url": None, "active": True},
+        ],
+        "table_headers": [_("Name"), _("E-Mail"), _("Status"), _("Aktionen")],
+        "table_rows": [
+            [
+                "Max Mustermann",
+                "max@example.com",
+                _("Aktiv"),
+                mark_safe('<button class="btn btn-sm">Bearbeiten</button>'),
+            ],
+            [
+                "Anna Schmidt",
+                "anna@example.com",
+                _("Inaktiv"),
+                mark_safe('<button class="btn btn-sm">Bearbeiten</button>'),
+            ],
+            [
+                "Tom Weber",
+                "tom@example.com",
+                _("Aktiv"),
+                mark_safe('<button class="btn btn-sm">Bearbeiten</button>'),
+            ],
+        ],
+        "card_actions": card_actions,
+        "demo_cards": [
+            {
+                "title": "Beispiel-Karte",
+                "subtitle": "Untertitel",
+                "content": "Dies ist der Inhalt einer Karte.",
+            },
+            {
+                "title": "Karte mit Aktionen",
+                "content": "Diese Karte hat Aktions-Buttons.",
+                "actions": card_actions,
+            },
+        ],
+        "demo_alerts": [
+            {"message": "Dies ist eine Informationsmeldung", "type": "info"},
+            {"message": "Erfolgreich gespeichert!", "type": "success"},
+            {"message": "Achtung: Überprüfen Sie Ihre Eingaben", "type": "warning"},
+            {"message": "Fehler beim Laden der Daten", "type": "error"},
+        ],
+        "form_fields": [
+            {
+                "type": "text",
+                "name": "name",
+                "label": _("Name"),
+                "placeholder": _("Ihr vollständiger Name"),
+                "required": True,
+            },
+            {
+                "type": "email",
+                "name": "email",
+                "label": _("E-Mail"),
+                "placeholder": _("ihre.email@example.com"),
+                "required": True,
+            },
+            {
+                "type": "textarea",
+                "name": "message",
+                "label": _("Nachricht"),
+                "placeholder": _("Ihre Nachricht..."),
+                "rows": 4,
+            },
+        ],
+        "form_actions": [
+            {"text": _("Absenden"), "type": "submit", "style": "primary"},
+            {"text": _("Zurücksetzen"), "type": "reset", "style": "secondary"},
+        ],
+        "modal_actions": [
+            {"text": _("Speichern"), "type": "primary"},
+            {"text": _("Abbrechen"), "type": "cancel", "dismiss": True},
+        ],
+        "confirm_modal_actions": [
+            {
+                "text": _("Ja, fortfahren"),
+                "type": "primary",
+                "onclick": 'alert("Aktion bestätigt!")',
+            },
+            {"text": _("Abbrechen"), "type": "cancel", "dismiss": True},
+        ],
+        "right_sidebar_items": [
+            {"text": _("Benachrichtigungen"), "icon": "🔔", "badge": "3"},
+            {"text": _("Nachrichten"), "icon": "💬", "badge": "12"},
+            {"text": _("Aufgaben"), "icon": "✅", "badge": "5"},
+            {"text": _("Kalender"), "icon": "📅"},
+            {"text": _("Einstellungen"), "icon": "⚙️"},
+            {"text": _("Profil"), "icon": "👤"},
+        ],
+        "sidebar_items": [
+            {"text": _("Dashboard"), "url": "/", "icon": "📊"},
+            {"text": _("Benutzer"), "url": "/users/", "icon": "👥"},
+            {"text": _("Einstellungen"), "url": "/settings/", "icon": "⚙️"},
+            {"text": _("Hilfe"), "url": "/help/", "icon": "❓"},
+        ],
+        "scroll_items": [
+            {"title": f"Element {i}", "content": f"Inhalt für Element {i}"}
+            for i in range(1, 11)
+        ],
+        "htmx_form_fields": [
+            {
+                "type": "text",
+                "name": "htmx_name",
+                "label": _("Name (HTMX)"),
+                "placeholder": _("Name eingeben"),
+                "required": True,
+            },
+            {
+                "type": "email",
+                "name": "htmx_email",
+                "label": _("E-Mail (HTMX)"),
+                "placeholder": _("E-Mail eingeben"),
+                "required": True,
+            },
+            {
+                "type": "textarea",
+                "name": "message",
+                "label": _("Nachricht (HTMX)"),
+                "placeholder": _("Ihre Nachricht..."),
+                "rows": 4,
+                "required": False,
+            },
+        ],
+        "htmx_config": {
+            "url": "/api/form-submit/",
+            "method": "post",
+            "target": "#form-result",
+            "swap": "innerHTML",
+        },
+        "available_languages": [
+            {"code": "de", "name": "Deutsch"},
+            {"code": "en", "name": "English"},
+            {"code": "es", "name": "Español"},
+            {"code": "fr", "name": "Français"},
+            {"code": "ar", "name": "العربية"},
+            {"code": "zh", "name": "中文"},
+        ],
+    }
+
+
+storybook_context = ContextProvider(build_storybook_context)
@@ -0,0 +1,219 @@
+"""Strukturierte, gebündelte Ereignis-Protokollierung abseits des Request-Threads."""
+
+import atexit
+import json
+import logging
+import queue
+import sys
+import threading
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
+from typing import IO, Any, List, Mapping, Optional
+
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+
+from .conf import get_config
+
+EVENT_LOGGER_NAME = "insight_ui.events"
+
+_listener: Optional[QueueListener] = None
+_listener_lock = threading.Lock()
+
+
+class JsonEventFormatter(logging.Formatter):
+    """Formatiert ein Ereignis als kompakte JSON-Zeile."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        event = getattr(record, "event", None) or {"message": record.getMessage()}
+        return json.dumps(
+            {"level": record.levelname, **event},
+            ensure_ascii=False,
+            separators=(",", ":"),
+            default=str,
+        )
+
+
+class BatchingStreamHandler(logging.Handler):
+    """
+    Sammelt formatierte Ereignisse und schreibt sie gebündelt in einen Stream.
+
+    Geschrieben wird, sobald ``batch_size`` Einträge vorliegen, spätestens
+    aber nach ``flush_interval`` Sekunden.
+    """
+
+    def __init__(
+        self,
+        stream: Optional[IO[str]] = None,
+        batch_size: int = 100,
+        flush_interval: float = 1.0,
+    ) -> None:
+        super().__init__()
+        self._stream = stream
+        self.batch_size = batch_size
+        self._buffer: List[str] = []
+        self._stopped = threading.Event()
+        self._flusher = threading.Thread(
+            target=self._flush_periodically,
+            args=(flush_interval,),
+            name="insight-ui-event-flush",
+            daemon=True,
+        )
+        self._flusher.start()
+
+    @property
+    def stream(self) -> IO[str]:
+        # sys.stdout erst beim Schreiben auflösen (kann umgeleitet werden)
+        return self._stream or sys.stdout
+
+    def _flush_periodically(self, interval: float) -> None:
+        while not self._stopped.wait(interval):
+            self.flush()
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            self._buffer.append(self.format(record))
+            if len(self._buffer) >= self.batch_size:
+                self.flush()
+        except Exception:
+            self.handleError(record)
+
+    def flush(self) -> None:
+        self.acquire()
+        try:
+            if self._buffer:
+                self.stream.write("\n".join(self._buffer) + "\n")
+                self.stream.flush()
+                self._buffer.clear()
+        finally:
+            self.release()
+
+    def close(self) -> None:
+        self._stopped.set()
+        self.flush()
+        super().close()
+
+
+class ForwardingHandler(logging.Handler):
+    """Reicht Ereignisse an die Handler des übergeordneten Loggers weiter."""
+
+    def __init__(self, logger_name: str) -> None:
+        super().__init__()
+        self.logger_name = logger_name
+
+    def emit(self, record: logging.LogRecord) -> None:
+        logging.getLogger(self.logger_name).callHandlers(record)
+
+
+def event_logging_settings() -> Mapping[str, Any]:
+    """Gibt die Einstellungen aus ``INSIGHT_UI["event_logging"]`` zurück."""
+    return get_config().event_logging
+
+
+def get_event_logger() -> logging.Logger:
+    """
+    Gibt den Ereignis-Logger zurück und startet bei Bedarf den Listener.
+
+    Der Logger schreibt nur in eine Queue. Ein ``QueueListener`` verarbeitet
+    die Einträge in einem eigenen Thread: gebündelt nach stdout (abschaltbar
+    über ``INSIGHT_UI["event_logging"]["stdout"]``) und an die in ``LOGGING``
+    für ``insight_ui`` konfigurierten Handler.
+    """
+    global _listener
+    logger = logging.getLogger(EVENT_LOGGER_NAME)
+    if _listener is None:
+        with _listener_lock:
+            if _listener is None:
+                config = event_logging_settings()
+                records: "queue.Queue[logging.LogRecord]" = queue.Queue(
+                    config["max_queue"]
+                )
+                handlers: List[logging.Handler] = [ForwardingHandler("insight_ui")]
+                if config["stdout"]:
+                    batching = BatchingStreamHandler(
+                        batch_size=config["batch_size"],
+                        flush_interval=config["flush_interval"],
+                    )
+                    batching.setFormatter(JsonEventFormatter())
+                    handlers.append(batching)
+                logger.handlers = [_DroppingQueueHandler(records)]
+                logger.propagate = False
+                logger.setLevel(logging.INFO)
+                _listener = QueueListener(records, *handlers)
+                _listener.start()
+                atexit.register(stop_event_listener)
+    return logger
+
+
+class _DroppingQueueHandler(QueueHandler):
+    """QueueHandler, der bei voller Queue verwirft statt zu blockieren."""
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            pass
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Das Ereignis ist bereits strukturiert; kein teures Vorformatieren
+        return record
+
+
+def stop_event_listener() -> None:
+    """Stoppt den Listener und schreibt ausstehende Ereignisse."""
+    global _listener
+    with _listener_lock:
+        listener, _listener = _listener, None
+    if listener is not None:
+        listener.stop()
+        for handler in listener.handlers:
+            handler.close()
+
+
+@receiver(setting_changed, dispatch_uid="insight_ui_event_logging_setting_changed")
+def event_logging_setting_changed(sender: Any, setting: str, **kwargs: Any) -> None:
+    """Startet den Listener neu, wenn sich ``INSIGHT_UI`` ändert."""
+    if setting == "INSIGHT_UI":
+        stop_event_listener()
+
+
+def log_event(event: str, **fields: Any) -> None:
+    """Protokolliert ein strukturiertes Ereignis, ohne den Aufrufer zu blockieren."""
+    payload = {
+        "event": event,
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        **fields,
+    }
+    get_event_logger().info(event, extra={"event": payload})
+
+
+def log_submission_event(
+    source: str,
+    name: str,
+    email: str,
+    message: str,
+    errors: Optional[Mapping[str, Any]] = None,
+) -> None:
+    """
+    Protokolliert genau ein Ereignis pro Formular-Übermittlung.
+
+    Es werden nur Metadaten erfasst (Längen, E-Mail-Domain), keine Inhalte.
+
+    Args:
+        source: Herkunft der Übermittlung ('htmx', 'normal')
+        name: Name des Benutzers
+        email: E-Mail-Adresse des Benutzers
+        message: Nachricht des Benutzers
+        errors: Validierungsfehler, falls vorhanden
+    """
+    domain = email.rpartition("@")[2] if "@" in email else None
+    log_event(
+        "form_submission",
+        source=source,
+        valid=not errors,
+        errors=sorted(errors) if errors else [],
+        name_length=len(name),
+        email_length=len(email),
+        email_domain=domain or None,
+        message_length=len(message),
+    )
@@ -0,0 +1,158 @@
+"""Versionierte Datenquellen für Live-Updates."""
+
+import time
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+from asgiref.sync import sync_to_async
+from django.template.loader import render_to_string
+from django.utils.http import quote_etag
+from django.utils.translation import get_language
+from django.utils.translation import gettext as _
+
+from .cache import (
+    RenderedFragment,
+    cached_fragment,
+    fragment_cache_key,
+    get_cached_fragment,
+)
+from .rendering import run_in_render_pool
+
+LIVE_TEMPLATE = "insight_ui/components/live_content_partial.html"
+LIVE_VERSION_HEADER = "X-Live-Version"
+
+
+class LiveDataProvider:
+    """
+    Basisklasse für Live-Datenquellen.
+
+    ``version()`` wird bei jedem Poll aufgerufen und muss günstig sein
+    (Zeitstempel, Zähler, ``MAX(updated_at)``). ``get_data()`` wird nur
+    aufgerufen, wenn für eine Version noch kein Fragment im Cache liegt.
+
+    Args:
+        name: Eindeutiger Name der Datenquelle
+    """
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+
+    def version(self) -> str:
+        """Gibt die aktuelle Version der Daten zurück."""
+        raise NotImplementedError
+
+    async def aversion(self) -> str:
+        """
+        Asynchrone Variante von ``version()``.
+
+        Läuft über ``sync_to_async``, damit ``version()`` die Datenbank
+        abfragen darf, ohne den Event-Loop zu blockieren.
+        """
+        return await sync_to_async(self.version)()
+
+    def get_data(self, version: str) -> Dict[str, Any]:
+        """Gibt die Daten zu einer Version zurück."""
+        raise NotImplementedError
+
+    async def aget_data(self, version: str) -> Dict[str, Any]:
+        """
+        Asynchrone Variante von ``get_data()``.
+
+        Läuft wie ``aversion()`` über ``sync_to_async`` und nicht im
+        Render-Pool, damit ORM-Zugriffe in Djangos Datenbank-Thread bleiben.
+        """
+        return await sync_to_async(self.get_data)(version)
+
+    def etag(self, version: str, *variant: str) -> str:
+        """Erzeugt den ETag für eine Version und Variante (z.B. Sprache)."""
+        return quote_etag("-".join((self.name, version, *variant)))
+
+
+class ClockLiveDataProvider(LiveDataProvider):
+    """
+    Demo-Datenquelle: Die Daten ändern sich alle ``interval`` Sekunden.
+
+    Args:
+        name: Eindeutiger Name der Datenquelle
+        interval: Aktualisierungsintervall in Sekunden
+    """
+
+    def __init__(self, name: str, interval: int = 5) -> None:
+        super().__init__(name)
+        self.interval = interval
+
+    def version(self) -> str:
+        return str(int(time.time()) // self.interval * self.interval)
+
+    def get_data(self, version: str) -> Dict[str, Any]:
+        current_time = datetime.fromtimestamp(int(version)).strftime("%H:%M:%S")
+        return {
+            "time": current_time,
+            "message": _("Daten aktualisiert um %(time)s") % {"time": current_time},
+            "status": "success",
+        }
+
+
+_live_providers: Dict[str, LiveDataProvider] = {}
+
+
+def register_live_provider(provider: LiveDataProvider) -> LiveDataProvider:
+    """Registriert eine Datenquelle für den Live-Daten-Endpoint."""
+    _live_providers[provider.name] = provider
+    return provider
+
+
+def get_live_provider(name: str) -> LiveDataProvider:
+    """Gibt eine registrierte Datenquelle zurück; wirft ``KeyError``."""
+    return _live_providers[name]
+
+
+def live_fragment_key(provider: LiveDataProvider, version: str) -> str:
+    """Gibt den Cache-Schlüssel einer Version in der aktiven Sprache zurück."""
+    return fragment_cache_key("live", provider.name, version, get_language())
+
+
+def render_live_fragment(
+    provider: LiveDataProvider, version: str, data: Optional[Dict[str, Any]] = None
+) -> RenderedFragment:
+    """
+    Rendert das Live-Fragment einmal pro Version und aktiver Sprache.
+
+    Weitere Aufrufe mit derselben Version kommen aus dem Fragment-Cache.
+
+    Args:
+        provider: Die Datenquelle
+        version: Die Version, deren Daten gerendert werden
+        data: Bereits geladene Daten; sonst lädt ein Cache-Miss ``get_data()``
+
+    Returns:
+        Das gerenderte Fragment mit ETag
+    """
+
+    def render() -> str:
+        values = provider.get_data(version) if data is None else data
+        return render_to_string(
+            LIVE_TEMPLATE, {"data": values, "timestamp": values.get("time", version)}
+        )
+
+    return cached_fragment(live_fragment_key(provider, version), render)
+
+
+async def arender_live_fragment(
+    provider: LiveDataProvider, version: str
+) -> RenderedFragment:
+    """
+    Asynchrone Variante von :func:`render_live_fragment`.
+
+    Cache-Zugriffe und das Rendern laufen im Render-Pool; die Daten werden bei
+    einem Cache-Miss über ``aget_data()`` (``sync_to_async``) geladen, so dass
+    datenbankgestützte Datenquellen keine Verbindungen in Pool-Threads öffnen.
+    """
+    key = await run_in_render_pool(live_fragment_key, provider, version)
+    fragment = await run_in_render_pool(get_cached_fragment, key)
+    if fragment is None:
+        data = await provider.aget_data(version)
+        fragment = await run_in_render_pool(
+            render_live_fragment, provider, version, data
+        )
+    return fragment
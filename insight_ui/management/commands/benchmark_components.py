@@ -0,0 +1,48 @@
+"""Management-Command: Render-Benchmark der Komponenten-Tags."""
+
+import json
+from typing import Any
+
+from django.core.management.base import BaseCommand, CommandError
+
+from insight_ui.benchmarks import SAMPLES, benchmark_components
+
+
+class Command(BaseCommand):
+    help = "Vergleicht den Inclusion-Tag-Pfad mit dem kompilierten Render-Pfad pro Tag."
+
+    def add_arguments(self, parser: Any) -> None:
+        parser.add_argument("tags", nargs="*", help="Zu messende Tags (Standard: alle)")
+        parser.add_argument(
+            "--count", type=int, default=500, help="Aufrufe pro Messung"
+        )
+        parser.add_argument("--repeat", type=int, default=11, help="Wiederholungen")
+        parser.add_argument(
+            "--json", action="store_true", help="Ergebnis als JSON ausgeben"
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        unknown = [name for name in options["tags"] if name not in SAMPLES]
+        if unknown:
+            raise CommandError(f"Unbekannte Tags: {', '.join(unknown)}")
+
+        results = benchmark_components(
+            options["count"], options["repeat"], options["tags"] or None
+        )
+        if options["json"]:
+            self.stdout.write(json.dumps(results, indent=2))
+            return
+
+        self.stdout.write(
+            f"{'Tag':<20}{'Inclusion ms':>14}{'Kompiliert ms':>15}{'Faktor':>9}"
+        )
+        for row in results:
+            line = (
+                f"{row['tag']:<20}{row['inclusion_ms']:>14.2f}"
+                f"{row['compiled_ms']:>15.2f}{row['speedup']:>8.2f}x"
+            )
+            if not row["identical"]:
+                line += "  (abweichende Ausgabe)"
+                self.stdout.write(self.style.WARNING(line))
+            else:
+                self.stdout.write(line)
@@ -0,0 +1,333 @@
+"""Cursor-basierte (Keyset-)Paginierung für Infinite Scroll."""
+
+import hashlib
+from collections.abc import Iterable, Sequence
+from itertools import islice
+from typing import Any, Dict, FrozenSet, Iterator, List, Optional, Tuple
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from django.core import signing
+from django.core.exceptions import EmptyResultSet
+from django.db.models import F, Q, QuerySet
+
+from .cache import get_fragment_cache
+
+CURSOR_SALT = "insight_ui.pagination.cursor"
+CURSOR_PARAM = "cursor"
+PREFETCH_TIMEOUT = 60
+
+
+class InvalidCursor(ValueError):
+    """Der übergebene Cursor ist manipuliert oder passt nicht zur Datenquelle."""
+
+
+class CursorPage:
+    """Eine Seite einer Cursor-Paginierung."""
+
+    def __init__(
+        self, items: List[Any], next_cursor: Optional[str], cursor: Optional[str]
+    ) -> None:
+        self.items = items
+        self.next_cursor = next_cursor
+        self.cursor = cursor
+
+    @property
+    def has_next(self) -> bool:
+        """Ob nach dieser Seite weitere Elemente folgen."""
+        return self.next_cursor is not None
+
+    def next_url(self, base_url: str) -> str:
+        """
+        Hängt den Cursor der nächsten Seite an ``base_url`` an.
+
+        Vorhandene Query-Parameter bleiben erhalten, ein alter Cursor wird
+        ersetzt. Gibt es keine weitere Seite, wird ``""`` zurückgegeben.
+        """
+        if not self.has_next:
+            return ""
+        parts = urlsplit(base_url)
+        query = [(k, v) for k, v in parse_qsl(parts.query) if k != CURSOR_PARAM]
+        query.append((CURSOR_PARAM, self.next_cursor))
+        return urlunsplit(parts._replace(query=urlencode(query)))
+
+    def as_context(self, base_url: str) -> Dict[str, Any]:
+        """Gibt die Kontext-Variablen für ``infinite_scroll`` zurück."""
+        return {
+            "items": self.items,
+            "has_next": self.has_next,
+            "next_url": self.next_url(base_url),
+        }
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self.items)
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+
+class CursorPaginator:
+    """
+    Paginiert QuerySets oder Iterables über undurchsichtige Cursor.
+
+    - **QuerySets** werden per Keyset paginiert: Der Cursor enthält die
+      Sortierwerte des letzten Elements, die nächste Seite wird über einen
+      ``WHERE (a, b) > (x, y)``-Filter geladen. Die Kosten sind dadurch
+      unabhängig von der Scroll-Tiefe.
+    - **Sequenzen** (z.B. Listen) werden über die Position im Cursor direkt
+      angesprungen.
+    - **Sonstige Iterables** werden bis zur Position übersprungen.
+
+    Cursor werden mit ``django.core.signing`` signiert und sind für Clients
+    undurchsichtig. Sortierfelder dürfen über Relationen gehen
+    (``"author__name"``); ``NULL``-Werte stehen unabhängig von der Datenbank
+    immer am Ende.
+
+    Args:
+        object_list: Sortiertes QuerySet, Sequenz oder Iterable
+        per_page: Anzahl der Elemente pro Seite
+        ordering: Sortierfelder für QuerySets (z.B. ``("-created", "pk")``);
+            standardmäßig die Sortierung des QuerySets plus ``pk``
+        prefetch: Ob die folgende Seite gleich mitgeladen und kurzzeitig im
+            Cache abgelegt werden soll
+        name: Eindeutiger Name der Datenquelle für den Prefetch-Cache;
+            bei QuerySets standardmäßig Modell und Sortierung. Der
+            Prefetch-Schlüssel enthält bei QuerySets zusätzlich einen Hash
+            des SQL, damit unterschiedlich gefilterte QuerySets sich keine
+            Seiten teilen.
+    """
+
+    def __init__(
+        self,
+        object_list: Iterable[Any],
+        per_page: int = 10,
+        ordering: Optional[Sequence[str]] = None,
+        prefetch: bool = False,
+        name: str = "",
+    ) -> None:
+        if per_page < 1:
+            raise ValueError("per_page muss mindestens 1 sein")
+        self.object_list = object_list
+        self.per_page = per_page
+        self.prefetch = prefetch
+        self.ordering: Tuple[str, ...] = ()
+        self.nullable: FrozenSet[str] = frozenset()
+        self.name = name
+        self.scope = ""
+        if isinstance(object_list, QuerySet):
+            self.ordering = self._keyset_fields(
+                object_list.model, self._resolve_ordering(object_list, ordering)
+            )
+            self.nullable = self._nullable_fields(object_list.model, self.ordering)
+            self.object_list = object_list.order_by(*self._order_by())
+            if not self.name:
+                label = object_list.model._meta.label_lower
+                self.name = f"{label}:{','.join(self.ordering)}"
+            self.scope = self._queryset_digest(self.object_list)
+        if prefetch and not self.name:
+            raise ValueError("prefetch benötigt einen Namen für die Datenquelle")
+
+    @staticmethod
+    def _resolve_ordering(
+        queryset: QuerySet, ordering: Optional[Sequence[str]]
+    ) -> Tuple[str, ...]:
+        fields = list(
+            ordering or queryset.query.order_by or queryset.model._meta.ordering
+        )
+        if not all(isinstance(field, str) for field in fields):
+            raise ValueError("Keyset-Paginierung unterstützt nur Feldnamen")
+        # pk als eindeutiger Tiebreaker, damit kein Element doppelt erscheint
+        if not {"pk", "-pk", "id", "-id"} & set(fields):
+            fields.append("pk")
+        return tuple(fields)
+
+    @staticmethod
+    def _keyset_fields(model: Any, ordering: Tuple[str, ...]) -> Tuple[str, ...]:
+        """
+        Ersetzt Fremdschlüssel am Ende eines Sortierfelds durch ihre Spalte.
+
+        ``"author"`` wird zu ``"author_id"``, damit Cursor den Schlüsselwert
+        statt ``str(objekt)`` enthalten. Hat das Zielmodell eine eigene
+        ``Meta.ordering``, würde Django stattdessen danach sortieren; solche
+        Felder sowie Rückwärts- und Many-to-many-Relationen am Ende werden
+        abgelehnt.
+        """
+        fields = []
+        for field in ordering:
+            name = field.lstrip("-")
+            current = model
+            parts = name.split("__")
+            for index, part in enumerate(parts):
+                if current is None or part == "pk":
+                    break
+                model_field = current._meta.get_field(part)
+                if model_field.many_to_many or model_field.one_to_many:
+                    raise ValueError(f"Ungültiges Sortierfeld: {name}")
+                current = model_field.related_model
+                if current is not None and index == len(parts) - 1:
+                    if not model_field.concrete or current._meta.ordering:
+                        raise ValueError(
+                            f"Ungültiges Sortierfeld: {name} "
+                            f"(Feld von {current._meta.label} angeben)"
+                        )
+                    parts[index] = model_field.attname
+            fields.append(field[: len(field) - len(name)] + "__".join(parts))
+        return tuple(fields)
+
+    @staticmethod
+    def _nullable_fields(model: Any, ordering: Tuple[str, ...]) -> FrozenSet[str]:
+        """Sortierfelder, die ``NULL`` sein können (auch über Relationen)."""
+        nullable = set()
+        for field in ordering:
+            name = field.lstrip("-")
+            current = model
+            for part in name.split("__"):
+                if current is None:
+                    raise ValueError(f"Ungültiges Sortierfeld: {name}")
+                meta = current._meta
+                model_field = meta.pk if part == "pk" else meta.get_field(part)
+                if model_field.null:
+                    nullable.add(name)
+                current = model_field.related_model
+        return frozenset(nullable)
+
+    def _order_by(self) -> List[Any]:
+        """Sortierung mit ``NULL``-Werten am Ende, unabhängig von der Datenbank."""
+        expressions: List[Any] = []
+        for field in self.ordering:
+            name = field.lstrip("-")
+            if name not in self.nullable:
+                expressions.append(field)
+            elif field.startswith("-"):
+                expressions.append(F(name).desc(nulls_last=True))
+            else:
+                expressions.append(F(name).asc(nulls_last=True))
+        return expressions
+
+    @staticmethod
+    def _queryset_digest(queryset: QuerySet) -> str:
+        """Hash über SQL und Parameter, damit Filter den Prefetch-Cache trennen."""
+        try:
+            sql, params = queryset.query.get_compiler(queryset.db).as_sql()
+        except EmptyResultSet:
+            sql, params = "", ()
+        return hashlib.sha256(f"{sql}|{params!r}".encode("utf-8")).hexdigest()[:16]
+
+    def encode_cursor(self, position: Any) -> str:
+        """Kodiert eine Position als signierten, URL-sicheren Cursor."""
+        return signing.dumps(position, salt=CURSOR_SALT, compress=True)
+
+    def decode_cursor(self, cursor: str) -> Any:
+        """Dekodiert einen Cursor; wirft :class:`InvalidCursor` bei Fehlern."""
+        try:
+            return signing.loads(cursor, salt=CURSOR_SALT)
+        except signing.BadSignature as exc:
+            raise InvalidCursor("Ungültiger Cursor") from exc
+
+    def page(self, cursor: Optional[str] = None) -> CursorPage:
+        """
+        Lädt die Seite, die auf ``cursor`` folgt.
+
+        Args:
+            cursor: Cursor aus einer vorherigen Seite oder ``None`` für den Anfang
+
+        Returns:
+            Die angeforderte Seite
+        """
+        if cursor and self.prefetch:
+            cached = get_fragment_cache().get(self._prefetch_key(cursor))
+            if cached is not None:
+                return CursorPage(*cached, cursor=cursor)
+
+        position = self.decode_cursor(cursor) if cursor else None
+        limit = self.per_page * (2 if self.prefetch else 1) + 1
+        rows = self._fetch(position, limit)
+
+        items = rows[: self.per_page]
+        next_cursor = None
+        if len(rows) > self.per_page:
+            next_cursor = self.encode_cursor(self._position_after(items, position))
+        if self.prefetch and next_cursor:
+            self._store_prefetched(next_cursor, rows[self.per_page :], position, items)
+        return CursorPage(items, next_cursor, cursor)
+
+    def _fetch(self, position: Any, limit: int) -> List[Any]:
+        if isinstance(self.object_list, QuerySet):
+            queryset = self.object_list
+            if position is not None:
+                queryset = queryset.filter(self._keyset_filter(position))
+            return list(queryset[:limit])
+        start = self._offset(position)
+        if isinstance(self.object_list, Sequence):
+            return list(self.object_list[start : start + limit])
+        return list(islice(self.object_list, start, start + limit))
+
+    def _offset(self, position: Any) -> int:
+        if position is None:
+            return 0
+        if not isinstance(position, int) or position < 0:
+            raise InvalidCursor("Cursor passt nicht zur Datenquelle")
+        return position
+
+    def _position_after(self, items: List[Any], position: Any) -> Any:
+        """Bestimmt die Position hinter dem letzten Element von ``items``."""
+        if isinstance(self.object_list, QuerySet):
+            last = items[-1]
+            return [self._value(last, field) for field in self.ordering]
+        return self._offset(position) + len(items)
+
+    def _value(self, obj: Any, field: str) -> Any:
+        name = field.lstrip("-")
+        if isinstance(obj, dict):
+            value = obj[name]
+        else:
+            value = obj
+            for part in name.split("__"):
+                value = getattr(value, part)
+                if value is None:
+                    break
+        # Werte werden JSON-kodiert; Datumswerte & Co. als ISO-String
+        if value is None or isinstance(value, (bool, int, float, str)):
+            return value
+        return value.isoformat() if hasattr(value, "isoformat") else str(value)
+
+    def _keyset_filter(self, position: Any) -> Q:
+        """
+        Baut ``(a > x) OR (a = x AND b > y) ...`` für die Sortierfelder.
+
+        ``NULL`` steht immer am Ende: Nach einem Wert folgen auch alle
+        ``NULL``-Zeilen, nach ``NULL`` nur noch gleiche ``NULL``-Zeilen.
+        """
+        if not isinstance(position, list) or len(position) != len(self.ordering):
+            raise InvalidCursor("Cursor passt nicht zur Datenquelle")
+        condition = Q()
+        equal = Q()
+        for field, value in zip(self.ordering, position):
+            name = field.lstrip("-")
+            if value is not None:
+                lookup = "lt" if field.startswith("-") else "gt"
+                after = Q(**{f"{name}__{lookup}": value})
+                if name in self.nullable:
+                    after |= Q(**{f"{name}__isnull": True})
+                condition |= equal & after
+                equal &= Q(**{name: value})
+            else:
+                equal &= Q(**{f"{name}__isnull": True})
+        return condition
+
+    def _prefetch_key(self, cursor: str) -> str:
+        return f"insight_ui:cursor:{self.name}:{self.scope}:{cursor}"
+
+    def _store_prefetched(
+        self, cursor: str, rows: List[Any], position: Any, items: List[Any]
+    ) -> None:
+        next_items = rows[: self.per_page]
+        following = None
+        if len(rows) > self.per_page:
+            following = self.encode_cursor(
+                self._position_after(
+                    next_items, self._position_after(items, position)
+                )
+            )
+        get_fragment_cache().set(
+            self._prefetch_key(cursor), (next_items, following), PREFETCH_TIMEOUT
+        )
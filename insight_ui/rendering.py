@@ -0,0 +1,161 @@
+"""Asynchrones Rendern von Templates über einen eigenen Thread-Pool."""
+
+import asyncio
+import contextvars
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Dict,
+    Iterable,
+    Optional,
+    Tuple,
+    TypeVar,
+)
+
+from asgiref.sync import sync_to_async
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+from django.http import HttpRequest, HttpResponse
+from django.template.loader import render_to_string
+from django.utils import translation
+
+from .conf import get_config
+
+T = TypeVar("T")
+
+# Markiert das Ende eines Iterators in aiterate()
+_DONE = object()
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def render_pool_size() -> int:
+    """
+    Gibt die Größe des Render-Pools zurück.
+
+    Konfigurierbar über ``INSIGHT_UI["render_pool_size"]``; standardmäßig
+    wie bei ``ThreadPoolExecutor`` ``min(32, CPU-Kerne + 4)``.
+    """
+    size = get_config().render_pool_size
+    if size is None:
+        return min(32, (os.cpu_count() or 1) + 4)
+    return size
+
+
+def get_render_executor() -> ThreadPoolExecutor:
+    """Gibt den gemeinsamen, begrenzten Render-Pool zurück."""
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(
+                    max_workers=render_pool_size(),
+                    thread_name_prefix="insight-ui-render",
+                )
+    return _executor
+
+
+def shutdown_render_executor(wait: bool = True) -> None:
+    """Beendet den Render-Pool; er wird beim nächsten Zugriff neu angelegt."""
+    global _executor
+    with _executor_lock:
+        executor, _executor = _executor, None
+    if executor is not None:
+        executor.shutdown(wait=wait)
+
+
+@receiver(setting_changed, dispatch_uid="insight_ui_render_pool_setting_changed")
+def render_pool_setting_changed(sender: Any, setting: str, **kwargs: Any) -> None:
+    """Legt den Pool neu an, wenn sich ``INSIGHT_UI`` ändert."""
+    if setting == "INSIGHT_UI":
+        shutdown_render_executor(wait=False)
+
+
+async def run_in_render_pool(func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """
+    Führt eine synchrone Funktion im Render-Pool aus.
+
+    Die aktive Sprache und der ``contextvars``-Kontext werden in den
+    Worker-Thread übernommen. Im Gegensatz zu ``sync_to_async``
+    (``thread_sensitive=True``) laufen Aufrufe parallel, aber nie mit mehr
+    Threads als ``render_pool_size()``.
+
+    Hinweis: Datenbankzugriffe gehören weiterhin in ``sync_to_async``.
+    """
+    loop = asyncio.get_running_loop()
+    context = contextvars.copy_context()
+    call = partial(_call_in_language, translation.get_language(), func, args, kwargs)
+    return await loop.run_in_executor(get_render_executor(), context.run, call)
+
+
+def _call_in_language(
+    language: Optional[str],
+    func: Callable[..., T],
+    args: Tuple[Any, ...],
+    kwargs: Dict[str, Any],
+) -> T:
+    # asgiref.Local (Djangos Übersetzungs-Speicher) ist in fremden Threads
+    # nicht sichtbar, daher wird die Sprache explizit aktiviert
+    with translation.override(language):
+        return func(*args, **kwargs)
+
+
+def aiterate(iterable: Iterable[T], database: bool = False) -> AsyncIterator[T]:
+    """
+    Liest ein synchrones Iterable asynchron, ein ``next()`` pro Element.
+
+    Die Aufrufe laufen im Render-Pool mit der beim Aufruf von ``aiterate``
+    aktiven Sprache, so dass z.B. ``StreamingHttpResponse`` unter ASGI den
+    Inhalt ohne ``sync_to_async``-Umweg erhält. QuerySet-Iteratoren sind an
+    die Datenbankverbindung ihres Threads gebunden; mit ``database=True``
+    laufen die Aufrufe deshalb über ``sync_to_async``.
+
+    Args:
+        iterable: Das synchrone Iterable, z.B. ein Generator
+        database: Ob das Iterable Datenbankzugriffe ausführt
+
+    Returns:
+        Einen asynchronen Iterator über dieselben Elemente
+    """
+    iterator = iter(iterable)
+    call = partial(
+        _call_in_language, translation.get_language(), next, (iterator, _DONE), {}
+    )
+
+    async def step() -> Any:
+        if database:
+            return await sync_to_async(call)()
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(get_render_executor(), call)
+
+    async def items() -> AsyncIterator[T]:
+        while (item := await step()) is not _DONE:
+            yield item
+
+    return items()
+
+
+async def arender_to_string(
+    template_name: str,
+    context: Optional[Dict[str, Any]] = None,
+    request: Optional[HttpRequest] = None,
+) -> str:
+    """Asynchrone Variante von ``render_to_string``."""
+    return await run_in_render_pool(render_to_string, template_name, context, request)
+
+
+async def arender(
+    request: HttpRequest,
+    template_name: str,
+    context: Optional[Dict[str, Any]] = None,
+    status: Optional[int] = None,
+) -> HttpResponse:
+    """Asynchrone Variante von ``django.shortcuts.render``."""
+    content = await arender_to_string(template_name, context, request)
+    return HttpResponse(content, status=status)
@@ -80,14 +80,22 @@
       if (!url) return;
 
       const timer = setInterval(() => {
-        htmx.ajax('GET', url, { target: elt, swap: 'innerHTML' });
+        // Bekannte Version mitschicken: unveränderte Daten liefern 204 (kein Swap)
+        const headers = elt._liveVersion ? { 'X-Live-Version': elt._liveVersion } : {};
+        htmx.ajax('GET', url, { source: elt, target: elt, swap: 'innerHTML', headers: headers });
       }, interval);
 
       // Store timer for potential cleanup
       elt._liveUpdateTimer = timer;
     },
     onEvent: function (name, evt) {
-      // No-op: polling set up via init
+      // Polling wird in init eingerichtet; hier nur die Datenversion merken
+      if (name !== 'htmx:afterRequest') return;
+      const elt = evt.detail.elt;
+      const version = evt.detail.xhr?.getResponseHeader('X-Live-Version');
+      if (version && elt?.hasAttribute?.('hx-live-update')) {
+        elt._liveVersion = version;
+      }
     }
   });
 
@@ -0,0 +1,183 @@
+"""In-Process-Pipeline für die Verarbeitung von Formular-Übermittlungen."""
+
+import logging
+import queue
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional
+
+from .conf import get_config
+
+logger = logging.getLogger(__name__)
+
+QUEUED = "queued"
+PROCESSING = "processing"
+DONE = "done"
+FAILED = "failed"
+
+
+class PipelineFull(Exception):
+    """Die Warteschlange ist voll; die Übermittlung wurde nicht angenommen."""
+
+
+class Submission:
+    """Eine angenommene Übermittlung und ihr Verarbeitungsstatus."""
+
+    def __init__(
+        self, kind: str, payload: Dict[str, Any], handler: Callable[..., Any]
+    ) -> None:
+        self.id = uuid.uuid4().hex
+        self.kind = kind
+        self.payload = payload
+        self.handler = handler
+        self.status = QUEUED
+        self.error: Optional[str] = None
+        self.created = time.monotonic()
+        self.finished: Optional[float] = None
+
+    @property
+    def is_finished(self) -> bool:
+        """Ob die Verarbeitung abgeschlossen ist (erfolgreich oder nicht)."""
+        return self.status in (DONE, FAILED)
+
+
+class SubmissionPipeline:
+    """
+    Begrenzte Warteschlange mit festen Worker-Threads.
+
+    Views validieren synchron, übergeben die eigentliche Verarbeitung per
+    :meth:`submit` und antworten sofort. Der Status bleibt über die ID
+    abfragbar, bis er von neueren Ergebnissen verdrängt wird.
+
+    Args:
+        workers: Anzahl der Worker-Threads
+        max_queue: Maximale Anzahl wartender Übermittlungen
+        max_results: Maximale Anzahl vorgehaltener Status-Einträge
+    """
+
+    def __init__(
+        self, workers: int = 4, max_queue: int = 1000, max_results: int = 10000
+    ) -> None:
+        self.workers = workers
+        self.max_queue = max_queue
+        self.max_results = max_results
+        self._queue: "queue.Queue[Submission]" = queue.Queue(maxsize=max_queue)
+        self._results: "OrderedDict[str, Submission]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._threads: List[threading.Thread] = []
+        self._active = 0
+        self._processed = 0
+        self._failed = 0
+        self._rejected = 0
+
+    def _ensure_started(self) -> None:
+        if self._threads:
+            return
+        with self._lock:
+            if self._threads:
+                return
+            for index in range(self.workers):
+                thread = threading.Thread(
+                    target=self._work,
+                    name=f"insight-ui-submissions-{index}",
+                    daemon=True,
+                )
+                thread.start()
+                self._threads.append(thread)
+
+    def submit(
+        self, kind: str, payload: Dict[str, Any], handler: Callable[..., Any]
+    ) -> Submission:
+        """
+        Stellt eine Übermittlung in die Warteschlange, ohne zu blockieren.
+
+        Args:
+            kind: Art der Übermittlung (z.B. 'htmx', 'normal')
+            payload: Die validierten Daten; werden an ``handler`` übergeben
+            handler: Funktion, die die Verarbeitung im Worker ausführt
+
+        Returns:
+            Die angenommene Übermittlung
+
+        Raises:
+            PipelineFull: Wenn die Warteschlange voll ist
+        """
+        self._ensure_started()
+        submission = Submission(kind, payload, handler)
+        with self._lock:
+            self._results[submission.id] = submission
+            while len(self._results) > self.max_results:
+                self._results.popitem(last=False)
+        try:
+            self._queue.put_nowait(submission)
+        except queue.Full:
+            with self._lock:
+                self._results.pop(submission.id, None)
+                self._rejected += 1
+            raise PipelineFull("Warteschlange voll") from None
+        return submission
+
+    def get(self, submission_id: str) -> Optional[Submission]:
+        """Gibt eine Übermittlung anhand ihrer ID zurück."""
+        with self._lock:
+            return self._results.get(submission_id)
+
+    def _work(self) -> None:
+        while True:
+            submission = self._queue.get()
+            with self._lock:
+                self._active += 1
+            submission.status = PROCESSING
+            try:
+                submission.handler(**submission.payload)
+            except Exception as exc:
+                logger.exception("Verarbeitung von %s fehlgeschlagen", submission.id)
+                submission.error = str(exc)
+                submission.status = FAILED
+            else:
+                submission.status = DONE
+            finally:
+                submission.finished = time.monotonic()
+                with self._lock:
+                    self._active -= 1
+                    self._processed += 1
+                    self._failed += submission.status == FAILED
+                self._queue.task_done()
+
+    def join(self) -> None:
+        """Wartet, bis alle wartenden Übermittlungen verarbeitet sind."""
+        self._queue.join()
+
+    def metrics(self) -> Dict[str, int]:
+        """Gibt Kennzahlen zu Warteschlange und Verarbeitung zurück."""
+        with self._lock:
+            return {
+                "queue_depth": self._queue.qsize(),
+                "max_queue": self.max_queue,
+                "workers": self.workers,
+                "active": self._active,
+                "processed": self._processed,
+                "failed": self._failed,
+                "rejected": self._rejected,
+            }
+
+
+_pipeline: Optional[SubmissionPipeline] = None
+_pipeline_lock = threading.Lock()
+
+
+def get_submission_pipeline() -> SubmissionPipeline:
+    """
+    Gibt die prozessweite Pipeline zurück.
+
+    Konfigurierbar über ``INSIGHT_UI["submission_pipeline"]`` mit den
+    Schlüsseln ``workers``, ``max_queue`` und ``max_results``.
+    """
+    global _pipeline
+    if _pipeline is None:
+        with _pipeline_lock:
+            if _pipeline is None:
+                _pipeline = SubmissionPipeline(**get_config().submission_pipeline)
+    return _pipeline
@@ -0,0 +1,404 @@
+"""Hilfsfunktionen für große Tabellen."""
+
+from itertools import islice
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+)
+from urllib.parse import urlencode
+
+from django.db.models import Q, QuerySet
+from django.http import StreamingHttpResponse
+from django.template.loader import get_template, render_to_string
+from django.urls import reverse
+from django.utils import translation
+
+from .rendering import aiterate
+
+TABLE_TEMPLATE = "insight_ui/components/table.html"
+TABLE_ROWS_TEMPLATE = "insight_ui/components/table_rows.html"
+TBODY_CLOSE = "</tbody>"
+
+
+def _iter_rows(
+    rows: Iterable[Any],
+    chunk_size: int,
+    row_cells: Optional[Callable[[Any], Sequence[Any]]],
+) -> Iterator[Any]:
+    if isinstance(rows, QuerySet):
+        # iterator() verhindert, dass das QuerySet alle Zeilen zwischenspeichert
+        rows = rows.iterator(chunk_size=chunk_size)
+    if row_cells is not None:
+        return map(row_cells, rows)
+    return iter(rows)
+
+
+def iter_table_chunks(
+    rows: Iterable[Any],
+    headers: Optional[List[str]] = None,
+    caption: str = "",
+    theme: str = "light",
+    chunk_size: int = 500,
+    row_cells: Optional[Callable[[Any], Sequence[Any]]] = None,
+    **kwargs: Any,
+) -> Iterator[str]:
+    """
+    Rendert eine Tabelle stückweise.
+
+    Zuerst wird der Tabellenkopf bis einschließlich ``<tbody>`` ausgegeben,
+    danach jeweils ``chunk_size`` Zeilen und zuletzt das schließende Markup.
+    Es wird dasselbe Markup wie beim ``table``-Tag erzeugt.
+
+    Args:
+        rows: Iterable, Iterator oder QuerySet mit den Zeilen
+        headers: Eine Liste von Spaltenüberschriften
+        caption: Eine Beschreibung der Tabelle
+        theme: Das Farbschema ('light', 'dark', 'high-contrast')
+        chunk_size: Anzahl der Zeilen pro ausgegebenem Block
+        row_cells: Optionale Funktion, die ein Objekt in Zellenwerte umwandelt
+        **kwargs: Zusätzliche Optionen für die Tabelle
+
+    Yields:
+        HTML-Blöcke der Tabelle
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size muss mindestens 1 sein")
+
+    shell = render_to_string(
+        TABLE_TEMPLATE,
+        {
+            "headers": headers or [],
+            "rows": (),
+            "caption": caption,
+            "theme": theme,
+            "options": kwargs,
+        },
+    )
+    head, _, tail = shell.rpartition(TBODY_CLOSE)
+    yield head
+
+    rows_template = get_template(TABLE_ROWS_TEMPLATE)
+    iterator = _iter_rows(rows, chunk_size, row_cells)
+    while chunk := list(islice(iterator, chunk_size)):
+        yield rows_template.render({"rows": chunk})
+
+    yield TBODY_CLOSE + tail
+
+
+def stream_table(
+    rows: Iterable[Any],
+    headers: Optional[List[str]] = None,
+    caption: str = "",
+    theme: str = "light",
+    chunk_size: int = 500,
+    row_cells: Optional[Callable[[Any], Sequence[Any]]] = None,
+    **kwargs: Any,
+) -> StreamingHttpResponse:
+    """
+    Gibt eine Tabelle als ``StreamingHttpResponse`` zurück.
+
+    Der Speicherbedarf bleibt unabhängig von der Zeilenanzahl konstant, da
+    nie mehr als ``chunk_size`` Zeilen gleichzeitig gerendert werden.
+    Die aktive Sprache wird beim Erzeugen der Response festgehalten, weil
+    der Inhalt erst nach dem Verlassen der View gerendert wird.
+
+    Args:
+        rows: Iterable, Iterator oder QuerySet mit den Zeilen
+        headers: Eine Liste von Spaltenüberschriften
+        caption: Eine Beschreibung der Tabelle
+        theme: Das Farbschema ('light', 'dark', 'high-contrast')
+        chunk_size: Anzahl der Zeilen pro ausgegebenem Block
+        row_cells: Optionale Funktion, die ein Objekt in Zellenwerte umwandelt
+        **kwargs: Zusätzliche Optionen für die Tabelle
+
+    Returns:
+        Die Streaming-Response
+    """
+    language = translation.get_language()
+    table_options: Dict[str, Any] = {
+        "headers": headers,
+        "caption": caption,
+        "theme": theme,
+        "chunk_size": chunk_size,
+        "row_cells": row_cells,
+        **kwargs,
+    }
+
+    def content() -> Iterator[str]:
+        with translation.override(language):
+            yield from iter_table_chunks(rows, **table_options)
+
+    return _streaming_response(content())
+
+
+def astream_table(
+    rows: Iterable[Any],
+    headers: Optional[List[str]] = None,
+    caption: str = "",
+    theme: str = "light",
+    chunk_size: int = 500,
+    row_cells: Optional[Callable[[Any], Sequence[Any]]] = None,
+    **kwargs: Any,
+) -> StreamingHttpResponse:
+    """
+    Asynchrone Variante von :func:`stream_table` für ASGI-Views.
+
+    Die Response erhält einen asynchronen Iterator; jeder Block wird im
+    Render-Pool gerendert (QuerySets über ``sync_to_async``), der Event-Loop
+    bleibt frei. Argumente wie bei :func:`stream_table`.
+    """
+    chunks = iter_table_chunks(
+        rows,
+        headers=headers,
+        caption=caption,
+        theme=theme,
+        chunk_size=chunk_size,
+        row_cells=row_cells,
+        **kwargs,
+    )
+    return _streaming_response(aiterate(chunks, database=isinstance(rows, QuerySet)))
+
+
+def _streaming_response(content: Any) -> StreamingHttpResponse:
+    response = StreamingHttpResponse(content, content_type="text/html; charset=utf-8")
+    # Proxies (z.B. nginx) sollen die Blöcke nicht puffern
+    response["X-Accel-Buffering"] = "no"
+    return response
+
+
+def _sort_key(value: Any) -> Tuple[int, Any]:
+    """Vergleichsschlüssel, der Zahlen, Texte und ``None`` mischen kann."""
+    if value is None:
+        return (2, "")
+    if isinstance(value, (int, float)):
+        return (0, value)
+    return (1, str(value).casefold())
+
+
+class TableWindow:
+    """Ein sortierter, gefilterter Ausschnitt einer Tabellen-Datenquelle."""
+
+    def __init__(
+        self,
+        source: "TableDataSource",
+        rows: List[Sequence[Any]],
+        total: int,
+        page: int,
+        sort: Optional[int],
+        direction: str,
+        query: str,
+    ) -> None:
+        self.source = source
+        self.rows = rows
+        self.total = total
+        self.page = page
+        self.sort = sort
+        self.direction = direction
+        self.query = query
+
+    @property
+    def pages(self) -> int:
+        """Anzahl der Seiten (mindestens 1)."""
+        return max(1, -(-self.total // self.source.per_page))
+
+    @property
+    def start(self) -> int:
+        """Position des ersten Elements (1-basiert, 0 bei leerer Tabelle)."""
+        return (self.page - 1) * self.source.per_page + 1 if self.rows else 0
+
+    @property
+    def end(self) -> int:
+        """Position des letzten Elements (1-basiert)."""
+        return self.start + len(self.rows) - 1 if self.rows else 0
+
+    def url(self, **params: Any) -> str:
+        """Baut die Endpoint-URL mit dem aktuellen Zustand und ``params``."""
+        state: Dict[str, Any] = {"dir": self.direction, "page": self.page}
+        if self.sort is not None:
+            state["sort"] = self.sort
+        if self.query:
+            state["q"] = self.query
+        state.update(params)
+        return f"{self.source.url}?{urlencode(state)}"
+
+    def as_context(self) -> Dict[str, Any]:
+        """Gibt die Kontext-Variablen für die Tabellen-Partials zurück."""
+        headers = []
+        for index, text in enumerate(self.source.headers):
+            active = index == self.sort
+            next_direction = "desc" if active and self.direction == "asc" else "asc"
+            headers.append(
+                {
+                    "text": text,
+                    "url": self.url(sort=index, dir=next_direction, page=1),
+                    "aria_sort": (
+                        ("ascending" if self.direction == "asc" else "descending")
+                        if active
+                        else "none"
+                    ),
+                }
+            )
+        return {
+            "table_id": self.source.table_id,
+            "headers": headers,
+            "rows": self.rows,
+            "window": self,
+            "source_url": self.source.url,
+            "prev_url": self.url(page=self.page - 1) if self.page > 1 else "",
+            "next_url": self.url(page=self.page + 1) if self.page < self.pages else "",
+        }
+
+
+class TableDataSource:
+    """
+    Registrierte Datenquelle für serverseitig sortierte und gefilterte Tabellen.
+
+    In-Memory-Daten (Listen von Zeilen) werden beim Anlegen pro Spalte
+    vorsortiert; Sortieren kostet danach nur noch das Ausschneiden des
+    Fensters aus dem Index. QuerySets werden über ``order_by``,
+    ``icontains``-Filter und Slicing in der Datenbank verarbeitet.
+
+    Args:
+        name: Eindeutiger Name, unter dem der Endpoint die Quelle findet
+        headers: Die Spaltenüberschriften
+        rows: In-Memory-Zeilen (Liste von Sequenzen)
+        queryset: Alternativ ein QuerySet
+        columns: Feldnamen der Spalten (nur für QuerySets)
+        per_page: Anzahl der Zeilen pro Fenster
+    """
+
+    def __init__(
+        self,
+        name: str,
+        headers: Sequence[str],
+        rows: Optional[Sequence[Sequence[Any]]] = None,
+        queryset: Optional[QuerySet] = None,
+        columns: Optional[Sequence[str]] = None,
+        per_page: int = 50,
+    ) -> None:
+        if (rows is None) == (queryset is None):
+            raise ValueError("Entweder rows oder queryset angeben")
+        if queryset is not None and not columns:
+            raise ValueError("QuerySet-Quellen benötigen columns")
+        if per_page < 1:
+            raise ValueError("per_page muss mindestens 1 sein")
+        self.name = name
+        self.headers = list(headers)
+        self.queryset = queryset
+        self.columns = list(columns or [])
+        self.per_page = per_page
+        self.rows: List[Sequence[Any]] = list(rows) if rows is not None else []
+        self._sort_indexes: List[List[int]] = []
+        self._search_texts: List[str] = []
+        if queryset is None:
+            self._build_indexes()
+
+    def _build_indexes(self) -> None:
+        positions = range(len(self.rows))
+        self._sort_indexes = [
+            sorted(positions, key=lambda i, c=column: _sort_key(self.rows[i][c]))
+            for column in range(len(self.headers))
+        ]
+        self._search_texts = [
+            "\x1f".join(str(cell).casefold() for cell in row) for row in self.rows
+        ]
+
+    @property
+    def table_id(self) -> str:
+        """DOM-ID-Präfix der Tabelle, an die der Endpoint Fragmente liefert."""
+        return f"insight-table-{self.name}"
+
+    @property
+    def url(self) -> str:
+        """Die URL des Daten-Endpoints dieser Quelle."""
+        return reverse("table_data", args=[self.name])
+
+    def window(
+        self,
+        page: int = 1,
+        sort: Optional[int] = None,
+        direction: str = "asc",
+        query: str = "",
+    ) -> TableWindow:
+        """
+        Liefert ein sortiertes, gefiltertes Fenster der Daten.
+
+        Args:
+            page: Die Seite (1-basiert); wird auf den gültigen Bereich begrenzt
+            sort: Index der Sortierspalte oder ``None`` für die Originalreihenfolge
+            direction: 'asc' oder 'desc'
+            query: Suchbegriff; Zeilen, in denen keine Zelle ihn enthält, entfallen
+
+        Returns:
+            Das Fenster mit Zeilen und Paginierungsinformationen
+        """
+        if sort is not None and not 0 <= sort < len(self.headers):
+            sort = None
+        if direction not in ("asc", "desc"):
+            direction = "asc"
+        query = query.strip()
+        if self.queryset is not None:
+            return self._queryset_window(page, sort, direction, query)
+        return self._memory_window(page, sort, direction, query)
+
+    def _clamp_page(self, page: int, total: int) -> Tuple[int, int]:
+        pages = max(1, -(-total // self.per_page))
+        page = min(max(page, 1), pages)
+        return page, (page - 1) * self.per_page
+
+    def _memory_window(
+        self, page: int, sort: Optional[int], direction: str, query: str
+    ) -> TableWindow:
+        order: Sequence[int] = (
+            self._sort_indexes[sort] if sort is not None else range(len(self.rows))
+        )
+        if query:
+            needle = query.casefold()
+            order = [i for i in order if needle in self._search_texts[i]]
+        total = len(order)
+        page, start = self._clamp_page(page, total)
+        if direction == "desc":
+            positions = order[max(total - start - self.per_page, 0) : total - start]
+            positions = list(reversed(positions))
+        else:
+            positions = order[start : start + self.per_page]
+        rows = [self.rows[i] for i in positions]
+        return TableWindow(self, rows, total, page, sort, direction, query)
+
+    def _queryset_window(
+        self, page: int, sort: Optional[int], direction: str, query: str
+    ) -> TableWindow:
+        queryset = self.queryset
+        if query:
+            condition = Q()
+            for column in self.columns:
+                condition |= Q(**{f"{column}__icontains": query})
+            queryset = queryset.filter(condition)
+        if sort is not None:
+            prefix = "-" if direction == "desc" else ""
+            queryset = queryset.order_by(f"{prefix}{self.columns[sort]}", "pk")
+        total = queryset.count()
+        page, start = self._clamp_page(page, total)
+        window = queryset.values_list(*self.columns)[start : start + self.per_page]
+        return TableWindow(self, list(window), total, page, sort, direction, query)
+
+
+_table_sources: Dict[str, TableDataSource] = {}
+
+
+def register_table_source(source: TableDataSource) -> TableDataSource:
+    """Registriert eine Datenquelle für den Tabellen-Endpoint."""
+    _table_sources[source.name] = source
+    return source
+
+
+def get_table_source(name: str) -> TableDataSource:
+    """Gibt eine registrierte Datenquelle zurück; wirft ``KeyError``."""
+    return _table_sources[name]
@@ -1,27 +1,51 @@
 """Template-Tags für Insight UI-Komponenten."""
 
-from typing import Any, List, Dict
+from typing import Any, Dict, Iterable, List, Mapping, Union
+from urllib.parse import urlencode
 
-from django import template
+from insight_ui.components import ComponentLibrary
+from insight_ui.conf import get_config
+from insight_ui.pagination import CursorPage
+from insight_ui.tables import get_table_source
 
-register = template.Library()
+register = ComponentLibrary()
 
+# Einträge pro Block bei Sammel-Tags
+COLLECTION_CHUNK_SIZE = 100
 
-@register.inclusion_tag("insight_ui/components/navbar.html")
+# Django-Messages: level_tag -> Alert-Typ
+MESSAGE_ALERT_TYPES = {
+    "debug": "info",
+    "info": "info",
+    "success": "success",
+    "warning": "warning",
+    "error": "error",
+}
+
+
+@register.component("insight_ui/components/navbar.html")
 def navbar(
     brand: str = "",
     links: List[Dict[str, Any]] = None,
     theme: str = "light",
     show_language_selector: bool = True,
+    show_theme_toggle: bool = True,
+    brand_logo: str = None,
     **kwargs: Any,
 ) -> Dict[str, Any]:
     """
     Rendert eine barrierefreie Navigationsleiste.
 
+    Ohne Angabe kommen ``brand``, ``brand_logo``, ``theme`` und die beiden
+    ``show_*``-Schalter aus ``INSIGHT_UI`` (``branding``, ``theme``, ``features``).
+
     Args:
         brand: Der Name oder Titel der Anwendung
         links: Eine Liste von Dictionaries mit Link-Informationen
         theme: Das Farbschema ('light', 'dark', 'high-contrast')
+        show_language_selector: Ob der Sprachauswähler angezeigt wird
+        show_theme_toggle: Ob der Theme-Umschalter angezeigt wird
+        brand_logo: URL des Logos
         **kwargs: Zusätzliche Optionen für die Navbar
 
     Returns:
@@ -32,31 +56,35 @@ def navbar(
 
     return {
         "brand": brand,
+        "brand_logo": brand_logo,
         "links": links,
         "theme": theme,
         "options": {
             **kwargs,
             "show_language_selector": show_language_selector,
+            "show_theme_toggle": show_theme_toggle,
         },
     }
 
 
-@register.inclusion_tag("insight_ui/components/live_content.html")
+@register.component("insight_ui/components/live_content.html")
 def live_content(
     url: str = "",
     theme: str = "light",
     interval: int = None,
     initial_content: str = "",
+    transport: str = "poll",
     **kwargs: Any,
 ) -> Dict[str, Any]:
     """
     Rendert einen Container für Live-Updates via HTMX.
 
     Args:
-        url: Die URL für HTMX-Updates
+        url: Die URL für HTMX-Updates bzw. der SSE-Endpoint
         theme: Das Farbschema ('light', 'dark', 'high-contrast')
         interval: Intervall für automatische Updates in Millisekunden
         initial_content: Initialer Inhalt
+        transport: 'poll' (Polling per HTMX) oder 'sse' (Server-Sent Events)
         **kwargs: Zusätzliche Optionen
 
     Returns:
@@ -64,7 +92,10 @@ def live_content(
     """
     htmx_config = {}
 
-    if url:
+    if url and transport == "sse":
+        # Updates werden vom Server gepusht, kein Polling
+        htmx_config = {"url": url, "transport": "sse"}
+    elif url:
         htmx_config = {
             "url": url,
             "trigger": kwargs.get("trigger", "load"),
@@ -82,11 +113,12 @@ def live_content(
         },
     }
 
-@register.inclusion_tag("insight_ui/components/websocket.html")
+@register.component("insight_ui/components/websocket.html")
 def insight_websocket(
     id: str = "insight-websocket",
     ws_url: str = "",
     initial_content: str = "",
+    topics: Union[str, List[str]] = "",
     **kwargs: Any,
 ) -> Dict[str, Any]:
     """
@@ -94,29 +126,42 @@ def insight_websocket(
 
     Args:
         id: Die ID des WebSocket-Containers
-        ws_url: Die WebSocket-URL (z.B. ws://localhost:8765)
+        ws_url: Die WebSocket-URL (z.B. /ws/live/?target=<id> oder ws://localhost:8765)
         initial_content: Initialer Inhalt
+        topics: Abonnierte Themen des eigenständigen Servers (``utils/main.py``),
+            kommagetrennt oder als Liste (z.B. "cpu,memory"); pro Thema entsteht
+            neben ``<id>-output`` ein Ziel-Element ``<id>-<thema>``. Der Feed
+            unter ``/ws/live/`` ignoriert Themen und füllt nur ``<id>-output``
         **kwargs: Zusätzliche Optionen
 
     Returns:
         Dict mit Kontext-Variablen für das Template
     """
+    if isinstance(topics, str):
+        topics = topics.split(",")
+    topics = [topic.strip() for topic in topics if topic.strip()]
+    if ws_url and topics:
+        separator = "&" if "?" in ws_url else "?"
+        ws_url = f"{ws_url}{separator}{urlencode({'topics': ','.join(topics)})}"
+
     return {
         "options": {
             "id": id,
             "ws_url": ws_url,
             "initial_content": initial_content,
+            "topics": topics,
             **kwargs,
         }
     }
 
 
-@register.inclusion_tag("insight_ui/components/infinite_scroll.html")
+@register.component("insight_ui/components/infinite_scroll.html")
 def infinite_scroll(
     items: List[Any] = None,
     next_url: str = "",
     has_next: bool = True,
     threshold: int = 100,
+    page: CursorPage = None,
     **kwargs: Any,
 ) -> Dict[str, Any]:
     """
@@ -127,11 +172,16 @@ def infinite_scroll(
         next_url: URL für das Laden weiterer Elemente
         has_next: Ob weitere Elemente verfügbar sind
         threshold: Pixel-Schwellenwert für das Laden
+        page: Optionale ``CursorPage``; liefert Elemente, ``has_next`` und
+            hängt den Cursor der nächsten Seite an ``next_url`` an
         **kwargs: Zusätzliche Optionen
 
     Returns:
         Dict mit Kontext-Variablen für das Template
     """
+    if page is not None:
+        paged = page.as_context(next_url)
+        items, next_url, has_next = paged["items"], paged["next_url"], paged["has_next"]
     if items is None:
         items = []
 
@@ -144,7 +194,7 @@ def infinite_scroll(
     }
 
 
-@register.inclusion_tag("insight_ui/components/toggle_language.html")
+@register.component("insight_ui/components/toggle_language.html")
 def language_selector(
     current_language: str = "",
     available_languages: List[Dict[str, str]] = None,
@@ -156,7 +206,7 @@ def language_selector(
 
     Args:
         current_language: Der aktuelle Sprachcode
-        available_languages: Eine Liste verfügbarer Sprachen
+        available_languages: Eine Liste verfügbarer Sprachen (Standard: ``LANGUAGES``)
         theme: Das Farbschema ('light', 'dark', 'high-contrast')
         **kwargs: Zusätzliche Optionen
 
@@ -164,14 +214,8 @@ def language_selector(
         Dict mit Kontext-Variablen für das Template
     """
     if available_languages is None:
-        available_languages = [
-            {"code": "de", "name": "Deutsch", "native": "Deutsch"},
-            {"code": "en", "name": "English", "native": "English"},
-            {"code": "es", "name": "Spanish", "native": "Español"},
-            {"code": "fr", "name": "French", "native": "Français"},
-            {"code": "ar", "name": "Arabic", "native": "العربية"},
-            {"code": "zh", "name": "Chinese", "native": "中文"},
-        ]
+        # Im Tag kommt die Liste bereits aus den Standardwerten der Konfiguration
+        available_languages = get_config().languages
 
     return {
         "current_language": current_language,
@@ -181,7 +225,7 @@ def language_selector(
     }
 
 
-@register.inclusion_tag("insight_ui/components/alert.html")
+@register.component("insight_ui/components/alert.html")
 def alert(
     message: str,
     type: str = "info",
@@ -208,7 +252,46 @@ def alert(
     }
 
 
-@register.inclusion_tag("insight_ui/components/sidebar.html")
+def _alert_arguments(item: Any, dismissible: bool) -> Dict[str, Any]:
+    if isinstance(item, Mapping):
+        return {"dismissible": dismissible, **item}
+    # Strings oder Django-Messages (``{% alert_stack messages %}``)
+    return {
+        "message": str(item),
+        "type": MESSAGE_ALERT_TYPES.get(getattr(item, "level_tag", ""), "info"),
+        "dismissible": dismissible,
+    }
+
+
+@register.collection("alert", "insight_ui/components/alert_stack.html")
+def alert_stack(
+    items: Iterable[Any] = None,
+    dismissible: bool = True,
+    chunk_size: int = COLLECTION_CHUNK_SIZE,
+    **kwargs: Any,
+) -> Dict[str, Any]:
+    """
+    Rendert eine Liste von Benachrichtigungen untereinander.
+
+    Args:
+        items: Dictionaries mit den Argumenten des ``alert``-Tags, Strings
+            oder Django-Messages
+        dismissible: Ob Benachrichtigungen ohne eigene Angabe schließbar sind
+        chunk_size: Anzahl der Benachrichtigungen pro gerendertem Block
+        **kwargs: Zusätzliche Optionen für den Stapel (z.B. ``id``, ``class``)
+
+    Returns:
+        Dict mit Kontext-Variablen für das Template
+    """
+    kwargs.setdefault("class", "space-y-4")
+    return {
+        "items": (_alert_arguments(item, dismissible) for item in items or ()),
+        "chunk_size": chunk_size,
+        "options": kwargs,
+    }
+
+
+@register.component("insight_ui/components/sidebar.html")
 def sidebar(
     title: str = "",
     items: List[Dict[str, Any]] = None,
@@ -241,7 +324,7 @@ def sidebar(
     }
 
 
-@register.inclusion_tag("insight_ui/components/breadcrumbs.html")
+@register.component("insight_ui/components/breadcrumbs.html")
 def breadcrumbs(
     items: List[Dict[str, Any]] = None,
     **kwargs: Any,
@@ -265,12 +348,13 @@ def breadcrumbs(
     }
 
 
-@register.inclusion_tag("insight_ui/components/table.html")
+@register.component("insight_ui/components/table.html")
 def table(
     headers: List[str] = None,
     rows: List[List[Any]] = None,
     caption: str = "",
     theme: str = "light",
+    source: str = "",
     **kwargs: Any,
 ) -> Dict[str, Any]:
     """
@@ -281,6 +365,8 @@ def table(
         rows: Eine Liste von Listen mit Zellendaten
         caption: Eine Beschreibung der Tabelle
         theme: Das Farbschema ('light', 'dark', 'high-contrast')
+        source: Name einer registrierten ``TableDataSource``; Spaltenköpfe,
+            Suche und Paginierung laden dann Fenster über HTMX nach
         **kwargs: Zusätzliche Optionen für die Tabelle
 
     Returns:
@@ -291,16 +377,21 @@ def table(
     if rows is None:
         rows = []
 
+    source_context = None
+    if source:
+        source_context = get_table_source(source).window().as_context()
+
     return {
         "headers": headers,
         "rows": rows,
         "caption": caption,
         "theme": theme,
+        "source": source_context,
         "options": kwargs,
     }
 
 
-@register.inclusion_tag("insight_ui/components/modal.html")
+@register.component("insight_ui/components/modal.html")
 def modal(
     id: str,
     title: str,
@@ -339,7 +430,7 @@ def modal(
     }
 
 
-@register.inclusion_tag("insight_ui/components/card.html")
+@register.component("insight_ui/components/card.html")
 def card(
     title: str = "",
     subtitle: str = "",
@@ -378,7 +469,34 @@ def card(
     }
 
 
-@register.inclusion_tag("insight_ui/components/form.html")
+@register.collection("card", "insight_ui/components/card_grid.html")
+def card_grid(
+    items: Iterable[Dict[str, Any]] = None,
+    theme: str = "light",
+    chunk_size: int = COLLECTION_CHUNK_SIZE,
+    **kwargs: Any,
+) -> Dict[str, Any]:
+    """
+    Rendert eine Liste von Karten in einem Raster.
+
+    Args:
+        items: Karten als Dictionaries mit den Argumenten des ``card``-Tags
+        theme: Das Farbschema für Karten ohne eigenes ``theme``
+        chunk_size: Anzahl der Karten pro gerendertem Block
+        **kwargs: Zusätzliche Optionen für das Raster (z.B. ``id``, ``class``)
+
+    Returns:
+        Dict mit Kontext-Variablen für das Template
+    """
+    kwargs.setdefault("class", "grid grid-cols-1 md:grid-cols-2 gap-6")
+    return {
+        "items": ({"theme": theme, **item} for item in items or ()),
+        "chunk_size": chunk_size,
+        "options": kwargs,
+    }
+
+
+@register.component("insight_ui/components/form.html")
 def form(
     fields: List[Dict[str, Any]] = None,
     title: str = "",
@@ -454,9 +572,10 @@ def form(
     }
 
 
-@register.inclusion_tag("insight_ui/components/footer.html")
+@register.component("insight_ui/components/footer.html")
 def footer(
     theme: str = "light",
+    brand: str = "",
     **kwargs: Any,
 ) -> Dict[str, Any]:
     """
@@ -464,6 +583,7 @@ def footer(
 
     Args:
         theme: Das Farbschema ('light', 'dark', 'high-contrast')
+        brand: Name der Anwendung (Standard: ``INSIGHT_UI["branding"]["name"]``)
         **kwargs: Zusätzliche Optionen für den Footer
 
     Returns:
@@ -471,5 +591,6 @@ def footer(
     """
     return {
         "theme": theme,
+        "brand": brand,
         "options": kwargs,
     }
@@ -0,0 +1,97 @@
+"""Tests für den Live-Broadcast-Hub."""
+
+import asyncio
+
+from django.contrib.auth.models import User
+from django.test import SimpleTestCase, TestCase
+
+from insight_ui.broadcast import LiveBroadcastHub, format_sse
+from insight_ui.live import LiveDataProvider, register_live_provider
+
+
+class CountingProvider(LiveDataProvider):
+    """Datenquelle mit steuerbarer Version, zählt die Abrufe."""
+
+    def __init__(self, name):
+        super().__init__(name)
+        self.current = "1"
+        self.calls = 0
+
+    def version(self):
+        return self.current
+
+    def get_data(self, version):
+        self.calls += 1
+        return {"time": f"v{version}", "message": "Test", "status": "success"}
+
+
+class UserCountProvider(CountingProvider):
+    """Datenquelle, deren Version und Daten aus der Datenbank kommen."""
+
+    def version(self):
+        return str(User.objects.count())
+
+    def get_data(self, version):
+        names = ", ".join(User.objects.values_list("username", flat=True))
+        return {"time": f"v{version}", "message": names, "status": "success"}
+
+
+class FormatSseTest(SimpleTestCase):
+    """Tests für das SSE-Nachrichtenformat."""
+
+    def test_multiline_data(self):
+        """Mehrzeilige Inhalte werden auf mehrere data-Zeilen verteilt."""
+        self.assertEqual(
+            format_sse("<p>\n</p>", id="7"), "id: 7\ndata: <p>\ndata: </p>\n\n"
+        )
+
+
+class LiveBroadcastHubTest(TestCase):
+    """Tests für die Verteilung an mehrere Abonnenten."""
+
+    async def test_renders_once_for_all_subscribers(self):
+        """Jede Version wird einmal gerendert und an alle verteilt."""
+        hub = LiveBroadcastHub(interval=0.01, keepalive=5)
+        provider = CountingProvider("hub-test")
+        first = hub.subscribe(provider, "de")
+        second = hub.subscribe(provider, "de")
+
+        messages = await asyncio.gather(anext(first), anext(second))
+        self.assertEqual(messages[0], messages[1])
+        self.assertIn("id: 1", messages[0])
+
+        provider.current = "2"
+        messages = await asyncio.gather(anext(first), anext(second))
+        self.assertIn("Zeitstempel: v2", messages[0])
+        self.assertEqual(messages[0], messages[1])
+        self.assertEqual(provider.calls, 2)
+        self.assertEqual(hub.metrics()[0]["subscribers"], 2)
+
+        await first.aclose()
+        await second.aclose()
+        self.assertEqual(hub.metrics(), [])
+
+    async def test_version_from_database(self):
+        """Versionsprüfung und Daten dürfen das ORM verwenden."""
+        hub = LiveBroadcastHub(interval=0.01, keepalive=5)
+        provider = UserCountProvider("hub-db-test")
+        await User.objects.acreate(username="anna")
+        messages = hub.subscribe(provider, "de")
+        message = await anext(messages)
+        self.assertIn("id: 1", message)
+        self.assertIn("anna", message)
+        await messages.aclose()
+
+
+class LiveEventsViewTest(TestCase):
+    """Tests für den SSE-Endpoint."""
+
+    async def test_streams_event_stream(self):
+        """Der Endpoint liefert einen Event-Stream mit dem aktuellen Stand."""
+        register_live_provider(CountingProvider("sse-test"))
+        response = await self.async_client.get("/api/live-events/sse-test/")
+        self.assertEqual(response["Content-Type"], "text/event-stream")
+        stream = aiter(response.streaming_content)
+        self.assertEqual(await anext(stream), b"retry: 5000\n\n")
+        self.assertIn(b"data: ", await anext(stream))
+        await stream.aclose()
@@ -0,0 +1,436 @@
+"""Tests für den kompilierten Render-Pfad der Komponenten."""
+
+import warnings
+from io import StringIO
+from unittest import mock
+
+from django.contrib.auth.models import User
+from django.contrib.messages import constants
+from django.contrib.messages.storage.base import Message
+from django.core.cache import cache, caches
+from django.core.management import call_command
+from django.template import Context, Template, TemplateSyntaxError
+from django.test import RequestFactory, SimpleTestCase, override_settings
+from django.utils import translation
+from django.utils.safestring import mark_safe
+from django.utils.translation import gettext_lazy
+
+from insight_ui.benchmarks import SAMPLES, benchmark_components
+from insight_ui.cache import arguments_digest, bump_component_namespace
+from insight_ui.components import (
+    ComponentNode,
+    Options,
+    get_component,
+    iter_collection,
+    load_deferred_component,
+    prepare,
+    render_component,
+    stream_collection,
+)
+
+
+class PrepareTest(SimpleTestCase):
+    """Tests für die Vorbereitung des Kontexts."""
+
+    def test_missing_keys_resolve_empty(self):
+        """Fehlende Optionen werden ohne Exception zu ''."""
+        options = prepare({"id": "box", "nested": {"a": 1}})
+        self.assertIsInstance(options, Options)
+        self.assertEqual(options["title"], "")
+        self.assertIsInstance(options["nested"], Options)
+
+    def test_dict_methods_still_resolve(self):
+        """Dict-Methoden wie ``items`` bleiben im Template erreichbar."""
+        rendered = Template(
+            "{% for key, value in errors.items %}{{ key }}={{ value }};{% endfor %}"
+        ).render(Context({"errors": prepare({"name": "fehlt"})}))
+        self.assertEqual(rendered, "name=fehlt;")
+
+    def test_lists_of_dicts(self):
+        """Listen mit Dicts werden elementweise vorbereitet, andere bleiben gleich."""
+        actions = prepare([{"text": "OK"}])
+        self.assertIsInstance(actions[0], Options)
+        headers = ["A", "B"]
+        self.assertIs(prepare(headers), headers)
+
+
+class ComponentTagTest(SimpleTestCase):
+    """Tests für die Komponenten-Tags."""
+
+    def test_tags_use_component_nodes(self):
+        """Die Tags kompilieren zu ``ComponentNode`` statt ``InclusionNode``."""
+        template = Template('{% load insight_tags %}{% alert message="Hallo" %}')
+        self.assertTrue(
+            any(isinstance(node, ComponentNode) for node in template.nodelist)
+        )
+
+    def test_argument_validation(self):
+        """Ungültige Argumente fallen wie bisher beim Kompilieren auf."""
+        with self.assertRaises(TemplateSyntaxError):
+            Template("{% load insight_tags %}{% modal %}")
+
+    def test_render_component(self):
+        """Komponenten lassen sich aus Python rendern."""
+        rendered = render_component("alert", "Gespeichert", type="success")
+        self.assertIn("Gespeichert", rendered)
+        self.assertIn("success", rendered)
+        self.assertEqual(
+            get_component("alert").template_name, "insight_ui/components/alert.html"
+        )
+
+    def test_component_context_matches_inclusion_tags(self):
+        """Der Komponenten-Kontext übernimmt Request, Template und Autoescape."""
+        request = RequestFactory().get("/")
+        context = Context({"csrf_token": "token123"}, autoescape=False)
+        context.request = request
+        context.template = Template("")
+        new_context = get_component("alert").new_context(context, {"message": "Hallo"})
+        self.assertIs(new_context.request, request)
+        self.assertIs(new_context.template, context.template)
+        self.assertFalse(new_context.autoescape)
+        self.assertEqual(new_context["csrf_token"], "token123")
+        self.assertEqual(new_context["message"], "Hallo")
+
+    def test_csrf_token_is_passed(self):
+        """Das CSRF-Token des umgebenden Kontexts erreicht das Formular."""
+        rendered = Template(
+            '{% load insight_tags %}{% form title="Kontakt" %}'
+        ).render(Context({"csrf_token": "token123"}))
+        self.assertIn("token123", rendered)
+
+
+class CollectionTagTest(SimpleTestCase):
+    """Tests für die Sammel-Tags ``card_grid`` und ``alert_stack``."""
+
+    cards = [
+        {"title": "Erste", "content": "Inhalt"},
+        {"title": "Zweite", "actions": [{"url": "/", "text": "Öffnen"}]},
+        {"title": "Dritte", "theme": "dark"},
+    ]
+
+    def test_card_grid_matches_single_cards(self):
+        """Jede Karte wird wie mit dem ``card``-Tag gerendert."""
+        rendered = Template(
+            '{% load insight_tags %}{% card_grid cards id="grid" %}'
+        ).render(Context({"cards": self.cards}))
+        expected = "".join(
+            render_component("card", **{"theme": "light", **card})
+            for card in self.cards
+        )
+        self.assertTrue(rendered.startswith('<div class="insight-card-grid grid'))
+        self.assertIn('id="grid"', rendered)
+        self.assertIn(expected, rendered)
+        self.assertIn("insight-card--dark", rendered)
+
+    def test_chunks(self):
+        """Große Listen werden in Blöcken von ``chunk_size`` Einträgen gerendert."""
+        cards = ({"title": f"Karte {i}"} for i in range(5))
+        chunks = list(iter_collection("card_grid", cards, chunk_size=2))
+        # Rahmen, drei Blöcke (2 + 2 + 1), schließendes Markup
+        self.assertEqual(len(chunks), 5)
+        self.assertEqual(chunks[3].count("insight-card__title"), 1)
+        self.assertEqual(chunks[-1].strip(), "</div>")
+
+    def test_stream_collection(self):
+        """Sammel-Tags lassen sich als Streaming-Response ausliefern."""
+        response = stream_collection("card_grid", self.cards, chunk_size=1)
+        content = b"".join(response.streaming_content).decode()
+        self.assertEqual(content.count("insight-card__title"), 3)
+        self.assertEqual(response["X-Accel-Buffering"], "no")
+
+    def test_alert_stack_accepts_messages(self):
+        """Strings, Dictionaries und Django-Messages werden zu Alerts."""
+        items = [
+            "Hinweis",
+            {"message": "Gespeichert", "type": "success", "dismissible": False},
+            Message(constants.ERROR, "Fehlgeschlagen"),
+        ]
+        rendered = Template(
+            "{% load insight_tags %}{% alert_stack items %}"
+        ).render(Context({"items": items}))
+        self.assertIn("insight-alert-stack space-y-4", rendered)
+        self.assertEqual(rendered.count('role="alert"'), 3)
+        self.assertIn("insight-alert--info insight-alert--dismissible", rendered)
+        self.assertIn('insight-alert--success"', rendered)
+        self.assertIn("insight-alert--error", rendered)
+
+    def test_empty_collection(self):
+        """Ohne Einträge wird nur der Rahmen ausgegeben."""
+        rendered = Template("{% load insight_tags %}{% alert_stack %}").render(
+            Context()
+        )
+        self.assertEqual(
+            rendered.split(),
+            ["<div", 'class="insight-alert-stack', 'space-y-4">', "</div>"],
+        )
+
+
+class ComponentCacheTest(SimpleTestCase):
+    """Tests für die Option ``cache=`` der Komponenten-Tags."""
+
+    def setUp(self):
+        cache.clear()
+        self.navbar = get_component("navbar")
+
+    def render(self, template_string, **context):
+        return Template("{% load insight_tags %}" + template_string).render(
+            Context({"links": [{"url": "/", "text": "Start"}], **context})
+        )
+
+    def test_cached_output_is_reused(self):
+        """Gleiche Argumente werden nur einmal gerendert."""
+        uncached = self.render('{% navbar brand="App" links=links %}')
+        with mock.patch.object(
+            self.navbar, "get_context", wraps=self.navbar.get_context
+        ) as get_context:
+            first = self.render('{% navbar brand="App" links=links cache=True %}')
+            second = self.render('{% navbar brand="App" links=links cache=True %}')
+        self.assertEqual(first, uncached)
+        self.assertEqual(second, uncached)
+        self.assertEqual(get_context.call_count, 1)
+
+    def test_key_includes_arguments_language_and_theme(self):
+        """Andere Argumente, Sprache oder Theme ergeben eigene Einträge."""
+        with mock.patch.object(
+            self.navbar, "get_context", wraps=self.navbar.get_context
+        ) as get_context:
+            self.render('{% navbar brand="App" cache=True %}')
+            self.render('{% navbar brand="Andere" cache=True %}')
+            self.render('{% navbar brand="App" theme="dark" cache=True %}')
+            with translation.override("en"):
+                self.render('{% navbar brand="App" cache=True %}')
+        self.assertEqual(get_context.call_count, 4)
+
+    def test_namespace_bump_invalidates(self):
+        """Eine neue Namensraum-Version verwirft die gecachten Komponenten."""
+        navbar = '{% navbar brand="App" cache=True cache_namespace="navigation" %}'
+        with mock.patch.object(
+            self.navbar, "get_context", wraps=self.navbar.get_context
+        ) as get_context:
+            self.render(navbar)
+            bump_component_namespace("components")
+            self.render(navbar)
+            bump_component_namespace("navigation")
+            self.render(navbar)
+        self.assertEqual(get_context.call_count, 2)
+
+    def test_csrf_token_is_not_shared(self):
+        """Gecachte Formulare erhalten das CSRF-Token des jeweiligen Requests."""
+        form = '{% form title="Kontakt" cache=True %}'
+        first = self.render(form, csrf_token="token-a")
+        second = self.render(form, csrf_token="token-b")
+        self.assertIn('value="token-a"', first)
+        self.assertIn('value="token-b"', second)
+        self.assertNotIn("token-a", second)
+        uncached = self.render('{% form title="Kontakt" %}', csrf_token="token-b")
+        self.assertEqual(second, uncached)
+
+    def test_safe_and_plain_content_not_shared(self):
+        """``mark_safe``-Inhalt und gleicher Text werden getrennt gecacht."""
+        safe = self.render(
+            "{% alert message=html cache=True %}", html=mark_safe("<b>A</b>")
+        )
+        plain = self.render("{% alert message=html cache=True %}", html="<b>A</b>")
+        self.assertIn("<b>A</b>", safe)
+        self.assertIn("&lt;b&gt;A&lt;/b&gt;", plain)
+
+    def test_unhashable_arguments_render_uncached(self):
+        """Generatoren werden ungecacht gerendert und legen keine Einträge an."""
+        with mock.patch("insight_ui.components.cached_component") as cached:
+            rendered = self.render(
+                "{% alert_stack items cache=True %}",
+                items=(text for text in ["Hinweis"]),
+            )
+        cached.assert_not_called()
+        self.assertIn("Hinweis", rendered)
+
+    @override_settings(
+        CACHES={
+            "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"},
+            "components": {
+                "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+                "LOCATION": "components",
+            },
+        },
+        INSIGHT_UI={"component_cache": {"alias": "components", "timeout": 60}},
+    )
+    def test_configured_alias(self):
+        """Das HTML liegt im konfigurierten Cache-Alias."""
+        caches["components"].clear()
+        backend = caches["components"]
+        with mock.patch.object(backend, "set", wraps=backend.set) as cache_set:
+            self.render("{% footer cache=True %}")
+            self.render("{% footer cache=600 %}")
+        timeouts = [call.kwargs["timeout"] for call in cache_set.call_args_list]
+        self.assertEqual(timeouts, [60])
+
+    @override_settings(
+        CACHES={
+            "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"},
+            "components": {
+                "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+                "LOCATION": "components",
+            },
+        },
+        INSIGHT_UI={"component_cache": {"alias": "components"}},
+    )
+    def test_namespace_version_in_component_alias(self):
+        """Der Namensraum-Zähler liegt im selben Alias wie das HTML."""
+        caches["components"].clear()
+        with mock.patch.object(
+            self.navbar, "get_context", wraps=self.navbar.get_context
+        ) as get_context:
+            self.render('{% navbar brand="App" cache=True %}')
+            caches["default"].clear()
+            self.render('{% navbar brand="App" cache=True %}')
+            self.assertEqual(get_context.call_count, 1)
+            bump_component_namespace("components")
+            self.render('{% navbar brand="App" cache=True %}')
+        self.assertEqual(get_context.call_count, 2)
+        self.assertIsNone(caches["default"].get("insight_ui:ns:components"))
+
+
+class ArgumentsDigestTest(SimpleTestCase):
+    """Tests für die Schlüssel des Komponenten-Caches."""
+
+    def test_safe_strings_are_distinct(self):
+        """Sichere und normale Strings mit gleichem Text ergeben eigene Schlüssel."""
+        self.assertNotEqual(
+            arguments_digest({"content": mark_safe("<b>A</b>")}),
+            arguments_digest({"content": "<b>A</b>"}),
+        )
+        self.assertNotEqual(
+            arguments_digest(["s", "x"]), arguments_digest(mark_safe("x"))
+        )
+
+    def test_lazy_strings(self):
+        """Übersetzbare Strings werden wie ihr Text behandelt."""
+        self.assertEqual(
+            arguments_digest(gettext_lazy("Start")), arguments_digest("Start")
+        )
+
+    def test_objects_without_stable_form_are_rejected(self):
+        """QuerySets, Modelle, Generatoren und Messages lösen ``TypeError`` aus."""
+        values = {
+            "queryset": User.objects.all(),
+            "model": User(username="anna"),
+            "generator": (i for i in range(3)),
+            "message": Message(constants.INFO, "Hinweis"),
+            "key": {1: "eins"},
+        }
+        for case, value in values.items():
+            with self.subTest(case=case), self.assertRaises(TypeError):
+                arguments_digest({"items": value})
+
+
+class LazyComponentTest(SimpleTestCase):
+    """Tests für die Option ``lazy=`` der Komponenten-Tags."""
+
+    def test_placeholder(self):
+        """Statt der Komponente wird ein HTMX-Platzhalter ausgegeben."""
+        with mock.patch.object(get_component("table"), "get_context") as get_context:
+            rendered = Template(
+                '{% load insight_tags %}{% table source="orders" lazy=True %}'
+            ).render(Context())
+        get_context.assert_not_called()
+        self.assertIn('hx-trigger="revealed"', rendered)
+        self.assertIn('hx-get="/components/render/', rendered)
+        self.assertIn("insight-lazy--table", rendered)
+
+    def test_trigger(self):
+        """``lazy="load"`` lädt direkt nach dem Laden der Seite."""
+        rendered = Template(
+            '{% load insight_tags %}{% footer lazy="load" %}'
+        ).render(Context())
+        self.assertIn('hx-trigger="load"', rendered)
+
+    def test_token_contains_arguments(self):
+        """Das signierte Token enthält Komponente, Argumente und Cache-Optionen."""
+        rendered = Template(
+            '{% load insight_tags %}{% navbar "App" theme="dark" lazy=True cache=60 %}'
+        ).render(Context())
+        token = rendered.split("/components/render/")[1].split("/")[0]
+        deferred = load_deferred_component(token)
+        self.assertEqual(deferred.component.name, "navbar")
+        self.assertEqual(deferred.args, ["App"])
+        self.assertEqual(deferred.kwargs, {"theme": "dark"})
+        self.assertEqual(deferred.cache, 60)
+
+    def placeholder_token(self, template_string, **context):
+        rendered = Template("{% load insight_tags %}" + template_string).render(
+            Context(context)
+        )
+        return rendered.split("/components/render/")[1].split("/")[0]
+
+    def test_safe_strings_render_like_eager(self):
+        """``mark_safe`` bleibt erhalten; verzögert wird genauso escaped wie sofort."""
+        html = mark_safe("<b>Fett</b>")
+        eager = Template("{% load insight_tags %}{% alert message=html %}").render(
+            Context({"html": html})
+        )
+        deferred = load_deferred_component(
+            self.placeholder_token("{% alert message=html lazy=True %}", html=html)
+        )
+        lazy = deferred.render(deferred.component.standalone_context())
+        self.assertIn("<b>Fett</b>", eager)
+        self.assertEqual(lazy.strip(), eager.strip())
+        plain = load_deferred_component(
+            self.placeholder_token("{% alert message=html lazy=True %}", html="<b>")
+        )
+        self.assertEqual(plain.kwargs, {"message": "<b>"})
+        self.assertNotIn("<b>", plain.render(plain.component.standalone_context()))
+
+    def test_large_arguments_stay_out_of_url(self):
+        """Große Argumente liegen im Komponenten-Cache, das Token bleibt kurz."""
+        rows = [
+            [index, f"Kunde {index}", mark_safe("<i>offen</i>")]
+            for index in range(2000)
+        ]
+        token = self.placeholder_token(
+            '{% table headers=headers rows=rows lazy=True %}', headers=["Nr"], rows=rows
+        )
+        self.assertLess(len(token), 200)
+        deferred = load_deferred_component(token)
+        self.assertEqual(deferred.kwargs["rows"], [list(row) for row in rows])
+        self.assertIn("<i>offen</i>", deferred.kwargs["rows"][-1][2])
+        cache.clear()
+        with self.assertRaises(KeyError):
+            load_deferred_component(token)
+
+    def test_unserialisable_arguments_render_immediately(self):
+        """Nicht signierbare Argumente fallen auf sofortiges Rendern zurück."""
+        with self.assertLogs("insight_ui.components", "WARNING"):
+            rendered = Template(
+                "{% load insight_tags %}{% alert message=message lazy=True %}"
+            ).render(Context({"message": object()}))
+        self.assertIn('role="alert"', rendered)
+
+
+class BenchmarkTest(SimpleTestCase):
+    """Tests für den Komponenten-Benchmark."""
+
+    def test_same_output_on_both_paths(self):
+        """Inclusion-Pfad und kompilierter Pfad liefern identisches HTML."""
+        results = benchmark_components(count=3, repeat=1)
+        self.assertEqual([row["tag"] for row in results], list(SAMPLES))
+        for row in results:
+            with self.subTest(tag=row["tag"]):
+                self.assertTrue(row["identical"])
+                self.assertGreater(row["speedup"], 0)
+
+    @override_settings(DEBUG=True)
+    def test_no_warnings(self):
+        """Alle Beispiele rendern ohne Warnungen, auch ``{% csrf_token %}``."""
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            benchmark_components(count=1, repeat=1)
+
+    def test_command(self):
+        """Der Management-Command gibt eine Zeile pro Tag aus."""
+        out = StringIO()
+        call_command(
+            "benchmark_components", "card", "alert", count=2, repeat=1, stdout=out
+        )
+        lines = out.getvalue().splitlines()
+        self.assertEqual(len(lines), 3)
+        self.assertTrue(lines[1].startswith("card"))
@@ -0,0 +1,174 @@
+"""Tests für die aufgelöste Konfiguration der Komponenten."""
+
+from django.apps import apps
+from django.core.exceptions import ImproperlyConfigured
+from django.template import Context, Template
+from django.test import SimpleTestCase, override_settings
+
+from insight_ui.conf import check_settings, component_defaults, configure, get_config
+
+
+class ConfigValidationTest(SimpleTestCase):
+    """Tests für die Prüfung der Einstellungen."""
+
+    invalid = {
+        "theme": {"theme": "neon"},
+        "branding": {"branding": {"name": 3}},
+        "features": {"features": {"theme_toggle": "ja"}},
+        "cache alias": {"component_cache": {"alias": "fehlt"}},
+        "cache timeout": {"fragment_cache": {"timeout": "300"}},
+        "render pool": {"render_pool_size": 0},
+        "render pool type": {"render_pool_size": "4"},
+        "pipeline": {"submission_pipeline": {"workers": 0}},
+        "live hub": {"live_hub": {"interval": -1}},
+        "live hub type": {"live_hub": {"keepalive": True}},
+        "websocket feed": {"websocket_feed": {"interval": "5"}},
+        "event logging": {"event_logging": {"stdout": "nein"}},
+        "event logging batch": {"event_logging": {"batch_size": 1.5}},
+        "section type": {"live_hub": 1.0},
+        "component theme": {"components": {"footer": {"theme": "neon"}}},
+    }
+
+    def test_invalid_settings_fail(self):
+        """Ungültige Einstellungen lösen ``ImproperlyConfigured`` aus."""
+        for case, value in self.invalid.items():
+            with self.subTest(case=case), override_settings(INSIGHT_UI=value):
+                with self.assertRaises(ImproperlyConfigured):
+                    configure()
+
+    def test_invalid_languages_fail(self):
+        """Fehlerhafte ``LANGUAGES``-Einträge fallen ebenfalls auf."""
+        # Bereits der Wechsel der Sprachen löst die Konfiguration neu auf
+        with self.assertRaises(ImproperlyConfigured):
+            with override_settings(LANGUAGES=[("de",)]):
+                configure()
+
+    @override_settings(
+        INSIGHT_UI={
+            "them": "dark",
+            "branding": {"name": "App", "favicon": "favicon.ico"},
+            "features": {"skip_links": True},
+            "fragment_cache": {"timout": 60},
+            "components": {
+                "navbar": {"fixed": True, "theme": "dark"},
+                "alert": {"auto_dismiss": 5000},
+                "unbekannt": {},
+            },
+        }
+    )
+    def test_unknown_keys_warn(self):
+        """Unbekannte und ausgemusterte Schlüssel werden ignoriert und gemeldet."""
+        config = get_config()
+        self.assertEqual(config.branding["name"], "App")
+        self.assertNotIn("favicon", config.branding)
+        self.assertNotIn("timout", config.fragment_cache)
+        self.assertEqual(dict(config.components["navbar"])["theme"], "dark")
+        self.assertNotIn("fixed", config.components["navbar"])
+        messages = {
+            message.msg.split("'")[1]: message.id for message in check_settings()
+        }
+        self.assertEqual(
+            messages,
+            {
+                "them": "insight_ui.W002",
+                "branding.favicon": "insight_ui.W001",
+                "features.skip_links": "insight_ui.W001",
+                "fragment_cache.timout": "insight_ui.W002",
+                "components.navbar.fixed": "insight_ui.W001",
+                "components.alert.auto_dismiss": "insight_ui.W001",
+                "components.unbekannt": "insight_ui.W002",
+            },
+        )
+        template = Template("{% load insight_tags %}{% navbar %}")
+        self.assertTrue(template.render(Context()))
+
+    def test_no_warnings_by_default(self):
+        """Die Einstellungen des Projekts erzeugen keine Warnungen."""
+        self.assertEqual(check_settings(), [])
+
+    @override_settings(
+        INSIGHT_UI={
+            "render_pool_size": 3,
+            "live_hub": {"interval": 0.5},
+            "event_logging": {"stdout": False},
+        }
+    )
+    def test_sections_with_defaults(self):
+        """Alle Abschnitte liegen geprüft und um Standardwerte ergänzt vor."""
+        config = get_config()
+        self.assertEqual(config.render_pool_size, 3)
+        self.assertEqual(dict(config.live_hub), {"interval": 0.5, "keepalive": 15.0})
+        self.assertFalse(config.event_logging["stdout"])
+        self.assertEqual(config.event_logging["batch_size"], 100)
+        self.assertEqual(config.submission_pipeline["workers"], 4)
+        self.assertEqual(config.component_cache["alias"], "default")
+        with self.assertRaises(TypeError):
+            config.live_hub["interval"] = 2.0
+
+    @override_settings(INSIGHT_UI={"theme": "neon"})
+    def test_ready_validates(self):
+        """Die Prüfung läuft bereits beim Start der App."""
+        with self.assertRaises(ImproperlyConfigured):
+            apps.get_app_config("insight_ui").ready()
+
+
+class ConfigDefaultsTest(SimpleTestCase):
+    """Tests für die Standardwerte der Tags."""
+
+    def render(self, template_string):
+        return Template("{% load insight_tags %}" + template_string).render(Context())
+
+    @override_settings(
+        INSIGHT_UI={
+            "theme": "dark",
+            "branding": {"name": "Acme", "logo": "/static/acme.svg"},
+            "features": {"theme_toggle": False},
+        }
+    )
+    def test_settings_become_defaults(self):
+        """Theme, Branding und Features gelten für alle passenden Tags."""
+        navbar = self.render("{% navbar %}")
+        self.assertIn("Acme", navbar)
+        self.assertIn("/static/acme.svg", navbar)
+        self.assertNotIn("insight-theme-toggle", navbar)
+        self.assertIn("Acme", self.render("{% footer %}"))
+        self.assertIn("insight-card--dark", self.render('{% card "Titel" %}'))
+
+    @override_settings(INSIGHT_UI={"branding": {"name": "Acme"}})
+    def test_arguments_win(self):
+        """Argumente im Tag haben Vorrang, auch positionale."""
+        rendered = self.render('{% navbar "Andere" %}')
+        self.assertIn("Andere", rendered)
+        self.assertNotIn("Acme", rendered)
+
+    @override_settings(
+        INSIGHT_UI={"theme": "dark", "components": {"card": {"theme": "light"}}}
+    )
+    def test_component_overrides(self):
+        """``components`` überschreibt die Standardwerte einzelner Tags."""
+        self.assertEqual(component_defaults("card")["theme"], "light")
+        self.assertEqual(component_defaults("modal")["theme"], "dark")
+        self.assertNotIn("theme", component_defaults("alert"))
+
+    @override_settings(LANGUAGES=[("de", "Deutsch"), ("fr", "Français")])
+    def test_languages_from_settings(self):
+        """Der Sprachauswähler bietet die Sprachen aus ``LANGUAGES`` an."""
+        languages = component_defaults("language_selector")["available_languages"]
+        self.assertEqual([language["code"] for language in languages], ["de", "fr"])
+        self.assertEqual(languages[1]["name"], "French")
+        self.assertEqual(languages[1]["native"], "Français")
+        rendered = self.render('{% language_selector "de" %}')
+        self.assertIn("Français", rendered)
+        self.assertNotIn("中文", rendered)
+
+    def test_immutable_and_resolved_once(self):
+        """Die Konfiguration ist unveränderlich und wird nur einmal aufgelöst."""
+        config = get_config()
+        self.assertIs(get_config(), config)
+        with self.assertRaises(TypeError):
+            config.components["navbar"]["brand"] = "Anders"
+        with self.assertRaises(TypeError):
+            config.languages[0]["code"] = "xx"
+        with override_settings(INSIGHT_UI={"theme": "dark"}):
+            self.assertIsNot(get_config(), config)
+            self.assertNotEqual(get_config().digest, config.digest)
@@ -0,0 +1,79 @@
+"""Tests für die Insight UI Kontext-Provider."""
+
+from pathlib import Path
+
+from django.test import SimpleTestCase, override_settings
+from django.utils.autoreload import file_changed
+from django.utils.translation import override
+
+from insight_ui.context import ContextProvider, freeze, storybook_context
+
+
+class FreezeTest(SimpleTestCase):
+    """Tests für die freeze Hilfsfunktion."""
+
+    def test_freeze_nested(self):
+        """Dicts und Listen werden rekursiv schreibgeschützt."""
+        frozen = freeze({"items": [{"text": "A"}]})
+        with self.assertRaises(TypeError):
+            frozen["items"] = []
+        self.assertIsInstance(frozen["items"], tuple)
+        with self.assertRaises(TypeError):
+            frozen["items"][0]["text"] = "B"
+
+
+class ContextProviderTest(SimpleTestCase):
+    """Tests für den ContextProvider."""
+
+    def setUp(self):
+        self.calls = 0
+
+        def builder():
+            self.calls += 1
+            return {"value": self.calls}
+
+        self.provider = ContextProvider(builder)
+
+    def test_built_once_per_language(self):
+        """Der Builder läuft nur einmal pro Sprache."""
+        with override("de"):
+            self.provider.get()
+            self.provider.get()
+        with override("en"):
+            self.provider.get()
+        self.assertEqual(self.calls, 2)
+
+    def test_copy_is_independent(self):
+        """Überschreibungen in der Kopie verändern den Cache nicht."""
+        context = self.provider.copy()
+        context["value"] = "override"
+        self.assertEqual(self.provider.get()["value"], 1)
+
+    def test_invalidated_by_translation_reload(self):
+        """Geänderte .mo-Dateien leeren den Cache."""
+        self.provider.get()
+        file_changed.send(sender=None, file_path=Path("locale/de/django.mo"))
+        self.provider.get()
+        self.assertEqual(self.calls, 2)
+
+    def test_invalidated_by_language_settings(self):
+        """Geänderte Sprach-Einstellungen leeren den Cache."""
+        self.provider.get()
+        with override_settings(LANGUAGES=[("de", "Deutsch")]):
+            self.provider.get()
+        self.provider.get()
+        self.assertEqual(self.calls, 3)
+
+
+class StorybookContextTest(SimpleTestCase):
+    """Tests für den Storybook-Kontext."""
+
+    def test_translated_per_language(self):
+        """Jede Sprache erhält ihre eigene Variante."""
+        with override("de"):
+            german = storybook_context.get()
+        with override("en"):
+            english = storybook_context.get()
+        self.assertIsNot(german, english)
+        with override("de"):
+            self.assertIs(storybook_context.get(), german)
@@ -0,0 +1,68 @@
+"""Tests für die strukturierte Ereignis-Protokollierung."""
+
+import io
+import json
+import logging
+
+from django.test import SimpleTestCase, override_settings
+
+from insight_ui import events
+from insight_ui.events import (
+    EVENT_LOGGER_NAME,
+    BatchingStreamHandler,
+    ForwardingHandler,
+    JsonEventFormatter,
+    get_event_logger,
+    log_submission_event,
+    stop_event_listener,
+)
+
+
+class BatchingStreamHandlerTest(SimpleTestCase):
+    """Tests für das gebündelte Schreiben."""
+
+    def test_writes_in_batches(self):
+        """Erst ab ``batch_size`` Einträgen wird geschrieben."""
+        stream = io.StringIO()
+        handler = BatchingStreamHandler(stream, batch_size=3, flush_interval=60)
+        handler.setFormatter(JsonEventFormatter())
+        self.addCleanup(handler.close)
+        logger = logging.getLogger("insight_ui.tests.batching")
+        for _ in range(2):
+            handler.handle(logger.makeRecord(logger.name, 20, "", 0, "", (), None))
+        self.assertEqual(stream.getvalue(), "")
+        handler.handle(logger.makeRecord(logger.name, 20, "", 0, "", (), None))
+        self.assertEqual(len(stream.getvalue().splitlines()), 3)
+
+
+class SubmissionEventTest(SimpleTestCase):
+    """Tests für das Ereignis pro Formular-Übermittlung."""
+
+    def setUp(self):
+        stop_event_listener()
+        self.addCleanup(stop_event_listener)
+
+    @override_settings(INSIGHT_UI={"event_logging": {"stdout": False}})
+    def test_one_event_without_personal_data(self):
+        """Es wird genau ein Ereignis mit Metadaten, aber ohne Inhalte erzeugt."""
+        with self.assertLogs("insight_ui", level="INFO") as logs:
+            log_submission_event("htmx", "Anna", "anna@example.com", "Hallo")
+            stop_event_listener()
+
+        self.assertEqual(len(logs.records), 1)
+        event = logs.records[0].event
+        self.assertEqual(event["event"], "form_submission")
+        self.assertEqual(event["email_domain"], "example.com")
+        self.assertEqual(event["name_length"], 4)
+        self.assertTrue(event["valid"])
+        self.assertIn("timestamp", event)
+        self.assertNotIn("anna@example.com", json.dumps(event))
+
+    @override_settings(INSIGHT_UI={"event_logging": {"stdout": False}})
+    def test_stdout_can_be_disabled(self):
+        """Ohne stdout wird nur an die konfigurierten Handler weitergereicht."""
+        logger = get_event_logger()
+        self.assertEqual(logger.name, EVENT_LOGGER_NAME)
+        self.assertFalse(logger.propagate)
+        handlers = [type(handler) for handler in events._listener.handlers]
+        self.assertEqual(handlers, [ForwardingHandler])
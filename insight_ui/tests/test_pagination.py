@@ -0,0 +1,126 @@
+"""Tests für die Cursor-Paginierung."""
+
+from datetime import datetime, timezone
+
+from django.contrib.auth.models import Permission, User
+from django.core.cache import cache
+from django.test import TestCase
+
+from insight_ui.pagination import CursorPaginator, InvalidCursor
+
+
+class CursorPaginatorTest(TestCase):
+    """Tests für den CursorPaginator."""
+
+    def setUp(self):
+        cache.clear()
+        for name in ["carla", "anna", "bert", "anna2", "dora"]:
+            User.objects.create(username=name, first_name=name[0])
+
+    def collect(self, paginator):
+        """Sammelt alle Seiten über die Cursor-Kette."""
+        pages, cursor = [], None
+        while True:
+            page = paginator.page(cursor)
+            pages.append(list(page))
+            if not page.has_next:
+                return pages
+            cursor = page.next_cursor
+
+    def test_queryset_keyset(self):
+        """QuerySets werden per Keyset mit pk als Tiebreaker paginiert."""
+        queryset = User.objects.order_by("-first_name")
+        pages = self.collect(CursorPaginator(queryset, per_page=2))
+        names = [user.username for page in pages for user in page]
+        expected = queryset.order_by("-first_name", "pk")
+        self.assertEqual(names, [user.username for user in expected])
+        self.assertEqual([len(page) for page in pages], [2, 2, 1])
+
+    def test_keyset_query_has_no_offset(self):
+        """Folgeseiten filtern statt OFFSET zu verwenden."""
+        paginator = CursorPaginator(User.objects.all(), per_page=2)
+        cursor = paginator.page().next_cursor
+        with self.assertNumQueries(1) as ctx:
+            paginator.page(cursor)
+        self.assertNotIn("OFFSET", ctx.captured_queries[0]["sql"])
+
+    def test_prefetch_serves_next_page_from_cache(self):
+        """Mit prefetch kommt die Folgeseite ohne weitere Query."""
+        paginator = CursorPaginator(User.objects.all(), per_page=2, prefetch=True)
+        first = paginator.page()
+        with self.assertNumQueries(0):
+            second = paginator.page(first.next_cursor)
+        self.assertEqual(len(second), 2)
+        self.assertTrue(second.has_next)
+
+    def test_iterables(self):
+        """Listen und Generatoren werden ebenfalls unterstützt."""
+        first = CursorPaginator(list(range(7)), per_page=3).page()
+        self.assertEqual(first.items, [0, 1, 2])
+        generator = CursorPaginator(iter(range(7)), per_page=3)
+        self.assertEqual(generator.page(first.next_cursor).items, [3, 4, 5])
+
+    def test_next_url_and_invalid_cursor(self):
+        """next_url ersetzt alte Cursor; fremde Cursor werden abgelehnt."""
+        page = CursorPaginator(list(range(5)), per_page=2).page()
+        url = page.next_url("/items/?q=a&cursor=old")
+        self.assertTrue(url.startswith("/items/?q=a&cursor="))
+        self.assertNotIn("old", url)
+        with self.assertRaises(InvalidCursor):
+            CursorPaginator(User.objects.all()).page(page.next_cursor)
+
+    def test_prefetch_is_scoped_to_queryset(self):
+        """Unterschiedlich gefilterte QuerySets teilen sich keine Seiten."""
+        first = CursorPaginator(
+            User.objects.filter(first_name="a"), per_page=1, prefetch=True
+        ).page()
+        other = CursorPaginator(
+            User.objects.filter(first_name="b"), per_page=1, prefetch=True
+        )
+        page = other.page(first.next_cursor)
+        self.assertEqual([user.username for user in page], ["bert"])
+
+    def test_nullable_ordering(self):
+        """NULL-Werte stehen am Ende und brechen die Cursor-Kette nicht."""
+        for day, name in enumerate(["bert", "dora"], start=1):
+            User.objects.filter(username=name).update(
+                last_login=datetime(2024, 1, day, tzinfo=timezone.utc)
+            )
+        for ordering in ("last_login", "-last_login"):
+            with self.subTest(ordering=ordering):
+                pages = self.collect(
+                    CursorPaginator(User.objects.all(), per_page=2, ordering=[ordering])
+                )
+                names = [user.username for page in pages for user in page]
+                logged_in = ["bert", "dora"]
+                if ordering != "last_login":
+                    logged_in.reverse()
+                self.assertEqual(names[:2], logged_in)
+                self.assertEqual(sorted(names[2:]), ["anna", "anna2", "carla"])
+
+    def test_related_ordering(self):
+        """Sortierfelder über Relationen werden aufgelöst."""
+        queryset = Permission.objects.all()
+        ordering = ["content_type__model", "codename"]
+        pages = self.collect(CursorPaginator(queryset, per_page=7, ordering=ordering))
+        codenames = [permission.codename for page in pages for permission in page]
+        expected = queryset.order_by(*ordering, "pk").values_list("codename", flat=True)
+        self.assertEqual(codenames, list(expected))
+
+    def test_foreign_key_ordering(self):
+        """Ein Fremdschlüssel als Sortierfeld wird über seine Spalte paginiert."""
+        queryset = Permission.objects.all()
+        paginator = CursorPaginator(queryset, per_page=7, ordering=["-content_type"])
+        self.assertEqual(paginator.ordering, ("-content_type_id", "pk"))
+        pages = self.collect(paginator)
+        ids = [permission.pk for page in pages for permission in page]
+        expected = queryset.order_by("-content_type_id", "pk")
+        self.assertEqual(ids, list(expected.values_list("pk", flat=True)))
+
+    def test_unsupported_relation_ordering(self):
+        """Relationen, die Django nicht über ihre Spalte sortiert, werden abgelehnt."""
+        cases = [(Permission, "group"), (Permission, "user"), (User, "groups")]
+        for model, field in cases:
+            with self.subTest(field=field):
+                with self.assertRaisesMessage(ValueError, "Ungültiges Sortierfeld"):
+                    CursorPaginator(model.objects.all(), ordering=[field])
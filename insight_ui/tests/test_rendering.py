@@ -0,0 +1,34 @@
+"""Tests für das asynchrone Rendern."""
+
+import threading
+
+from asgiref.sync import async_to_sync
+from django.test import SimpleTestCase, override_settings
+from django.utils.translation import get_language, override
+
+from insight_ui.rendering import (
+    get_render_executor,
+    render_pool_size,
+    run_in_render_pool,
+)
+
+
+class RenderPoolTest(SimpleTestCase):
+    """Tests für den Render-Pool."""
+
+    def test_pool_size_from_settings(self):
+        """Die Pool-Größe kommt aus INSIGHT_UI["render_pool_size"]."""
+        with override_settings(INSIGHT_UI={"render_pool_size": 3}):
+            self.assertEqual(render_pool_size(), 3)
+            self.assertEqual(get_render_executor()._max_workers, 3)
+
+    def test_runs_in_pool_with_active_language(self):
+        """Der Worker-Thread übernimmt die aktive Sprache."""
+
+        def probe():
+            return threading.current_thread().name, get_language()
+
+        with override("fr"):
+            thread_name, language = async_to_sync(run_in_render_pool)(probe)
+        self.assertTrue(thread_name.startswith("insight-ui-render"))
+        self.assertEqual(language, "fr")
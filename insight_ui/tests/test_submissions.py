@@ -0,0 +1,47 @@
+"""Tests für die Submission-Pipeline."""
+
+import threading
+
+from django.test import SimpleTestCase
+
+from insight_ui.submissions import DONE, FAILED, PipelineFull, SubmissionPipeline
+
+
+class SubmissionPipelineTest(SimpleTestCase):
+    """Tests für die begrenzte Hintergrund-Verarbeitung."""
+
+    def test_processes_in_background(self):
+        """Handler laufen im Worker, Fehler landen im Status."""
+        pipeline = SubmissionPipeline(workers=2, max_queue=10)
+        done = pipeline.submit("test", {"value": 1}, lambda value: None)
+        failed = pipeline.submit("test", {}, lambda: 1 / 0)
+        pipeline.join()
+        self.assertEqual(pipeline.get(done.id).status, DONE)
+        self.assertEqual(pipeline.get(failed.id).status, FAILED)
+        metrics = pipeline.metrics()
+        self.assertEqual(metrics["processed"], 2)
+        self.assertEqual(metrics["failed"], 1)
+        self.assertEqual(metrics["queue_depth"], 0)
+
+    def test_rejects_when_full(self):
+        """Eine volle Warteschlange blockiert nicht, sondern lehnt ab."""
+        started = threading.Event()
+        release = threading.Event()
+        # Auch bei fehlschlagenden Assertions die Worker freigeben
+        self.addCleanup(release.set)
+
+        def block():
+            started.set()
+            release.wait(5)
+
+        pipeline = SubmissionPipeline(workers=1, max_queue=1)
+        pipeline.submit("test", {}, block)
+        # Warten, bis der Worker den ersten Eintrag übernommen hat
+        self.assertTrue(started.wait(5), "Worker hat den Eintrag nicht übernommen")
+        pipeline.submit("test", {}, block)
+        with self.assertRaises(PipelineFull):
+            pipeline.submit("test", {}, block)
+        self.assertEqual(pipeline.metrics()["queue_depth"], 1)
+        self.assertEqual(pipeline.metrics()["rejected"], 1)
+        release.set()
+        pipeline.join()
@@ -0,0 +1,86 @@
+"""Tests für die Tabellen-Datenquellen."""
+
+from django.contrib.auth.models import User
+from django.template import Context, Template
+from django.test import TestCase
+
+from insight_ui.tables import TableDataSource, register_table_source
+
+
+class TableDataSourceTest(TestCase):
+    """Tests für In-Memory- und QuerySet-Datenquellen."""
+
+    def setUp(self):
+        self.source = TableDataSource(
+            "test-memory",
+            headers=["Name", "Wert"],
+            rows=[("b", 2), ("A", None), ("c", 10), ("a", 1)],
+            per_page=2,
+        )
+
+    def test_sort_ascending_and_descending(self):
+        """Sortierung nutzt die vorberechneten Indizes in beide Richtungen."""
+        asc = self.source.window(sort=1)
+        self.assertEqual([row[1] for row in asc.rows], [1, 2])
+        desc = self.source.window(sort=1, direction="desc")
+        self.assertEqual([row[1] for row in desc.rows], [None, 10])
+        self.assertEqual(self.source.window(sort=1, page=2).rows[-1][1], None)
+
+    def test_filter_and_page_bounds(self):
+        """Filter wirken auf alle Spalten, Seiten werden begrenzt."""
+        window = self.source.window(query="a", sort=0, page=5)
+        self.assertEqual(window.total, 2)
+        self.assertEqual(window.page, 1)
+        self.assertEqual((window.start, window.end), (1, 2))
+
+    def test_queryset_source(self):
+        """QuerySets werden in der Datenbank sortiert und gefiltert."""
+        for name in ["zoe", "adam", "max"]:
+            User.objects.create(username=name)
+        source = TableDataSource(
+            "test-users",
+            headers=["Benutzer"],
+            queryset=User.objects.all(),
+            columns=["username"],
+            per_page=2,
+        )
+        window = source.window(sort=0, direction="desc", query="a")
+        self.assertEqual(window.rows, [("max",), ("adam",)])
+
+
+class TableDataViewTest(TestCase):
+    """Tests für den Tabellen-Endpoint und den table-Tag."""
+
+    def setUp(self):
+        register_table_source(
+            TableDataSource(
+                "test-view",
+                headers=["Nummer"],
+                rows=[(i,) for i in range(120)],
+                per_page=50,
+            )
+        )
+
+    def test_returns_tbody_fragment(self):
+        """Der Endpoint liefert nur das Fenster plus OOB-Steuerelemente."""
+        response = self.client.get("/api/table-data/test-view/?sort=0&dir=desc")
+        content = response.content.decode()
+        self.assertTrue(content.lstrip().startswith("<tbody"))
+        self.assertIn('id="insight-table-test-view-body"', content)
+        self.assertEqual(content.count("<tr class=\"insight-table__row\">"), 51)
+        self.assertIn('aria-sort="descending"', content)
+        self.assertIn('hx-swap-oob="true"', content)
+
+    def test_unknown_source(self):
+        """Unbekannte Datenquellen liefern 404."""
+        response = self.client.get("/api/table-data/missing/")
+        self.assertEqual(response.status_code, 404)
+
+    def test_table_tag_with_source(self):
+        """Der table-Tag rendert das erste Fenster und verdrahtet HTMX."""
+        rendered = Template(
+            '{% load insight_tags %}{% table source="test-view" %}'
+        ).render(Context())
+        self.assertIn('hx-get="/api/table-data/test-view/', rendered)
+        self.assertIn('id="insight-table-test-view-pagination"', rendered)
+        self.assertEqual(rendered.count('<td class="insight-table__cell">'), 50)
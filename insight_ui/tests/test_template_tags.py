@@ -1,5 +1,7 @@
 """Tests für Insight UI Template Tags."""
 
+import re
+
 from django.test import TestCase
 from django.template import Context, Template
 from django.contrib.auth.models import User
@@ -84,6 +86,16 @@ class LiveContentTemplateTagTest(TemplateTagsTestCase):
         rendered = self.render_template(template_string)
         self.assertIn('/api/live-data/', rendered)
 
+    def test_live_content_sse(self):
+        """Test für live_content mit SSE-Transport (ohne Polling)."""
+        template_string = """
+        {% load insight_tags %}
+        {% live_content url="/api/live-events/" transport="sse" interval=5000 %}
+        """
+        rendered = self.render_template(template_string)
+        self.assertIn('sse-connect="/api/live-events/"', rendered)
+        self.assertNotIn('hx-live-update', rendered)
+
 
 class WebsocketTemplateTagTest(TemplateTagsTestCase):
     """Tests für den insight_websocket Template Tag."""
@@ -97,6 +109,30 @@ class WebsocketTemplateTagTest(TemplateTagsTestCase):
         rendered = self.render_template(template_string)
         self.assertIn('ws://localhost:8765', rendered)
 
+    def test_websocket_topics(self):
+        """Test für abonnierte Themen: Query-Parameter und ein Ziel pro Thema."""
+        template_string = """
+        {% load insight_tags %}
+        {% insight_websocket id="box" ws_url="ws://example.org/" topics="cpu, memory" %}
+        """
+        rendered = self.render_template(template_string)
+        self.assertIn('ws-connect="ws://example.org/?topics=cpu%2Cmemory"', rendered)
+        self.assertIn('id="box-cpu"', rendered)
+        self.assertIn('id="box-memory"', rendered)
+
+    def test_websocket_topics_outside_output(self):
+        """Ein Swap von ``<id>-output`` ersetzt die Themen-Ziele nicht."""
+        template_string = """
+        {% load insight_tags %}
+        {% insight_websocket id="box" ws_url="ws://example.org/" topics="system,cpu" %}
+        """
+        rendered = self.render_template(template_string)
+        output = re.search(r'id="box-output"[^>]*>(.*?)</div>', rendered, re.S).group(1)
+        self.assertNotIn("box-cpu", output)
+        self.assertIn("insight-websocket__placeholder", output)
+        self.assertIn('id="box-cpu"', rendered)
+        self.assertNotIn('id="box-system"', rendered)
+
 
 class InfiniteScrollTemplateTagTest(TemplateTagsTestCase):
     """Tests für den infinite_scroll Template Tag."""
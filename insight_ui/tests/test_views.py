@@ -0,0 +1,352 @@
+"""Tests für die Insight UI Views."""
+
+import re
+import threading
+from unittest import mock
+
+from asgiref.sync import sync_to_async
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.template import Context, Template
+from django.test import TestCase
+from django.utils import translation
+
+from insight_ui import views
+from insight_ui.components import get_component
+from insight_ui.live import LiveDataProvider, register_live_provider
+from insight_ui.submissions import get_submission_pipeline
+
+
+class FixedLiveDataProvider(LiveDataProvider):
+    """Datenquelle mit fester Version, zählt die Abrufe."""
+
+    def __init__(self, name):
+        super().__init__(name)
+        self.current = "1"
+        self.calls = 0
+
+    def version(self):
+        return self.current
+
+    def get_data(self, version):
+        self.calls += 1
+        return {"time": f"v{version}", "message": "Test", "status": "success"}
+
+
+class UserCountLiveDataProvider(LiveDataProvider):
+    """Datenquelle, deren Version aus der Datenbank kommt."""
+
+    def version(self):
+        return str(User.objects.count())
+
+    def get_data(self, version):
+        names = ", ".join(User.objects.values_list("username", flat=True))
+        return {"time": f"v{version}", "message": names, "status": "success"}
+
+
+class ComponentDemoViewTest(TestCase):
+    """Tests für component_demo_view und den Fragment-Cache."""
+
+    def setUp(self):
+        cache.clear()
+
+    def test_unknown_component(self):
+        """Unbekannte Komponenten liefern 404."""
+        response = self.client.get("/components/unknown/")
+        self.assertEqual(response.status_code, 404)
+
+    def test_etag_and_not_modified(self):
+        """Ein passender If-None-Match-Header liefert 304 ohne Rendern."""
+        response = self.client.get("/components/card/", HTTP_HX_REQUEST="true")
+        self.assertEqual(response.status_code, 200)
+        etag = response["ETag"]
+
+        with mock.patch("insight_ui.views.render_to_string") as render:
+            response = self.client.get(
+                "/components/card/",
+                HTTP_HX_REQUEST="true",
+                HTTP_IF_NONE_MATCH=etag,
+            )
+        self.assertEqual(response.status_code, 304)
+        render.assert_not_called()
+
+    def test_htmx_and_page_variants_cached_separately(self):
+        """HTMX-Fragment und vollständige Seite haben eigene Einträge."""
+        fragment = self.client.get("/components/alert/", HTTP_HX_REQUEST="true")
+        page = self.client.get("/components/alert/")
+        self.assertNotEqual(fragment["ETag"], page["ETag"])
+        self.assertIn(b"<html", page.content)
+        self.assertNotIn(b"<html", fragment.content)
+
+    def test_page_is_rtl_for_arabic(self):
+        """Ohne Request-Kontext erkennt die Seite RTL-Sprachen selbst."""
+        page = self.client.get("/ar/components/alert/")
+        self.assertContains(page, '<html lang="ar" dir="rtl">')
+        self.assertContains(page, "insight-ui-rtl.css")
+        german = self.client.get("/components/alert/")
+        self.assertContains(german, 'dir="ltr"')
+        self.assertNotContains(german, "insight-ui-rtl.css")
+
+
+class ComponentRenderViewTest(TestCase):
+    """Tests für verzögerte Komponenten (lazy=True) und ihren Endpoint."""
+
+    def placeholder_url(self, template_string, **context):
+        rendered = Template("{% load insight_tags %}" + template_string).render(
+            Context(context)
+        )
+        return re.search(r'hx-get="([^"]+)"', rendered).group(1)
+
+    def test_placeholder_renders_component(self):
+        """Der Platzhalter lädt die Komponente mit den Argumenten des Tags."""
+        url = self.placeholder_url(
+            '{% card title=title content="Inhalt" lazy=True %}', title="Umsätze"
+        )
+        response = self.client.get(url, HTTP_HX_REQUEST="true")
+        self.assertEqual(response.status_code, 200)
+        self.assertContains(response, "insight-card__title")
+        self.assertContains(response, "Umsätze")
+        self.assertNotContains(response, "hx-trigger")
+
+    def test_tampered_token(self):
+        """Veränderte Tokens werden abgelehnt."""
+        url = self.placeholder_url('{% alert message="Hallo" lazy=True %}')
+        response = self.client.get(url.replace("/render/", "/render/x"))
+        self.assertEqual(response.status_code, 404)
+
+    def test_large_table(self):
+        """Große Tabellen laden über eine kurze URL; abgelaufen ergibt das 404."""
+        rows = [[index, f"Kunde {index}"] for index in range(2000)]
+        url = self.placeholder_url(
+            "{% table headers=headers rows=rows lazy=True %}", headers=["Nr"], rows=rows
+        )
+        self.assertLess(len(url), 1024)
+        response = self.client.get(url)
+        self.assertContains(response, "Kunde 1999")
+        cache.clear()
+        self.assertEqual(self.client.get(url).status_code, 404)
+
+    def test_form_gets_csrf_token_of_request(self):
+        """Verzögerte Formulare enthalten ein gültiges CSRF-Token."""
+        url = self.placeholder_url('{% form title="Kontakt" lazy=True %}')
+        response = self.client.get(url)
+        self.assertContains(response, 'name="csrfmiddlewaretoken"')
+        self.assertIn("csrftoken", response.cookies)
+
+    def test_language_of_placeholder_is_kept(self):
+        """Gerendert wird in der Sprache der Seite mit dem Platzhalter."""
+        with translation.override("en"):
+            url = self.placeholder_url("{% alert message='Hallo' lazy=True %}")
+        alert = get_component("alert")
+        languages = []
+
+        def get_context(*args, **kwargs):
+            languages.append(translation.get_language())
+            return {
+                "message": "Hallo", "type": "info", "dismissible": True, "options": {}
+            }
+
+        with mock.patch.object(alert, "get_context", side_effect=get_context):
+            response = self.client.get(url, HTTP_ACCEPT_LANGUAGE="de")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(languages, ["en"])
+
+
+class MoreItemsViewTest(TestCase):
+    """Tests für more_items_view mit Cursor-Paginierung."""
+
+    def setUp(self):
+        cache.clear()
+
+    def test_follows_cursors_until_end(self):
+        """Die next_url-Kette liefert alle Elemente genau einmal."""
+        url, titles = "/api/more-items/", []
+        while url:
+            data = self.client.get(url).json()
+            titles += [item["title"] for item in data["items"]]
+            url = data["next_url"]
+        self.assertEqual(titles, [f"Element {i}" for i in range(11, 36)])
+
+    def test_invalid_cursor(self):
+        """Manipulierte Cursor werden abgelehnt."""
+        response = self.client.get("/api/more-items/?cursor=kaputt")
+        self.assertEqual(response.status_code, 400)
+
+
+class TableStreamViewTest(TestCase):
+    """Tests für das Streaming großer Tabellen."""
+
+    async def test_streams_head_rows_and_tail(self):
+        """Der Kopf kommt zuerst, danach die Zeilen in Blöcken."""
+        response = await self.async_client.get("/api/table-stream/?rows=1200")
+        self.assertTrue(response.streaming)
+        self.assertTrue(response.is_async)
+        chunks = [chunk.decode() async for chunk in response.streaming_content]
+        self.assertIn("<thead", chunks[0])
+        self.assertNotIn("<td", chunks[0])
+        self.assertEqual(len(chunks), 5)  # Kopf, 3 Blöcke à 500, Abschluss
+        body = "".join(chunks)
+        self.assertEqual(body.count('<tr class="insight-table__row">'), 1201)
+        self.assertTrue(body.rstrip().endswith("</div>"))
+
+
+class AsyncViewsTest(TestCase):
+    """Tests für die asynchronen Views."""
+
+    async def test_storybook_and_toggle_view(self):
+        """Storybook und Toggle-View rendern über den Render-Pool."""
+        response = await self.async_client.get("/")
+        self.assertEqual(response.status_code, 200)
+        for view in ("table", "card"):
+            with self.subTest(view=view):
+                response = await self.async_client.get(f"/toggle_view/?view={view}")
+                self.assertContains(response, 'id="switchable-view"')
+
+    async def test_live_data_fragment(self):
+        """Live-Daten werden als HTML-Fragment geliefert."""
+        response = await self.async_client.get(
+            "/api/live-data/", headers={"HX-Request": "true"}
+        )
+        self.assertContains(response, "Status: success")
+
+
+class LiveDataViewTest(TestCase):
+    """Tests für live_data_view mit versionierten Datenquellen."""
+
+    def setUp(self):
+        cache.clear()
+        self.provider = register_live_provider(FixedLiveDataProvider("test"))
+
+    def test_renders_once_per_version(self):
+        """Gleiche Versionen kommen aus dem Cache, neue werden gerendert."""
+        for _ in range(3):
+            response = self.client.get("/api/live-data/test/", HTTP_HX_REQUEST="true")
+            self.assertContains(response, "Zeitstempel: v1")
+        self.assertEqual(self.provider.calls, 1)
+        self.assertEqual(response["X-Live-Version"], "1")
+
+        self.provider.current = "2"
+        response = self.client.get("/api/live-data/test/", HTTP_HX_REQUEST="true")
+        self.assertContains(response, "Zeitstempel: v2")
+        self.assertEqual(self.provider.calls, 2)
+
+    def test_unchanged_poll(self):
+        """Unveränderte Polls liefern 204 (HTMX) bzw. 304 (If-None-Match)."""
+        response = self.client.get(
+            "/api/live-data/test/", HTTP_HX_REQUEST="true", HTTP_X_LIVE_VERSION="1"
+        )
+        self.assertEqual(response.status_code, 204)
+
+        etag = self.client.get("/api/live-data/test/")["ETag"]
+        response = self.client.get("/api/live-data/test/", HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(self.provider.calls, 1)
+
+    async def test_version_from_database(self):
+        """``version()`` darf das ORM verwenden, ohne den Event-Loop zu blockieren."""
+        register_live_provider(UserCountLiveDataProvider("users"))
+        await User.objects.acreate(username="anna")
+        response = await self.async_client.get(
+            "/api/live-data/users/", headers={"HX-Request": "true"}
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response["X-Live-Version"], "1")
+        self.assertContains(response, "Zeitstempel: v1")
+
+    async def test_data_from_database(self):
+        """``get_data()`` darf das ORM verwenden; es läuft nicht im Render-Pool."""
+        register_live_provider(UserCountLiveDataProvider("user-names"))
+        await User.objects.acreate(username="anna")
+        threads = []
+        get_data = UserCountLiveDataProvider.get_data
+
+        def record(provider, version):
+            threads.append(threading.current_thread().name)
+            return get_data(provider, version)
+
+        with mock.patch.object(UserCountLiveDataProvider, "get_data", record):
+            response = await self.async_client.get(
+                "/api/live-data/user-names/", headers={"HX-Request": "true"}
+            )
+            self.assertContains(response, "anna")
+            response = await self.async_client.get("/api/live-data/user-names/")
+            self.assertEqual(response.json()["message"], "anna")
+        self.assertEqual(len(threads), 2)
+        for name in threads:
+            self.assertFalse(name.startswith("insight-ui-render"), name)
+
+    def test_unknown_source(self):
+        """Unbekannte Datenquellen liefern 404."""
+        response = self.client.get("/api/live-data/unbekannt/")
+        self.assertEqual(response.status_code, 404)
+
+
+class FormSubmitViewTest(TestCase):
+    """Tests für die Formular-Übermittlung über die Pipeline."""
+
+    def setUp(self):
+        patcher = mock.patch("insight_ui.views.process_form_submission")
+        self.process = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_htmx_submit_returns_status_immediately(self):
+        """Gültige Eingaben werden angenommen und per Status-Fragment verfolgt."""
+        release = threading.Event()
+        self.process.side_effect = lambda **payload: release.wait(5)
+        response = self.client.post(
+            "/api/form-submit/",
+            {"htmx_name": "Anna", "htmx_email": "anna@example.com"},
+            HTTP_HX_REQUEST="true",
+        )
+        self.assertEqual(response.status_code, 202)
+        self.assertContains(response, "hx-get=\"/api/form-status/", status_code=202)
+
+        release.set()
+        get_submission_pipeline().join()
+        self.process.assert_called_once_with(
+            name="Anna", email="anna@example.com", message=""
+        )
+        status_url = re.search(r'hx-get="([^"]+)"', response.content.decode())[1]
+        status = self.client.get(status_url, HTTP_HX_REQUEST="true")
+        self.assertContains(status, "anna@example.com")
+
+    def test_htmx_submit_validation_errors(self):
+        """Ungültige Eingaben werden synchron abgelehnt und nicht eingereiht."""
+        response = self.client.post(
+            "/api/form-submit/", {"htmx_name": ""}, HTTP_HX_REQUEST="true"
+        )
+        self.assertEqual(response.status_code, 400)
+        self.process.assert_not_called()
+
+    async def test_normal_submit_renders_asynchronously(self):
+        """Das normale Formular wird ohne sync_to_async im Render-Pool gerendert."""
+        with mock.patch(
+            "insight_ui.views.arender", wraps=views.arender
+        ) as arender, mock.patch("insight_ui.views.sync_to_async") as to_sync:
+            response = await self.async_client.post("/", {"name": "Anna"})
+        self.assertEqual(response.status_code, 200)
+        arender.assert_called_once()
+        self.assertIn("email", arender.call_args.args[2]["form_errors"])
+        to_sync.assert_not_called()
+
+    async def test_normal_submit_keeps_its_message(self):
+        """Die Erfolgsmeldung des normalen Formulars wird nicht überschrieben."""
+        with mock.patch("insight_ui.views.arender", wraps=views.arender) as arender:
+            response = await self.async_client.post(
+                "/", {"name": "Anna", "email": "anna@example.com"}
+            )
+        self.assertEqual(response.status_code, 200)
+        success = arender.call_args.args[2]["form_success"]
+        self.assertEqual(
+            success["message"],
+            translation.gettext("Normales Formular erfolgreich übermittelt!"),
+        )
+        self.assertEqual(success["type"], "success")
+        self.assertIn("/api/form-status/", success["status_url"])
+        await sync_to_async(get_submission_pipeline().join)()
+
+    def test_queue_metrics(self):
+        """Die Kennzahlen der Warteschlange sind abrufbar."""
+        data = self.client.get("/api/form-queue/").json()
+        self.assertIn("queue_depth", data)
+        self.assertIn("workers", data)
@@ -0,0 +1,89 @@
+"""Tests für den WebSocket-Live-Feed der ASGI-Anwendung."""
+
+import asyncio
+from contextlib import aclosing, suppress
+
+from django.test import TestCase, override_settings
+
+from core.asgi import application
+from insight_ui.websocket import SystemSampler, get_system_sampler
+
+
+async def run_asgi(scope, events):
+    """Führt die ASGI-Anwendung mit vorgegebenen Eingangs-Ereignissen aus."""
+    inbox, outbox = asyncio.Queue(), asyncio.Queue()
+    for event in events:
+        inbox.put_nowait(event)
+    task = asyncio.create_task(application(scope, inbox.get, outbox.put))
+    return task, inbox, outbox
+
+
+@override_settings(INSIGHT_UI={"websocket_feed": {"interval": 0.01}})
+class WebsocketFeedTest(TestCase):
+    """Tests für Routing, Lifespan und die Verteilung des Feeds."""
+
+    async def test_feed_targets_element(self):
+        """Der Feed liefert einen Out-of-Band-Swap für das gewählte Element."""
+        scope = {
+            "type": "websocket",
+            "path": "/ws/live/",
+            "query_string": b"target=demo",
+        }
+        task, inbox, outbox = await run_asgi(scope, [{"type": "websocket.connect"}])
+
+        self.assertEqual(await outbox.get(), {"type": "websocket.accept"})
+        message = await asyncio.wait_for(outbox.get(), 2)
+        self.assertIn('id="demo-output" hx-swap-oob="innerHTML"', message["text"])
+        self.assertEqual(get_system_sampler().connections, 1)
+
+        inbox.put_nowait({"type": "websocket.disconnect", "code": 1000})
+        await asyncio.wait_for(task, 2)
+        self.assertEqual(get_system_sampler().connections, 0)
+        await get_system_sampler().stop()
+
+    async def test_unknown_route_is_rejected(self):
+        """Unbekannte Pfade werden vor dem Accept geschlossen."""
+        scope = {"type": "websocket", "path": "/ws/unknown/", "query_string": b""}
+        task, _, outbox = await run_asgi(scope, [{"type": "websocket.connect"}])
+        await task
+        self.assertEqual((await outbox.get())["type"], "websocket.close")
+
+    async def test_lifespan_starts_and_stops_sampler(self):
+        """Der Sampler läuft von lifespan.startup bis lifespan.shutdown."""
+        task, inbox, outbox = await run_asgi(
+            {"type": "lifespan"}, [{"type": "lifespan.startup"}]
+        )
+        self.assertEqual(await outbox.get(), {"type": "lifespan.startup.complete"})
+        self.assertFalse(get_system_sampler().task.done())
+
+        inbox.put_nowait({"type": "lifespan.shutdown"})
+        self.assertEqual(await outbox.get(), {"type": "lifespan.shutdown.complete"})
+        await task
+        self.assertIsNone(get_system_sampler().task)
+
+    async def test_setting_change_cancels_sampler(self):
+        """Eine Änderung von INSIGHT_UI beendet den Task des alten Samplers."""
+        sampler = get_system_sampler()
+        sampler.start()
+        task = sampler.task
+        with self.settings(INSIGHT_UI={"websocket_feed": {"interval": 0.02}}):
+            self.assertIsNot(get_system_sampler(), sampler)
+        with suppress(asyncio.CancelledError):
+            await asyncio.wait_for(task, 2)
+        self.assertTrue(task.cancelled())
+        self.assertIsNone(sampler.task)
+
+    async def test_idle_without_subscribers(self):
+        """Ohne Verbindungen misst der Sampler nicht; der erste Abonnent weckt ihn."""
+        sampler = SystemSampler(interval=0.01)
+        sampler.start()
+        try:
+            await asyncio.sleep(0.05)
+            self.assertEqual(sampler.ticks, 0)
+
+            async with aclosing(sampler.subscribe("demo")) as messages:
+                message = await asyncio.wait_for(anext(messages), 2)
+            self.assertIn('id="demo-output"', message)
+            self.assertEqual(sampler.ticks, 1)
+        finally:
+            await sampler.stop()
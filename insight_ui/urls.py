@@ -5,13 +5,37 @@ from . import views
 
 urlpatterns = [
     path("api/live-data/", views.live_data_view, name="live_data"),
+    path("api/live-data/<str:name>/", views.live_data_view, name="live_data_source"),
+    path("api/live-events/", views.live_events_view, name="live_events"),
+    path(
+        "api/live-events/<str:name>/",
+        views.live_events_view,
+        name="live_events_source",
+    ),
     path("api/more-items/", views.more_items_view, name="more_items"),
+    path("api/table-stream/", views.table_stream_view, name="table_stream"),
+    path("api/table-data/<str:name>/", views.table_data_view, name="table_data"),
     path("api/form-submit/", views.htmx_form_submit, name="htmx_form_submit"),
+    path(
+        "api/form-status/<str:submission_id>/",
+        views.form_status_view,
+        name="form_status",
+    ),
+    path(
+        "api/form-queue/",
+        views.form_queue_metrics_view,
+        name="form_queue_metrics",
+    ),
     path(
         "api/normal-form-submit/",
         views.normal_form_submit,
         name="normal_form_submit",
     ),
+    path(
+        "components/render/<str:token>/",
+        views.component_render_view,
+        name="component_render",
+    ),
     path(
         "components/<str:component_name>/",
         views.component_demo_view,
@@ -1,246 +1,221 @@
-import asyncio
 import logging
 import random
 import time
-from datetime import datetime
+from contextlib import aclosing
+from functools import partial
 from asgiref.sync import sync_to_async
-from django.http import HttpResponse, JsonResponse
-from django.utils.translation import activate
-from django.shortcuts import render
+from django.core import signing
+from django.http import HttpResponse, JsonResponse, StreamingHttpResponse
+from django.utils.translation import activate, get_language
+from django.template.context_processors import csrf
 from django.template.loader import render_to_string
-from django.utils.safestring import mark_safe
+from django.urls import reverse
+from django.utils.cache import get_conditional_response, patch_vary_headers
 from django.utils.translation import gettext as _
+from django.utils.translation import gettext_lazy
 from django.views.decorators.http import require_GET, require_http_methods
 
+from .broadcast import get_live_hub
+from .cache import fragment_cache_key, fragment_response
+from .components import load_deferred_component
+from .context import storybook_context
+from .events import log_submission_event
+from .live import (
+    LIVE_VERSION_HEADER,
+    ClockLiveDataProvider,
+    arender_live_fragment,
+    get_live_provider,
+    register_live_provider,
+)
+from .pagination import CursorPaginator, InvalidCursor
+from .rendering import arender, arender_to_string, run_in_render_pool
+from .submissions import PipelineFull, get_submission_pipeline
+from .tables import (
+    TableDataSource,
+    astream_table,
+    get_table_source,
+    register_table_source,
+)
+
 logger = logging.getLogger(__name__)
 
 
 def get_storybook_context():
-    """Hilfsfunktion für Index-Seiten Context"""
-    return {
-        "nav_links": [
-            {"text": _("Startseite"), "url": "/", "active": True},
-            {"text": _("Storybook"), "url": "/components/", "active": False},
-            {"text": _("Dokumentation"), "url": "/docs/", "active": False},
-        ],
-        "breadcrumb_items": [
-            {"text": _("Startseite"), "url": "/"},
-            {"text": _("Demo"), "url": "/demo/"},
-            {"text": _("Komponenten"), "url": None, "active": True},
-        ],
-        "table_headers": [_("Name"), _("E-Mail"), _("Status"), _("Aktionen")],
-        "table_rows": [
-            [
-                "Max Mustermann",
-                "max@example.com",
-                _("Aktiv"),
-                mark_safe('<button class="btn btn-sm">Bearbeiten</button>'),
-            ],
-            [
-                "Anna Schmidt",
-                "anna@example.com",
-                _("Inaktiv"),
-                mark_safe('<button class="btn btn-sm">Bearbeiten</button>'),
-            ],
-            [
-                "Tom Weber",
-                "tom@example.com",
-                _("Aktiv"),
-                mark_safe('<button class="btn btn-sm">Bearbeiten</button>'),
-            ],
-        ],
-        "card_actions": [
-            {"text": _("Mehr erfahren"), "url": "#", "type": "primary"},
-            {"text": _("Teilen"), "url": "#", "type": "secondary"},
-        ],
-        "form_fields": [
-            {
-                "type": "text",
-                "name": "name",
-                "label": _("Name"),
-                "placeholder": _("Ihr vollständiger Name"),
-                "required": True,
-            },
-            {
-                "type": "email",
-                "name": "email",
-                "label": _("E-Mail"),
-                "placeholder": _("ihre.email@example.com"),
-                "required": True,
-            },
-            {
-                "type": "textarea",
-                "name": "message",
-                "label": _("Nachricht"),
-                "placeholder": _("Ihre Nachricht..."),
-                "rows": 4,
-            },
-        ],
-        "form_actions": [
-            {"text": _("Absenden"), "type": "submit", "style": "primary"},
-            {"text": _("Zurücksetzen"), "type": "reset", "style": "secondary"},
-        ],
-        "modal_actions": [
-            {"text": _("Speichern"), "type": "primary"},
-            {"text": _("Abbrechen"), "type": "cancel", "dismiss": True},
-        ],
-        "confirm_modal_actions": [
-            {
-                "text": _("Ja, fortfahren"),
-                "type": "primary",
-                "onclick": 'alert("Aktion bestätigt!")',
-            },
-            {"text": _("Abbrechen"), "type": "cancel", "dismiss": True},
-        ],
-        "right_sidebar_items": [
-            {"text": _("Benachrichtigungen"), "icon": "🔔", "badge": "3"},
-            {"text": _("Nachrichten"), "icon": "💬", "badge": "12"},
-            {"text": _("Aufgaben"), "icon": "✅", "badge": "5"},
-            {"text": _("Kalender"), "icon": "📅"},
-            {"text": _("Einstellungen"), "icon": "⚙️"},
-            {"text": _("Profil"), "icon": "👤"},
-        ],
-        "sidebar_items": [
-            {"text": _("Dashboard"), "url": "/", "icon": "📊"},
-            {"text": _("Benutzer"), "url": "/users/", "icon": "👥"},
-            {"text": _("Einstellungen"), "url": "/settings/", "icon": "⚙️"},
-            {"text": _("Hilfe"), "url": "/help/", "icon": "❓"},
-        ],
-        "scroll_items": [
-            {"title": f"Element {i}", "content": f"Inhalt für Element {i}"}
-            for i in range(1, 11)
-        ],
-        "htmx_form_fields": [
-            {
-                "type": "text",
-                "name": "htmx_name",
-                "label": _("Name (HTMX)"),
-                "placeholder": _("Name eingeben"),
-                "required": True,
-            },
-            {
-                "type": "email",
-                "name": "htmx_email",
-                "label": _("E-Mail (HTMX)"),
-                "placeholder": _("E-Mail eingeben"),
-                "required": True,
-            },
-            {
-                "type": "textarea",
-                "name": "message",
-                "label": _("Nachricht (HTMX)"),
-                "placeholder": _("Ihre Nachricht..."),
-                "rows": 4,
-                "required": False,
-            },
-        ],
-        "htmx_config": {
-            "url": "/api/form-submit/",
-            "method": "post",
-            "target": "#form-result",
-            "swap": "innerHTML",
-        },
-        "available_languages": [
-            {"code": "de", "name": "Deutsch"},
-            {"code": "en", "name": "English"},
-            {"code": "es", "name": "Español"},
-            {"code": "fr", "name": "Français"},
-            {"code": "ar", "name": "العربية"},
-            {"code": "zh", "name": "中文"},
-        ],
-    }
+    """Hilfsfunktion für Index-Seiten Context (flache Kopie pro Request)"""
+    return storybook_context.copy()
 
 
-@require_http_methods(["GET"])
-def live_data_view(request):
-    """HTMX Endpoint für Live-Daten"""
-    current_time = datetime.now().strftime("%H:%M:%S")
-    data = {
-        "time": current_time,
-        "message": _("Daten aktualisiert um %(time)s") % {"time": current_time},
-        "status": "success",
-    }
+register_live_provider(ClockLiveDataProvider("default", interval=5))
 
-    if request.headers.get("HX-Request"):
-        # HTMX Request - nur den Inhalt zurückgeben
-        html = render_to_string(
-            "insight_ui/components/live_content_partial.html",
-            {"data": data, "timestamp": current_time},
-        )
-        return HttpResponse(html)
 
-    # Normale Request - JSON zurückgeben
-    return JsonResponse(data)
+@require_http_methods(["GET"])
+async def live_data_view(request, name="default"):
+    """HTMX Endpoint für Live-Daten (rendert nur, wenn sich die Version ändert)"""
+    try:
+        provider = get_live_provider(name)
+    except KeyError:
+        return JsonResponse({"error": _("Unbekannte Datenquelle")}, status=404)
+
+    version = await provider.aversion()
+    language = get_language()
+    is_htmx = bool(request.headers.get("HX-Request"))
+    etag = provider.etag(version, language, "html" if is_htmx else "json")
+
+    if is_htmx and request.headers.get(LIVE_VERSION_HEADER) == version:
+        # Unverändert: bei 204 lässt HTMX den bisherigen Inhalt stehen
+        response = HttpResponse(status=204)
+    else:
+        response = get_conditional_response(request, etag=etag)
+
+    if response is None:
+        if is_htmx:
+            # HTMX Request - Fragment einmal pro Version und Sprache rendern
+            fragment = await arender_live_fragment(provider, version)
+            response = HttpResponse(fragment.content)
+        else:
+            # Normale Request - JSON zurückgeben
+            data = await provider.aget_data(version)
+            response = JsonResponse(data)
+
+    response["ETag"] = etag
+    response[LIVE_VERSION_HEADER] = version
+    response["Cache-Control"] = "no-cache"
+    patch_vary_headers(response, ("HX-Request", "Accept-Language"))
+    return response
 
 
 @require_http_methods(["GET"])
-def more_items_view(request):
-    """HTMX Endpoint für Infinite Scroll"""
-    page = int(request.GET.get("page", 1))
-    items_per_page = 5
+async def live_events_view(request, name="default"):
+    """SSE Endpoint für Live-Daten: ein Render pro Änderung für alle Verbindungen"""
+    try:
+        provider = get_live_provider(name)
+    except KeyError:
+        return JsonResponse({"error": _("Unbekannte Datenquelle")}, status=404)
+
+    hub = get_live_hub()
+    language = get_language()
+
+    async def events():
+        # Wiederverbindung des Browsers nach Abbruch in Millisekunden
+        yield "retry: 5000\n\n"
+        async with aclosing(hub.subscribe(provider, language)) as messages:
+            async for message in messages:
+                yield message
+
+    response = StreamingHttpResponse(events(), content_type="text/event-stream")
+    response["Cache-Control"] = "no-cache"
+    response["X-Accel-Buffering"] = "no"
+    return response
 
-    # Simuliere mehr Items
-    start = (page - 1) * items_per_page + 11  # +11 weil wir schon 10 Items haben
-    end = start + items_per_page
 
-    new_items = [
-        {
-            "title": f"Element {i}",
-            "content": f"Dynamisch geladener Inhalt für Element {i}",
-        }
-        for i in range(start, end)
-    ]
+# Simulierte Datenquelle: 10 Items sind bereits auf der Seite, 25 weitere folgen
+DEMO_SCROLL_ITEMS = [
+    {
+        "title": f"Element {i}",
+        "content": f"Dynamisch geladener Inhalt für Element {i}",
+    }
+    for i in range(11, 36)
+]
+
+
+# Beispiel-Datenquelle für die serverseitig sortier- und filterbare Tabelle
+register_table_source(
+    TableDataSource(
+        "demo",
+        headers=[
+            gettext_lazy("Name"),
+            gettext_lazy("Status"),
+            gettext_lazy("Nummer"),
+        ],
+        rows=[
+            (f"Element {i}", "Aktiv" if i % 2 == 0 else "Inaktiv", i)
+            for i in range(1, 1001)
+        ],
+        per_page=50,
+    )
+)
 
-    has_next = page < 5  # Simuliere max 5 Seiten
-    next_url = f"/api/more-items/?page={page + 1}" if has_next else ""
+
+@require_http_methods(["GET"])
+async def more_items_view(request):
+    """HTMX Endpoint für Infinite Scroll (Cursor-Paginierung)"""
+    paginator = CursorPaginator(
+        DEMO_SCROLL_ITEMS, per_page=5, prefetch=True, name="demo-scroll-items"
+    )
+    try:
+        page = await run_in_render_pool(paginator.page, request.GET.get("cursor"))
+    except InvalidCursor:
+        return JsonResponse({"error": _("Ungültiger Cursor")}, status=400)
+
+    context = page.as_context(request.path)
 
     if request.headers.get("HX-Request"):
-        html = render_to_string(
-            "insight_ui/components/infinite_scroll_items.html",
-            {
-                "items": new_items,
-                "next_url": next_url,
-                "has_next": has_next,
-                "page": page + 1,
-            },
+        html = await arender_to_string(
+            "insight_ui/components/infinite_scroll_items.html", context
         )
         return HttpResponse(html)
 
-    return JsonResponse(
-        {"items": new_items, "has_next": has_next, "next_url": next_url}
+    return JsonResponse(context)
+
+
+@require_http_methods(["GET"])
+async def table_stream_view(request):
+    """Streamt eine große Beispiel-Tabelle blockweise an den Client"""
+    try:
+        count = min(int(request.GET.get("rows", 1000)), 100_000)
+    except ValueError:
+        count = 1000
+
+    rows = (
+        (f"Element {i}", _("Aktiv") if i % 2 == 0 else _("Inaktiv"), i)
+        for i in range(1, count + 1)
+    )
+    return astream_table(
+        rows,
+        headers=[_("Name"), _("Status"), _("Nummer")],
+        caption=_("Beispiel-Tabelle"),
+    )
+
+
+@require_http_methods(["GET"])
+async def table_data_view(request, name):
+    """HTMX Endpoint: sortiertes, gefiltertes Tabellenfenster als <tbody>"""
+    try:
+        source = get_table_source(name)
+    except KeyError:
+        return JsonResponse({"error": _("Tabelle nicht gefunden")}, status=404)
+
+    def int_param(key, default=None):
+        try:
+            return int(request.GET[key])
+        except (KeyError, ValueError):
+            return default
+
+    # QuerySet-Quellen brauchen sync_to_async, In-Memory-Filter den Render-Pool
+    if source.queryset is not None:
+        window_for = sync_to_async(source.window)
+    else:
+        window_for = partial(run_in_render_pool, source.window)
+    window = await window_for(
+        page=int_param("page", 1),
+        sort=int_param("sort"),
+        direction=request.GET.get("dir", "asc"),
+        query=request.GET.get("q", ""),
+    )
+    return await arender(
+        request, "insight_ui/components/table_data.html", window.as_context()
     )
 
 
 @require_http_methods(["POST"])
 async def htmx_form_submit(request):
-    """HTMX Endpoint für Formular-Übermittlung mit asynchronem Logging"""
-    logger = logging.getLogger(__name__)
-
+    """HTMX Endpoint für Formular-Übermittlung mit Verarbeitung im Hintergrund"""
     if request.headers.get("HX-Request"):
-        # Debug: Alle POST-Daten loggen
-        post_data = await sync_to_async(lambda: dict(request.POST))()
-        content_type = request.content_type
-
-        print(f"[HTMX FORM] Empfangene POST-Daten: {request.POST}")
-        print(f"[HTMX FORM] Content-Type: {content_type}")
-        logger.info(f"Empfangene POST-Daten: {request.POST}")
-        logger.info(f"Content-Type: {content_type}")
-
         # Eingabedaten extrahieren
         name = request.POST.get("htmx_name", "")
         email = request.POST.get("htmx_email", "")
         message = request.POST.get("message", "")
 
-        print(
-            f"[HTMX FORM] Extrahierte Werte - Name: '{name}', Email: '{email}', Message: '{message}'"
-        )
-        logger.info(
-            f"Extrahierte Werte - Name: '{name}', Email: '{email}', Message: '{message}'"
-        )
-
-        # Asynchrones Logging der Eingabedaten
-        await log_form_input_async(name, email, message, logger)
-
         # Einfache Validierung
         errors = {}
         if not name:
@@ -250,33 +225,39 @@ async def htmx_form_submit(request):
         elif "@" not in email:
             errors["htmx_email"] = _("Ungültige E-Mail-Adresse")
 
+        # Ein strukturiertes Ereignis pro Übermittlung, geschrieben im Hintergrund
+        log_submission_event("htmx", name, email, message, errors)
+
         if errors:
-            logger.warning(f"Formular-Validierungsfehler: {errors}")
             # Fehler zurückgeben
-            html = await sync_to_async(render_to_string)(
+            html = await arender_to_string(
                 "insight_ui/components/form_errors.html",
                 {"errors": errors, "type": "error"},
             )
             response = HttpResponse(html, status=400)
             return response
 
-        # Erfolg simulieren mit asynchroner Verarbeitung
-        await asyncio.sleep(1)  # Simuliere asynchrone Verarbeitungszeit
-
-        print("[HTMX FORM] Formular erfolgreich verarbeitet")
-        logger.info("Formular erfolgreich verarbeitet")
-        success_html = await sync_to_async(render_to_string)(
-            "insight_ui/components/form_success.html",
-            {
-                "message": _("Formular erfolgreich übermittelt!"),
-                "name": name,
-                "email": email,
-                "type": "success",
-            },
+        # Verarbeitung in die Hintergrund-Pipeline geben und sofort antworten
+        try:
+            submission = get_submission_pipeline().submit(
+                "htmx",
+                {"name": name, "email": email, "message": message},
+                process_form_submission,
+            )
+        except PipelineFull:
+            logger.warning("Formular abgelehnt: Warteschlange voll")
+            html = await arender_to_string(
+                "insight_ui/components/form_errors.html",
+                {"errors": {"queue": _("Server ausgelastet, bitte später erneut")}},
+            )
+            return HttpResponse(html, status=503)
+
+        html = await arender_to_string(
+            "insight_ui/components/form_status.html",
+            get_form_status_context(submission),
         )
-        # Erfolgreiche Antwort ohne Redirect - bleibt auf der Seite
-        response = HttpResponse(success_html)
-        return response
+        # 202: angenommen, das Status-Fragment fragt den Fortschritt ab
+        return HttpResponse(html, status=202)
 
     logger.warning("Nicht-HTMX Request an htmx_form_submit erhalten")
     response = JsonResponse({"error": _("Nur HTMX-Requests erlaubt")}, status=400)
@@ -284,31 +265,13 @@ async def htmx_form_submit(request):
 
 
 @require_http_methods(["POST"])
-def normal_form_submit(request):
-    """Normale Formular-Übermittlung mit synchronem Logging"""
-    logger = logging.getLogger(__name__)
-
-    # Debug: Alle POST-Daten loggen
-    print(f"[NORMAL FORM] Empfangene POST-Daten: {dict(request.POST)}")
-    print(f"[NORMAL FORM] Content-Type: {request.content_type}")
-    logger.info(f"Empfangene POST-Daten: {dict(request.POST)}")
-    logger.info(f"Content-Type: {request.content_type}")
-
+async def normal_form_submit(request):
+    """Normale Formular-Übermittlung mit Verarbeitung im Hintergrund"""
     # Eingabedaten extrahieren
     name = request.POST.get("name", "")
     email = request.POST.get("email", "")
     message = request.POST.get("message", "")
 
-    print(
-        f"[NORMAL FORM] Extrahierte Werte - Name: '{name}', Email: '{email}', Message: '{message}'"
-    )
-    logger.info(
-        f"Extrahierte Werte - Name: '{name}', Email: '{email}', Message: '{message}'"
-    )
-
-    # Synchrones Logging der Eingabedaten
-    log_form_input_sync(name, email, message, logger)
-
     # Einfache Validierung
     errors = {}
     if not name:
@@ -318,144 +281,92 @@ def normal_form_submit(request):
     elif "@" not in email:
         errors["email"] = _("Ungültige E-Mail-Adresse")
 
+    # Ein strukturiertes Ereignis pro Übermittlung, geschrieben im Hintergrund
+    log_submission_event("normal", name, email, message, errors)
+
+    submission = None
+    if not errors:
+        try:
+            submission = get_submission_pipeline().submit(
+                "normal",
+                {"name": name, "email": email, "message": message},
+                process_form_submission,
+            )
+        except PipelineFull:
+            logger.warning("Formular abgelehnt: Warteschlange voll")
+            errors["form"] = _("Server ausgelastet, bitte später erneut")
+
     if errors:
-        logger.warning(f"Formular-Validierungsfehler: {errors}")
         # Bei Fehlern die komplette Seite mit Fehlermeldungen rendern
         context = get_storybook_context()
         context["form_errors"] = errors
         context["form_data"] = {"name": name, "email": email, "message": message}
-        return render(request, "index.html", context)
-
-    # Erfolg simulieren mit synchroner Verarbeitung
-    time.sleep(1)  # Simuliere synchrone Verarbeitungszeit
+        return await arender(request, "index.html", context)
 
-    print("[NORMAL FORM] Normales Formular erfolgreich verarbeitet")
-    logger.info("Normales Formular erfolgreich verarbeitet")
-
-    # Bei erfolgreichem Submit die komplette Seite mit Erfolgsmeldung rendern
+    # Seite sofort mit dem Status der angenommenen Übermittlung rendern
     context = get_storybook_context()
     context["form_success"] = {
+        **get_form_status_context(submission),
         "message": _("Normales Formular erfolgreich übermittelt!"),
         "name": name,
         "email": email,
         "type": "success",
     }
 
-    return render(request, "index.html", context)
+    return await arender(request, "index.html", context)
 
 
-def log_form_input_sync(name, email, message, logger) -> None:
+def process_form_submission(name, email, message) -> None:
     """
-    Synchrone Funktion zum Loggen der Formular-Eingaben
+    Verarbeitet eine validierte Übermittlung in der Submission-Pipeline
 
     Args:
         name (str): Name des Benutzers
         email (str): E-Mail-Adresse des Benutzers
         message (str): Nachricht des Benutzers
-        logger: Logger-Instanz
-    """
-    # Simuliere synchrone Verarbeitung
-    time.sleep(0.1)
-
-    # Detailliertes Logging der Eingabedaten - sowohl print als auch logger
-    separator = "=" * 50
-    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-
-    print(separator)
-    print("NORMALES Kontaktformular - Neue Eingabe erhalten")
-    print(separator)
-    print(f"Zeitstempel: {timestamp}")
-    print(f"Name: {name}")
-    print(f"E-Mail: {email}")
-    print(f"Nachricht: {message}")
-    print(f"Name-Länge: {len(name)} Zeichen")
-    print(f"E-Mail-Länge: {len(email)} Zeichen")
-    print(f"Nachricht-Länge: {len(message)} Zeichen")
-
-    logger.info(separator)
-    logger.info("NORMALES Kontaktformular - Neue Eingabe erhalten")
-    logger.info(separator)
-    logger.info(f"Zeitstempel: {timestamp}")
-    logger.info(f"Name: {name}")
-    logger.info(f"E-Mail: {email}")
-    logger.info(f"Nachricht: {message}")
-    logger.info(f"Name-Länge: {len(name)} Zeichen")
-    logger.info(f"E-Mail-Länge: {len(email)} Zeichen")
-    logger.info(f"Nachricht-Länge: {len(message)} Zeichen")
-
-    # Zusätzliche Validierungsinfos
-    if "@" in email:
-        email_parts = email.split("@")
-        domain = email_parts[1] if len(email_parts) > 1 else "Unbekannt"
-        print(f"E-Mail Domain: {domain}")
-        logger.info(f"E-Mail Domain: {domain}")
-
-    print(separator)
-    logger.info(separator)
-
-    # Simuliere weitere synchrone Verarbeitung
-    time.sleep(0.05)
-    print("Synchrones Logging abgeschlossen")
-    logger.debug("Synchrones Logging abgeschlossen")
-
-
-async def log_form_input_async(name, email, message, logger) -> None:
     """
-    Asynchrone Funktion zum Loggen der Formular-Eingaben
+    # Simuliere Verarbeitungszeit - läuft im Worker, nicht im Request
+    time.sleep(1)
+    logger.debug("Formular erfolgreich verarbeitet")
+
+
+def get_form_status_context(submission):
+    """Hilfsfunktion für den Kontext des Status-Fragments"""
+    return {
+        "submission": submission,
+        "status_url": reverse("form_status", args=[submission.id]),
+        "message": _("Formular erfolgreich übermittelt!"),
+        "name": submission.payload["name"],
+        "email": submission.payload["email"],
+        "failure_errors": {"form": _("Verarbeitung fehlgeschlagen")},
+    }
 
-    Args:
-        name (str): Name des Benutzers
-        email (str): E-Mail-Adresse des Benutzers
-        message (str): Nachricht des Benutzers
-        logger: Logger-Instanz
-    """
-    # Simuliere asynchrone Verarbeitung
-    await asyncio.sleep(0.1)
-
-    # Detailliertes Logging der Eingabedaten - sowohl print als auch logger
-    separator = "=" * 50
-    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-
-    print(separator)
-    print("HTMX Kontaktformular - Neue Eingabe erhalten")
-    print(separator)
-    print(f"Zeitstempel: {timestamp}")
-    print(f"Name: {name}")
-    print(f"E-Mail: {email}")
-    print(f"Nachricht: {message}")
-    print(f"Name-Länge: {len(name)} Zeichen")
-    print(f"E-Mail-Länge: {len(email)} Zeichen")
-    print(f"Nachricht-Länge: {len(message)} Zeichen")
-
-    logger.info(separator)
-    logger.info("HTMX Kontaktformular - Neue Eingabe erhalten")
-    logger.info(separator)
-    logger.info(f"Zeitstempel: {timestamp}")
-    logger.info(f"Name: {name}")
-    logger.info(f"E-Mail: {email}")
-    logger.info(f"Nachricht: {message}")
-    logger.info(f"Name-Länge: {len(name)} Zeichen")
-    logger.info(f"E-Mail-Länge: {len(email)} Zeichen")
-    logger.info(f"Nachricht-Länge: {len(message)} Zeichen")
-
-    # Zusätzliche Validierungsinfos
-    if "@" in email:
-        email_parts = email.split("@")
-        domain = email_parts[1] if len(email_parts) > 1 else "Unbekannt"
-        print(f"E-Mail Domain: {domain}")
-        logger.info(f"E-Mail Domain: {domain}")
-
-    print(separator)
-    logger.info(separator)
-
-    # Simuliere weitere asynchrone Verarbeitung
-    await asyncio.sleep(0.05)
-    print("Asynchrones Logging abgeschlossen")
-    logger.debug("Asynchrones Logging abgeschlossen")
+
+@require_http_methods(["GET"])
+async def form_status_view(request, submission_id):
+    """HTMX Endpoint: Verarbeitungsstatus einer Formular-Übermittlung"""
+    submission = get_submission_pipeline().get(submission_id)
+    if submission is None:
+        return JsonResponse({"error": _("Übermittlung nicht gefunden")}, status=404)
+
+    if request.headers.get("HX-Request"):
+        html = await arender_to_string(
+            "insight_ui/components/form_status.html",
+            get_form_status_context(submission),
+        )
+        return HttpResponse(html)
+
+    return JsonResponse({"id": submission.id, "status": submission.status})
 
 
 @require_http_methods(["GET"])
-def component_demo_view(request, component_name):
+async def form_queue_metrics_view(request):
+    """Kennzahlen der Submission-Pipeline (Warteschlangentiefe etc.)"""
+    return JsonResponse(get_submission_pipeline().metrics())
+
+
+@require_http_methods(["GET"])
+async def component_demo_view(request, component_name):
     """Einzelne Storybook-Demo für HTMX"""
     component_templates = {
         "alert": "insight_ui/components/alert.html",
@@ -471,23 +382,44 @@ def component_demo_view(request, component_name):
     if component_name not in component_templates:
         return JsonResponse({"error": _("Komponente nicht gefunden")}, status=404)
 
-    # Beispieldaten für die jeweilige Komponente
-    context = get_component_context(component_name)
+    hx_request = bool(request.headers.get("HX-Request"))
 
-    if request.headers.get("HX-Request"):
+    def render_component():
+        # Beispieldaten für die jeweilige Komponente
+        context = get_component_context(component_name)
         html = render_to_string(component_templates[component_name], context)
-        return HttpResponse(html)
+        if hx_request:
+            return html
+        return render_to_string(
+            "insight_ui/component_demo.html",
+            {"component_name": component_name, "component_html": html},
+        )
 
-    return render(
-        request,
-        "insight_ui/component_demo.html",
-        {
-            "component_name": component_name,
-            "component_html": render_to_string(
-                component_templates[component_name], context
-            ),
-        },
-    )
+    def respond():
+        key = fragment_cache_key(
+            "components", component_name, get_language(), int(hx_request)
+        )
+        return fragment_response(request, key, render_component)
+
+    # Cache-Zugriff und Rendern laufen gemeinsam im Render-Pool
+    return await run_in_render_pool(respond)
+
+
+@require_GET
+async def component_render_view(request, token):
+    """HTMX Endpoint: Rendert eine per lazy=True verzögerte Komponente"""
+    try:
+        deferred = load_deferred_component(token)
+    except (signing.BadSignature, KeyError):
+        return JsonResponse({"error": _("Komponente nicht gefunden")}, status=404)
+
+    def render_component():
+        context = deferred.component.standalone_context()
+        # Formulare erhalten das CSRF-Token dieses Requests
+        context.update(csrf(request))
+        return deferred.render(context)
+
+    return HttpResponse(await run_in_render_pool(render_component))
 
 
 def get_component_context(component_name):
@@ -563,12 +495,12 @@ def get_component_context(component_name):
 
     return contexts.get(component_name, {})
 
-def storybook_view(request):
+async def storybook_view(request):
     """Hauptseite mit allen Insight UI Komponenten"""
 
     # Wenn es ein POST-Request ist, leite an normale Formular-Verarbeitung weiter
     if request.method == "POST":
-        return normal_form_submit(request)
+        return await normal_form_submit(request)
 
     # Beispieldaten für die Komponenten
     context = get_storybook_context()
@@ -579,8 +511,8 @@ def storybook_view(request):
     context["table_headers"] = headers
     context["table_rows"] = rows
     context["toggle_current_view"] = "table"
-    
-    return render(request, "index.html", context)
+
+    return await arender(request, "index.html", context)
 
 def generate_random_payload():
     """Erstellt eine zufällige Anzahl von Einträgen als Payload-Daten."""
@@ -625,7 +557,7 @@ def map_payload_to_table(payload):
     return headers, rows
 
 @require_GET
-def toggle_view(request):
+async def toggle_view(request):
     """
     Toggle between table and card views, based on the `view` GET parameter.
     Loads and maps payload data to the appropriate format.
@@ -644,11 +576,15 @@ def toggle_view(request):
     if view == "card":
         context["cards"] = map_payload_to_cards(payload)
         logger.info("log: toggle_view – Kartenansicht ausgewählt")
-        return render(request, "insight_ui/components/toggle_view_cards.html", context)
+        return await arender(
+            request, "insight_ui/components/toggle_view_cards.html", context
+        )
 
     else:  # default: table view
         headers, rows = map_payload_to_table(payload)
         context["table_headers"] = headers
         context["table_rows"] = rows
         logger.info("log: toggle_view – Tabellenansicht ausgewählt")
-        return render(request, "insight_ui/components/toggle_view_table.html", context)
+        return await arender(
+            request, "insight_ui/components/toggle_view_table.html", context
+        )
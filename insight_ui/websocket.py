@@ -0,0 +1,254 @@
+"""Live-Systemdaten per WebSocket direkt aus der Django-ASGI-Anwendung."""
+
+import asyncio
+import logging
+import re
+import shutil
+import threading
+from collections import defaultdict
+from contextlib import aclosing, suppress
+from datetime import datetime
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Optional, Set
+from urllib.parse import parse_qs
+
+from django.conf import settings
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+from django.template.loader import render_to_string
+from django.utils import translation
+from django.utils.html import format_html
+from django.utils.safestring import mark_safe
+
+from .conf import get_config
+from .rendering import run_in_render_pool
+
+try:
+    import psutil
+except ImportError:  # pragma: no cover - optionale Abhängigkeit
+    psutil = None
+
+logger = logging.getLogger(__name__)
+
+Receive = Callable[[], Awaitable[Dict[str, Any]]]
+Send = Callable[[Dict[str, Any]], Awaitable[None]]
+
+SNAPSHOT_TEMPLATE = "insight_ui/components/websocket_snapshot.html"
+DEFAULT_TARGET = "insight-websocket"
+TARGET_PATTERN = re.compile(r"^[A-Za-z][\w-]*$")
+
+
+def read_system_info() -> Dict[str, Any]:
+    """
+    Liest Festplatten- und Speicherauslastung (blockierend).
+
+    Ohne ``psutil`` fehlen die Speicherangaben.
+    """
+    disk = shutil.disk_usage("/")
+    info: Dict[str, Any] = {
+        "timestamp": datetime.now(),
+        "disk": {
+            "total_gb": round(disk.total / 2**30, 2),
+            "used_gb": round(disk.used / 2**30, 2),
+            "free_gb": round(disk.free / 2**30, 2),
+        },
+        "memory": None,
+    }
+    if psutil is not None:
+        memory = psutil.virtual_memory()
+        info["memory"] = {
+            "total_gb": round(memory.total / 2**30, 2),
+            "available_gb": round(memory.available / 2**30, 2),
+            "percent_used": memory.percent,
+        }
+    return info
+
+
+class SystemSampler:
+    """
+    Misst einmal pro Tick und verteilt an alle Verbindungen des Prozesses.
+
+    Das Fragment wird einmal pro Tick gerendert; pro Ziel-Element kommt nur
+    der Out-of-Band-Wrapper hinzu. Jede Verbindung hat eine Queue der Größe 1,
+    langsame Clients erhalten also nur den neuesten Stand. Ohne Verbindungen
+    ruht der Sampler bis zum nächsten Abonnenten.
+
+    Args:
+        interval: Sekunden zwischen zwei Messungen
+    """
+
+    def __init__(self, interval: float = 5.0) -> None:
+        self.interval = interval
+        self.subscribers: Dict[str, Set["asyncio.Queue[str]"]] = defaultdict(set)
+        self.body: Optional[str] = None
+        self.ticks = 0
+        self.task: Optional["asyncio.Task[None]"] = None
+        self._messages: Dict[str, str] = {}
+        self._wake: Optional[asyncio.Event] = None
+
+    @property
+    def connections(self) -> int:
+        """Anzahl der verbundenen Clients."""
+        return sum(len(queues) for queues in self.subscribers.values())
+
+    def start(self) -> None:
+        """Startet den Sampler im laufenden Event-Loop (idempotent)."""
+        if self.task is None or self.task.done():
+            self._wake = asyncio.Event()
+            self.task = asyncio.get_running_loop().create_task(self.run(self._wake))
+        if self.subscribers and self._wake is not None:
+            self._wake.set()
+
+    async def stop(self) -> None:
+        """Beendet den Sampler."""
+        if self.task is not None:
+            self.task.cancel()
+            with suppress(asyncio.CancelledError):
+                await self.task
+            self.task = None
+
+    def cancel(self) -> None:
+        """Bricht den Sampler ab, auch aus einem anderen Thread als seinem Loop."""
+        task, self.task = self.task, None
+        if task is not None and not task.done():
+            loop = task.get_loop()
+            if not loop.is_closed():
+                loop.call_soon_threadsafe(task.cancel)
+
+    def message(self, target: str) -> str:
+        """Gibt das aktuelle Fragment als Out-of-Band-Swap für ein Ziel zurück."""
+        if target not in self._messages:
+            self._messages[target] = format_html(
+                '<div id="{}-output" hx-swap-oob="innerHTML">{}</div>',
+                target,
+                mark_safe(self.body),
+            )
+        return self._messages[target]
+
+    def publish(self, body: str) -> None:
+        """Verteilt ein neu gerendertes Fragment an alle Verbindungen."""
+        self.body = body
+        self._messages = {}
+        self.ticks += 1
+        for target, queues in self.subscribers.items():
+            message = self.message(target)
+            for queue in queues:
+                if queue.full():
+                    queue.get_nowait()
+                queue.put_nowait(message)
+
+    def render(self) -> str:
+        """Misst und rendert das Fragment (läuft im Render-Pool)."""
+        with translation.override(settings.LANGUAGE_CODE):
+            return render_to_string(
+                SNAPSHOT_TEMPLATE,
+                {"info": read_system_info(), "clients": self.connections},
+            )
+
+    async def run(self, wake: asyncio.Event) -> None:
+        while True:
+            if not self.subscribers:
+                # Ohne Verbindungen wird weder gemessen noch gerendert
+                wake.clear()
+                await wake.wait()
+            try:
+                self.publish(await run_in_render_pool(self.render))
+            except Exception:
+                logger.exception("Live-Feed: Messung fehlgeschlagen")
+            await asyncio.sleep(self.interval)
+
+    async def subscribe(self, target: str) -> AsyncIterator[str]:
+        """Liefert die Nachrichten für ein Ziel-Element, bis der Aufrufer schließt."""
+        queue: "asyncio.Queue[str]" = asyncio.Queue(maxsize=1)
+        if self.body is not None:
+            queue.put_nowait(self.message(target))
+        self.subscribers[target].add(queue)
+        # Fallback für Server ohne Lifespan-Unterstützung
+        self.start()
+        try:
+            while True:
+                yield await queue.get()
+        finally:
+            self.subscribers[target].discard(queue)
+            if not self.subscribers[target]:
+                del self.subscribers[target]
+
+
+_sampler: Optional[SystemSampler] = None
+_sampler_lock = threading.Lock()
+
+
+def get_system_sampler() -> SystemSampler:
+    """
+    Gibt den prozessweiten Sampler zurück.
+
+    Konfigurierbar über ``INSIGHT_UI["websocket_feed"]`` mit ``interval``.
+    """
+    global _sampler
+    if _sampler is None:
+        with _sampler_lock:
+            if _sampler is None:
+                _sampler = SystemSampler(**get_config().websocket_feed)
+    return _sampler
+
+
+@receiver(setting_changed, dispatch_uid="insight_ui_websocket_feed_setting_changed")
+def websocket_feed_setting_changed(sender: Any, setting: str, **kwargs: Any) -> None:
+    """Legt den Sampler neu an, wenn sich ``INSIGHT_UI`` ändert."""
+    global _sampler
+    if setting == "INSIGHT_UI":
+        with _sampler_lock:
+            if _sampler is not None:
+                _sampler.cancel()
+            _sampler = None
+
+
+async def websocket_application(
+    scope: Dict[str, Any], receive: Receive, send: Send
+) -> None:
+    """
+    ASGI-Anwendung für den Live-Feed.
+
+    Das Ziel-Element wird über ``?target=<id>`` gewählt (Standard:
+    ``insight-websocket``), passend zur ``id`` des ``insight_websocket``-Tags.
+    """
+    event = await receive()
+    if event["type"] != "websocket.connect":
+        return
+    query = parse_qs(scope.get("query_string", b"").decode())
+    target = query.get("target", [DEFAULT_TARGET])[0]
+    if not TARGET_PATTERN.match(target):
+        await send({"type": "websocket.close", "code": 1008})
+        return
+    await send({"type": "websocket.accept"})
+
+    sampler = get_system_sampler()
+
+    async def forward() -> None:
+        async with aclosing(sampler.subscribe(target)) as messages:
+            async for message in messages:
+                await send({"type": "websocket.send", "text": message})
+
+    sender = asyncio.create_task(forward())
+    try:
+        while (await receive())["type"] != "websocket.disconnect":
+            # Eingehende Nachrichten werden verworfen
+            pass
+    finally:
+        sender.cancel()
+        with suppress(asyncio.CancelledError, Exception):
+            await sender
+
+
+async def lifespan_application(
+    scope: Dict[str, Any], receive: Receive, send: Send
+) -> None:
+    """ASGI-Lifespan: startet und beendet den Sampler mit dem Server."""
+    while True:
+        event = await receive()
+        if event["type"] == "lifespan.startup":
+            get_system_sampler().start()
+            await send({"type": "lifespan.startup.complete"})
+        elif event["type"] == "lifespan.shutdown":
+            await get_system_sampler().stop()
+            await send({"type": "lifespan.shutdown.complete"})
+            return
@@ -1,12 +1,65 @@
 # websocket_main.py
 
-import os, asyncio, json, datetime, psutil, shutil, uuid, logging, traceback
+import os, argparse, asyncio, bisect, collections, contextlib, html, json, datetime, multiprocessing, psutil, random, re, shutil, signal, time, uuid, logging, traceback
 import websockets
-from websockets.server import WebSocketServerProtocol
+from websockets.extensions.permessage_deflate import ServerPerMessageDeflateFactory
+from websockets.headers import parse_subprotocol
+from urllib.parse import parse_qs, urlsplit
 
 # --- Konfiguration ---
 DEBUG = os.getenv("DEBUG", "true").lower() in ("1", "true", "yes")
 HOST, PORT = '0.0.0.0', 8765
+INTERVAL = float(os.getenv("SAMPLE_INTERVAL", "5"))  # Sekunden pro Tick
+
+# Umgang mit Clients, die nicht mehr lesen: coalesce | drop-oldest | disconnect
+SLOW_CLIENT_POLICY = os.getenv("SLOW_CLIENT_POLICY", "coalesce")
+CLIENT_QUEUE_SIZE = int(os.getenv("CLIENT_QUEUE_SIZE", "8"))    # Nachrichten pro Verbindung
+MAX_LAG = float(os.getenv("MAX_LAG", "30"))                     # Sekunden bis zum Trennen
+WRITE_LIMIT = 64 * 1024                                         # Bytes im Socket-Puffer
+
+# Nutzdaten-Modi, ausgehandelt per Subprotokoll (ohne Angabe: html)
+#   html        minifiziertes Fragment für die HTMX ws-Extension
+#   json        kompaktes JSON mit dem vollständigen Messwert
+#   json-delta  nur geänderte Felder gegenüber dem vorherigen Messwert
+MODES = ("html", "json", "json-delta")
+COMPRESSION = os.getenv("COMPRESSION", "true").lower() in ("1", "true", "yes")
+
+# Themen (topics): jede Verbindung erhält nur, was sie abonniert hat (?topics=disk,cpu
+# oder {"type":"subscribe","topics":[...]}). Jedes Thema misst in eigenem Takt und nur,
+# solange es Abonnenten gibt. Ohne Angabe: "system" (kombiniertes Fragment wie bisher).
+DEFAULT_TOPICS = [t for t in os.getenv("DEFAULT_TOPICS", "system").split(",") if t]
+TOPIC_INTERVALS = {"system": INTERVAL, "disk": 30.0, "memory": 5.0, "cpu": 2.0, "clients": INTERVAL}
+# Überschreiben per Umgebung, z.B. TOPIC_INTERVALS="cpu=1,disk=60"
+TOPIC_INTERVALS.update((name, float(seconds)) for name, seconds in
+                       (item.split("=") for item in os.getenv("TOPIC_INTERVALS", "").split(",") if item))
+DEFAULT_TARGET = "demo-websocket"   # id des insight_websocket-Containers (?target=)
+NAME_PATTERN = re.compile(r"^[A-Za-z][\w-]*$")
+
+# Resume: jede JSON-Nachricht trägt eine fortlaufende Nummer pro Thema ("seq") innerhalb
+# eines Datenstroms ("epoch", neu bei jedem Start des Samplers). Ein Client, der mit
+# epoch und seinen letzten Nummern neu verbindet, erhält nur die verpassten Nachrichten
+# aus dem Ringpuffer; ist die Lücke größer, einen vollständigen Stand.
+REPLAY_BUFFER = int(os.getenv("REPLAY_BUFFER", "64"))   # Nachrichten pro Thema
+
+# Multi-Prozess-Betrieb (--workers > 1)
+WORKERS = int(os.getenv("WORKERS", "1"))
+SAMPLER_SOCKET = os.getenv("SAMPLER_SOCKET", "/tmp/insight-ui-sampler.sock")
+
+# Graceful Shutdown (SIGTERM): keine neuen Verbindungen, bestehende werden über
+# DRAIN_WINDOW Sekunden verteilt mit 1012 (Service Restart) und einem Hinweis
+# "reconnect_after=<s>" (zufällig bis RECONNECT_JITTER) geschlossen; nach
+# DRAIN_TIMEOUT Sekunden endet der Prozess auch mit offenen Verbindungen.
+DRAIN_WINDOW = float(os.getenv("DRAIN_WINDOW", "10"))
+DRAIN_TIMEOUT = float(os.getenv("DRAIN_TIMEOUT", "30"))
+RECONNECT_JITTER = float(os.getenv("RECONNECT_JITTER", "5"))
+SHUTDOWN_GRACE = DRAIN_TIMEOUT + 5   # Sekunden, die ein Worker zum Beenden bekommt
+BIND_DELAY = 1.0   # Sekunden, die ein neuer Worker beim Restart zum Binden bekommt
+
+# Metriken im Prometheus-Textformat unter http://127.0.0.1:METRICS_PORT/metrics (0 = aus).
+# Mit --workers: Sampler-Prozess auf METRICS_PORT, Worker i auf METRICS_PORT + 1 + i.
+METRICS_HOST = os.getenv("METRICS_HOST", "127.0.0.1")
+METRICS_PORT = int(os.getenv("METRICS_PORT", "9765"))
+LOOP_LAG_INTERVAL = 0.5   # Sekunden zwischen zwei Messungen der Event-Loop-Verzögerung
 
 # --- Logging Setup (wie zuvor) ---
 level = logging.DEBUG if DEBUG else logging.INFO
@@ -35,67 +88,945 @@ def safe_json(data):
         if isinstance(o, uuid.UUID):
             return str(o)
         return str(o)
-    return json.dumps(data, default=default)
+    return json.dumps(data, default=default, separators=(",", ":"))
 
-async def system_info():
-    now = datetime.datetime.utcnow()
+def now():
+    return datetime.datetime.now(datetime.timezone.utc)
+
+# Blockierende Systemabfragen; laufen pro Tick des jeweiligen Themas im Thread-Pool
+def read_disk():
     disk = shutil.disk_usage("/")
+    return {"total_gb": round(disk.total/2**30,2), "used_gb": round(disk.used/2**30,2), "free_gb": round(disk.free/2**30,2)}
+
+def read_memory():
     mem = psutil.virtual_memory()
-    return {
-        "timestamp": now,
-        "disk": {"total_gb": round(disk.total/2**30,2), "used_gb": round(disk.used/2**30,2), "free_gb": round(disk.free/2**30,2)},
-        "memory": {"total_gb": round(mem.total/2**30,2), "available_gb": round(mem.available/2**30,2), "percent_used": mem.percent}
-    }
+    return {"total_gb": round(mem.total/2**30,2), "available_gb": round(mem.available/2**30,2), "percent_used": mem.percent}
+
+def read_cpu():
+    # cpu_percent(None): Auslastung seit dem letzten Aufruf, blockiert nicht
+    return {"percent_used": psutil.cpu_percent(None), "load_avg": [round(load, 2) for load in os.getloadavg()]}
+
+def read_system_info():
+    return {"disk": read_disk(), "memory": read_memory()}
+
+def minify(markup):
+    return re.sub(r">\s+<", "><", markup).strip()
+
+def card(*rows):
+    """Gemeinsamer Rahmen der HTML-Fragmente für die HTMX WebSocket Extension."""
+    return minify(f'''
+    <div class="mb-2 p-2 border-l-4 border-blue-500 bg-white dark:bg-gray-600 rounded">
+        <div class="text-xs text-gray-500 dark:text-gray-400">{datetime.datetime.now().strftime('%H:%M:%S')}</div>
+        <div class="text-sm space-y-1">{"".join(f"<div>{row}</div>" for row in rows)}</div>
+    </div>
+    ''')
+
+def render_system(info):
+    return card(f'💾 Disk: {info["disk"]["used_gb"]}GB / {info["disk"]["total_gb"]}GB',
+                f'🧠 Memory: {info["memory"]["percent_used"]}% used',
+                f'🌐 Clients: {info["clients"]}')
+
+def render_disk(info):
+    return card(f'💾 Disk: {info["used_gb"]}GB / {info["total_gb"]}GB ({info["free_gb"]}GB free)')
+
+def render_memory(info):
+    return card(f'🧠 Memory: {info["percent_used"]}% used ({info["available_gb"]}GB available)')
+
+def render_cpu(info):
+    return card(f'⚙️ CPU: {info["percent_used"]}% (load {" / ".join(map(str, info["load_avg"]))})')
+
+def render_clients(info):
+    return card(f'🌐 Clients: {info["clients"]}')
+
+def render_fields(info):
+    """Standard für eigene Themen: ein Feld pro Zeile."""
+    return card(*(f"{html.escape(str(key))}: {html.escape(str(value))}"
+                  for key, value in info.items() if key != "timestamp"))
+
+def diff(previous, current):
+    """Geänderte Felder (rekursiv); entfernte Schlüssel werden zu None."""
+    changes = {}
+    for key in current.keys() | previous.keys():
+        old, new = previous.get(key), current.get(key)
+        if isinstance(old, dict) and isinstance(new, dict):
+            nested = diff(old, new)
+            if nested:
+                changes[key] = nested
+        elif old != new:
+            changes[key] = new
+    return changes
+
+class Snapshot:
+    """Ein Messwert eines Themas; die Nutzdaten je Modus (und Ziel) entstehen höchstens einmal."""
+
+    def __init__(self, topic, info, previous_info=None, render=render_fields, seq=0):
+        self.topic = topic
+        self.seq = seq
+        self.info = info
+        self.previous_info = previous_info
+        self.render = render
+        self.body = None   # HTML ohne Out-of-Band-Wrapper, für alle Ziele gleich
+        self.payloads = {}
+        self.published = time.monotonic()
+
+    def payload(self, mode, target=DEFAULT_TARGET):
+        key = (mode, target) if mode == "html" else mode
+        if key not in self.payloads:
+            if mode == "html":
+                if self.body is None:
+                    self.body = self.render(self.info)
+                # "system" füllt wie bisher <target>-output, alle anderen <target>-<topic>
+                slot = "output" if self.topic == "system" else self.topic
+                self.payloads[key] = f'<div id="{target}-{slot}" hx-swap-oob="innerHTML">{self.body}</div>'
+            elif mode == "json-delta" and self.previous_info is not None:
+                self.payloads[key] = safe_json({"type": "delta", "topic": self.topic, "seq": self.seq,
+                                                "content": diff(self.previous_info, self.info)})
+            else:
+                self.payloads[key] = safe_json({"type": "snapshot", "topic": self.topic, "seq": self.seq,
+                                                "content": self.info})
+        return self.payloads[key]
+
+# --- Metriken ---
+LATENCY_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+def format_labels(labels):
+    return "{" + ",".join(f'{k}="{v}"' for k, v in labels.items()) + "}" if labels else ""
+
+class Histogram:
+    """Kumulatives Histogramm; observe() ist O(log n) und blockiert nicht."""
+
+    def __init__(self, buckets=LATENCY_BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * len(buckets)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value):
+        self.sum += value
+        self.count += 1
+        index = bisect.bisect_left(self.buckets, value)
+        if index < len(self.counts):
+            self.counts[index] += 1
+
+    def lines(self, name, **labels):
+        cumulative = 0
+        for bound, count in zip(self.buckets, self.counts):
+            cumulative += count
+            yield f"{name}_bucket{format_labels({**labels, 'le': bound})} {cumulative}"
+        yield f"{name}_bucket{format_labels({**labels, 'le': '+Inf'})} {self.count}"
+        yield f"{name}_sum{format_labels(labels)} {self.sum}"
+        yield f"{name}_count{format_labels(labels)} {self.count}"
+
+class Metrics:
+    """Zähler und Histogramme eines Prozesses; gerendert erst beim Abruf."""
+
+    def __init__(self):
+        self.started = time.time()
+        self.connects = self.disconnects = self.dropped = 0
+        self.resumes = collections.Counter()   # Thema fortgesetzt: replayed | full
+        self.draining = False
+        self.send = collections.defaultdict(Histogram)       # Dauer von ws.send() je Modus
+        self.delivery = collections.defaultdict(Histogram)   # Messwert verteilt -> gesendet, je Modus
+        self.sampler_duration = collections.defaultdict(Histogram)   # je Thema
+        self.loop_lag = 0.0
+        self.loop_lag_histogram = Histogram()
+
+    def render(self, clients=None):
+        """Prometheus-Textformat; clients=None für Prozesse ohne WebSocket-Verbindungen."""
+        out = []
+
+        def metric(name, kind, help, samples):
+            out.append(f"# HELP {name} {help}")
+            out.append(f"# TYPE {name} {kind}")
+            out.extend(samples)
+
+        metric("insight_ws_start_time_seconds", "gauge", "Process start time (unix epoch).",
+               [f"insight_ws_start_time_seconds {self.started}"])
+        metric("insight_ws_draining", "gauge", "1 while the process drains connections before exiting.",
+               [f"insight_ws_draining {int(self.draining)}"])
+        if clients is not None:
+            clients = list(clients)
+            modes = collections.Counter(client.mode for client in clients)
+            metric("insight_ws_connections", "gauge", "Active WebSocket connections by payload mode.",
+                   [f"insight_ws_connections{format_labels({'mode': m})} {modes.get(m, 0)}" for m in MODES])
+            metric("insight_ws_connects_total", "counter", "Accepted WebSocket connections.",
+                   [f"insight_ws_connects_total {self.connects}"])
+            metric("insight_ws_disconnects_total", "counter", "Closed WebSocket connections.",
+                   [f"insight_ws_disconnects_total {self.disconnects}"])
+            metric("insight_ws_dropped_messages_total", "counter", "Messages dropped by the slow client policy.",
+                   [f"insight_ws_dropped_messages_total {self.dropped}"])
+            metric("insight_ws_resumes_total", "counter", "Resumed topic subscriptions (replayed gap or full state).",
+                   [f"insight_ws_resumes_total{format_labels({'result': r})} {self.resumes[r]}" for r in ("replayed", "full")])
+            depths = [client.depth for client in clients]
+            metric("insight_ws_queue_depth", "gauge", "Queued outbound messages (sum and max over connections).",
+                   [f'insight_ws_queue_depth{{stat="sum"}} {sum(depths)}',
+                    f'insight_ws_queue_depth{{stat="max"}} {max(depths, default=0)}'])
+            metric("insight_ws_clients_behind", "gauge", "Connections with a non-empty outbound queue.",
+                   [f"insight_ws_clients_behind {sum(1 for d in depths if d)}"])
+            metric("insight_ws_max_lag_seconds", "gauge", "Longest time a connection has been behind.",
+                   [f"insight_ws_max_lag_seconds {max((client.lag for client in clients), default=0.0)}"])
+            topics = collections.Counter(name for client in clients for name in client.topics)
+            metric("insight_ws_topic_subscribers", "gauge", "Subscribed connections by topic.",
+                   [f"insight_ws_topic_subscribers{format_labels({'topic': t})} {n}" for t, n in sorted(topics.items())])
+            metric("insight_ws_send_seconds", "histogram", "Duration of ws.send() incl. socket backpressure.",
+                   [line for mode, h in sorted(self.send.items()) for line in h.lines("insight_ws_send_seconds", mode=mode)])
+            metric("insight_ws_delivery_seconds", "histogram", "Time from publishing a snapshot to sending it.",
+                   [line for mode, h in sorted(self.delivery.items()) for line in h.lines("insight_ws_delivery_seconds", mode=mode)])
+        metric("insight_sampler_duration_seconds", "histogram", "Duration of a topic tick (measure and publish).",
+               [line for topic, h in sorted(self.sampler_duration.items())
+                for line in h.lines("insight_sampler_duration_seconds", topic=topic)])
+        metric("insight_event_loop_lag_seconds", "gauge", "Last measured event loop delay.",
+               [f"insight_event_loop_lag_seconds {self.loop_lag}"])
+        metric("insight_event_loop_lag_histogram_seconds", "histogram", "Event loop delay.",
+               list(self.loop_lag_histogram.lines("insight_event_loop_lag_histogram_seconds")))
+        return "\n".join(out) + "\n"
+
+metrics = Metrics()
+
+async def monitor_loop_lag(interval=LOOP_LAG_INTERVAL):
+    """Verzögerung des Event-Loops: wie viel später als geplant sleep() zurückkehrt."""
+    loop = asyncio.get_running_loop()
+    while True:
+        start = loop.time()
+        await asyncio.sleep(interval)
+        metrics.loop_lag = max(0.0, loop.time() - start - interval)
+        metrics.loop_lag_histogram.observe(metrics.loop_lag)
+
+async def start_metrics_server(port, clients=None, reuse_port=False):
+    """Minimaler HTTP-Server auf demselben Loop; clients() liefert die Verbindungen beim Abruf."""
+
+    async def handle(reader, writer):
+        try:
+            request = await asyncio.wait_for(reader.readuntil(b"\r\n\r\n"), 5)
+            method, path = request.split(b"\r\n", 1)[0].decode("latin-1").split()[:2]
+            if method == "GET" and path.split("?")[0] == "/metrics":
+                status, ctype = "200 OK", "text/plain; version=0.0.4; charset=utf-8"
+                body = metrics.render(clients() if clients else None).encode()
+            else:
+                status, ctype, body = "404 Not Found", "text/plain; charset=utf-8", b"not found\n"
+            writer.write(f"HTTP/1.1 {status}\r\nContent-Type: {ctype}\r\nContent-Length: {len(body)}\r\n"
+                         f"Connection: close\r\n\r\n".encode() + body)
+            await writer.drain()
+        except (asyncio.TimeoutError, asyncio.IncompleteReadError, asyncio.LimitOverrunError,
+                ConnectionError, ValueError):
+            pass
+        finally:
+            writer.close()
+
+    server = await asyncio.start_server(handle, METRICS_HOST, port, reuse_port=reuse_port)
+    logger.info(f"Metrics on http://{METRICS_HOST}:{port}/metrics")
+    return server
+
+async def serve_metrics(port, clients=None, reuse_port=False):
+    """Metrik-Endpoint und Loop-Lag-Messung, bis der Task abgebrochen wird.
+
+    reuse_port: beim Rolling Restart teilen sich alter und neuer Worker kurz den Port.
+    """
+    if not port:
+        return
+    lag_task = asyncio.create_task(monitor_loop_lag())
+    try:
+        async with await start_metrics_server(port, clients, reuse_port) as server:
+            await server.serve_forever()
+    except OSError as e:
+        logger.error(f"Metrics endpoint on port {port} unavailable: {e}")
+    finally:
+        lag_task.cancel()
+
+# --- Aushandlung von Modus und Kompression ---
+def deflate(**settings):
+    return [ServerPerMessageDeflateFactory(**settings)] if COMPRESSION else []
+
+# html: große, sich wiederholende Markup-Anteile -> Kontext zwischen Nachrichten
+# behalten, 4 KiB Fenster reicht für ein Fragment. json: kurze Nachrichten,
+# kleineres Fenster spart Speicher pro Verbindung. json-delta: wenige Dutzend
+# Bytes, Deflate-Overhead wäre größer als die Ersparnis.
+EXTENSIONS = {
+    "html": deflate(server_max_window_bits=12, client_max_window_bits=12, compress_settings={"memLevel": 5}),
+    "json": deflate(server_max_window_bits=10, client_max_window_bits=10, compress_settings={"memLevel": 4}),
+    "json-delta": [],
+}
+
+def negotiate(offered):
+    """Erster vom Client angebotener bekannter Modus; None bedeutet html."""
+    return next((mode for mode in offered if mode in MODES), None)
+
+def select_subprotocol(connection, subprotocols):
+    return negotiate(subprotocols)
+
+def select_extensions(connection, request):
+    """process_request-Hook: Deflate-Einstellungen passend zum Modus setzen."""
+    offered = [p for value in request.headers.get_all("Sec-WebSocket-Protocol") for p in parse_subprotocol(value)]
+    connection.protocol.available_extensions = EXTENSIONS[negotiate(offered) or "html"]
+    return None
+
+# --- Ausgangs-Queue pro Verbindung (Backpressure) ---
+POLICIES = ("coalesce", "drop-oldest", "disconnect")
+
+class Client:
+    """Begrenzte Ausgangs-Queue mit eigenem Sende-Task pro Verbindung.
+
+    coalesce:    pro Thema wartet nur die neueste Nachricht, ältere werden ersetzt
+    drop-oldest: bis zu max_queue Nachrichten, bei Überlauf fällt die älteste weg
+    disconnect:  wie drop-oldest, trennt aber nach max_lag Sekunden Rückstand
+    """
+
+    def __init__(self, ws, conn_id, policy=SLOW_CLIENT_POLICY,
+                 max_queue=CLIENT_QUEUE_SIZE, max_lag=MAX_LAG, mode="html", target=DEFAULT_TARGET):
+        if policy not in POLICIES:
+            raise ValueError(f"Unknown slow client policy: {policy}")
+        self.ws, self.conn_id, self.policy, self.mode, self.target = ws, conn_id, policy, mode, target
+        self.topics = set()
+        self.delta_base = set()   # json-delta: Themen, für die der Client einen vollständigen Stand hat
+        self.max_queue = max_queue
+        self.max_lag = max_lag
+        self.queue = collections.deque()
+        self.ready = asyncio.Event()
+        self.behind_since = None   # seit wann der Client nicht hinterherkommt
+        self.sent = self.dropped = 0
+        self.disconnected = False
+        self.task = self.closing = None
+
+    def start(self):
+        self.task = asyncio.create_task(self._writer())
+        return self
+
+    @property
+    def depth(self):
+        return len(self.queue)
+
+    @property
+    def lag(self):
+        return time.monotonic() - self.behind_since if self.behind_since else 0.0
+
+    def offer(self, snapshot):
+        """Reiht einen Messwert ein, ohne zu warten."""
+        if self.disconnected:
+            return
+        if self.queue and self.behind_since is None:
+            self.behind_since = time.monotonic()
+        if self.policy == "disconnect" and self.lag > self.max_lag:
+            self.disconnect()
+            return
+        if self.policy == "coalesce":
+            stale = next((queued for queued in self.queue if queued.topic == snapshot.topic), None)
+            if stale is not None:
+                self.queue.remove(stale)
+                self._drop(stale)
+        elif self.depth >= self.max_queue:
+            self._drop(self.queue.popleft())
+        self.queue.append(snapshot)
+        self.ready.set()
+
+    def _drop(self, snapshot):
+        self.dropped += 1
+        metrics.dropped += 1
+        # Nach einer Lücke passt das nächste Delta dieses Themas nicht mehr
+        self.delta_base.discard(snapshot.topic)
+
+    def replay(self, topic, snapshots):
+        """Resume: verpasste Nachrichten unverändert einreihen (ohne Policy, Deltas bleiben gültig)."""
+        self.delta_base.add(topic)
+        if snapshots:
+            self.queue.extend(snapshots)
+            self.ready.set()
+
+    def forget(self, topics):
+        """Abbestellte Themen: wartende Nachrichten verwerfen."""
+        self.queue = collections.deque(s for s in self.queue if s.topic not in topics)
+        self.delta_base.difference_update(topics)
+
+    async def reply(self, data):
+        """Steuernachricht direkt senden (nur JSON-Modi; die HTMX-Extension erwartet HTML)."""
+        if self.mode != "html":
+            await self.ws.send(safe_json(data))
+
+    async def _writer(self):
+        try:
+            while True:
+                while not self.queue:
+                    self.ready.clear()
+                    self.behind_since = None
+                    await self.ready.wait()
+                snapshot = self.queue.popleft()
+                mode = self.mode
+                if mode == "json-delta" and snapshot.topic not in self.delta_base:
+                    mode = "json"
+                self.delta_base.add(snapshot.topic)
+                payload = snapshot.payload(mode, self.target)
+                # send() wartet, solange der Socket-Puffer über WRITE_LIMIT liegt
+                start = time.monotonic()
+                await self.ws.send(payload)
+                now = time.monotonic()
+                metrics.send[self.mode].observe(now - start)
+                metrics.delivery[self.mode].observe(now - snapshot.published)
+                self.sent += 1
+        except websockets.ConnectionClosed:
+            pass
+
+    def disconnect(self):
+        self.disconnected = True
+        self.queue.clear()
+        logger.warning(f"[{self.conn_id}] Client too slow ({self.lag:.1f}s behind), disconnecting")
+        self.task.cancel()
+        # 1013 = Try Again Later
+        self.closing = asyncio.create_task(self.ws.close(1013, "client too slow"))
+
+    def stop(self):
+        if self.task:
+            self.task.cancel()
+
+    def stats(self):
+        return {"id": self.conn_id[:8], "mode": self.mode, "policy": self.policy, "topics": sorted(self.topics),
+                "depth": self.depth, "dropped": self.dropped, "sent": self.sent, "lag": round(self.lag, 3)}
+
+# --- Themen: ein Task pro Thema und Prozess, verteilt nur an die Abonnenten ---
+class Topic:
+    """Ein Datenstrom mit eigenem Takt.
+
+    read: blockierende Funktion, die ein dict liefert (läuft im Thread-Pool);
+          None für Push-Themen, die die Anwendung selbst per publish() befüllt
+    """
+
+    def __init__(self, name, read=None, interval=INTERVAL, render=render_fields):
+        self.name, self.read, self.interval, self.render = name, read, interval, render
+        self.subscribers = set()
+        self.remote = 0        # Abonnenten in Worker-Prozessen (nur im Sampler-Prozess)
+        self.latest = None     # letzter Snapshot für neue Abonnenten
+        self.seq = 0
+        self.history = collections.deque(maxlen=REPLAY_BUFFER)
+        self.wake = asyncio.Event()
+        self.listeners = []    # weitere Empfänger der Messwerte (Sampler-Prozess -> Worker)
+
+    @property
+    def active(self):
+        return bool(self.subscribers) or self.remote > 0
+
+    def publish(self, info, seq=None):
+        """Verteilt einen Messwert; gibt die Dauer der Verteilung zurück.
+
+        seq: Nummer aus dem Sampler-Prozess (Worker); sonst fortlaufend gezählt
+        """
+        start = time.monotonic()
+        previous = self.latest.info if self.latest else None
+        self.seq = self.seq + 1 if seq is None else seq
+        self.latest = snapshot = Snapshot(self.name, info, previous, self.render, self.seq)
+        self.history.append(snapshot)
+        # Ein Snapshot für alle Abonnenten, Nutzdaten je Modus einmal erzeugt; langsame
+        # Clients bremsen weder das Thema noch die anderen Verbindungen
+        for client in list(self.subscribers):
+            client.offer(snapshot)
+        for listener in self.listeners:
+            listener(self.name, info, self.seq)
+        return time.monotonic() - start
+
+    def since(self, seq):
+        """Nachrichten nach seq aus dem Ringpuffer; None, wenn sie nicht mehr lückenlos vorliegen."""
+        if not self.history or seq > self.seq or self.history[0].seq > seq + 1:
+            return None
+        return [snapshot for snapshot in self.history if snapshot.seq > seq]
+
+    def reset(self):
+        """Neuer Datenstrom (epoch): Nummern und Ringpuffer verwerfen."""
+        self.seq = 0
+        self.latest = None
+        self.history.clear()
+
+    async def tick(self):
+        start = time.monotonic()
+        info = {"timestamp": now(), **await asyncio.to_thread(self.read)}
+        self.publish(info)
+        metrics.sampler_duration[self.name].observe(time.monotonic() - start)
+
+    async def run(self):
+        while True:
+            if self.active:
+                try:
+                    await self.tick()
+                except Exception:
+                    logger.exception(f"Topic {self.name}: tick failed")
+            # Ohne Abonnenten wird nicht gemessen; der erste Abonnent weckt das Thema
+            self.wake.clear()
+            with contextlib.suppress(asyncio.TimeoutError):
+                await asyncio.wait_for(self.wake.wait(), self.interval)
+
+class Sampler:
+    """Themen und Verbindungen eines Prozesses."""
+
+    def __init__(self):
+        self.topics = {}
+        self.epoch = uuid.uuid4().hex[:12]   # im Worker: die des Sampler-Prozesses
+        self.subscribers = set()   # alle Verbindungen
+        self.remote_clients = 0    # Verbindungen der Worker (nur im Sampler-Prozess)
+        self.on_change = None      # Worker: geänderte Abos an den Sampler-Prozess melden
+
+    @property
+    def connections(self):
+        return len(self.subscribers) + self.remote_clients
+
+    def register(self, name, read=None, interval=None, render=render_fields):
+        """Registriert ein Thema; eigene Anwendungsthemen wie die eingebauten."""
+        if not NAME_PATTERN.match(name):
+            raise ValueError(f"Invalid topic name: {name}")
+        if interval is None:
+            interval = TOPIC_INTERVALS.get(name, INTERVAL)
+        topic = self.topics[name] = Topic(name, read, interval, render)
+        return topic
+
+    def connect(self, client):
+        self.subscribers.add(client)
+
+    def disconnect(self, client):
+        self.subscribers.discard(client)
+        self.unsubscribe(client, list(client.topics))
+
+    def subscribe(self, client, names, since=None, epoch=None):
+        """Abonniert die bekannten Themen; gibt die unbekannten zurück.
+
+        since/epoch: letzte empfangene Nummer je Thema; passt epoch, wird nur die Lücke gesendet
+        """
+        since = since if since and epoch == self.epoch else {}
+        unknown = [name for name in names if name not in self.topics]
+        for name in names:
+            topic = self.topics.get(name)
+            if topic is None or client in topic.subscribers:
+                continue
+            if not topic.active:
+                topic.wake.set()
+            topic.subscribers.add(client)
+            client.topics.add(name)
+            # html: Fragmente ersetzen einander, der neueste Stand genügt
+            gap = topic.since(since[name]) if name in since and client.mode != "html" else None
+            if name in since:
+                metrics.resumes["full" if gap is None else "replayed"] += 1
+            if gap is not None:
+                client.replay(name, gap)
+            elif topic.latest:
+                client.offer(topic.latest)
+        self.changed()
+        return unknown
+
+    def unsubscribe(self, client, names):
+        for name in names:
+            if name in self.topics:
+                self.topics[name].subscribers.discard(client)
+            client.topics.discard(name)
+        client.forget(names)
+        self.changed()
+
+    def counts(self):
+        return {"clients": len(self.subscribers),
+                "topics": {name: len(topic.subscribers) for name, topic in self.topics.items() if topic.subscribers}}
+
+    def changed(self):
+        if self.on_change:
+            self.on_change()
+
+    def client_stats(self):
+        return [client.stats() for client in self.subscribers]
+
+    async def run(self):
+        """Ein Task pro Thema mit read-Funktion."""
+        await asyncio.gather(*(topic.run() for topic in self.topics.values() if topic.read))
+
+sampler = Sampler()
+sampler.register("system", lambda: {**read_system_info(), "clients": sampler.connections}, render=render_system)
+sampler.register("disk", read_disk, render=render_disk)
+sampler.register("memory", read_memory, render=render_memory)
+sampler.register("cpu", read_cpu, render=render_cpu)
+sampler.register("clients", lambda: {"clients": sampler.connections}, render=render_clients)
 
 # --- WebSocket-Handler ---
-async def handler(ws: WebSocketServerProtocol):
+def parse_topics(value):
+    """'disk,cpu' oder ["disk", "cpu"] -> Liste der Namen."""
+    if isinstance(value, str):
+        value = value.split(",")
+    if not isinstance(value, list):
+        return []
+    return [name.strip() for name in value if isinstance(name, str) and name.strip()]
+
+def parse_since(value):
+    """'cpu:41,disk:7' oder {"cpu": 41} -> {"cpu": 41, ...}; ungültige Einträge werden ignoriert."""
+    if isinstance(value, str):
+        value = dict(item.partition(":")[::2] for item in value.split(",") if ":" in item)
+    if not isinstance(value, dict):
+        return {}
+    since = {}
+    for name, seq in value.items():
+        with contextlib.suppress(TypeError, ValueError):
+            since[str(name).strip()] = int(seq)
+    return since
+
+async def handle_command(client, message):
+    """{"type": "subscribe"|"unsubscribe", "topics": [...]}; topics auch als "disk,cpu" (ws-send).
+
+    subscribe optional mit "epoch" und "since": {"cpu": 41} zum Fortsetzen.
+    """
+    try:
+        data = json.loads(message)
+    except ValueError:
+        data = None
+    kind = data.get("type") if isinstance(data, dict) else None
+    if kind not in ("subscribe", "unsubscribe"):
+        await client.reply({"type": "error", "error": "unknown message"})
+        return
+    names = parse_topics(data.get("topics"))
+    if kind == "subscribe":
+        unknown = sampler.subscribe(client, names, parse_since(data.get("since")), data.get("epoch"))
+    else:
+        unknown = sampler.unsubscribe(client, names)
+    reply = {"type": "subscribed", "topics": sorted(client.topics)}
+    if unknown:
+        reply["unknown"] = unknown
+    await client.reply(reply)
+
+async def handler(ws):
     conn_id = str(uuid.uuid4())
     remote = ws.remote_address or ("unknown", "?")
     ip, port = remote[0], remote[1] if len(remote) > 1 else "?"
     ua = ws.request.headers.get("User-Agent", "Unknown") if ws.request else "Unknown"
+    query = parse_qs(urlsplit(ws.request.path).query) if ws.request else {}
+    target = query.get("target", [DEFAULT_TARGET])[0]
+    if not NAME_PATTERN.match(target):
+        await ws.close(1008, "invalid target")
+        return
+    names = parse_topics(query.get("topics", [""])[0]) or DEFAULT_TOPICS
 
-    logger.info(f"[{conn_id}] Connected: {ip}:{port} ({ua})")
+    mode = ws.subprotocol or "html"
+    logger.info(f"[{conn_id}] Connected: {ip}:{port} ({ua}, mode={mode}, topics={','.join(names)})")
 
+    client = Client(ws, conn_id, mode=mode, target=target).start()
+    metrics.connects += 1
     try:
-        while True:
-            info = await system_info()
-            
-            # HTML-Fragment für HTMX WebSocket Extension erstellen
-            html_content = f'''
-            <div id="demo-websocket-output" hx-swap-oob="innerHTML">
-                <div class="mb-2 p-2 border-l-4 border-blue-500 bg-white dark:bg-gray-600 rounded">
-                    <div class="text-xs text-gray-500 dark:text-gray-400">{datetime.datetime.now().strftime('%H:%M:%S')}</div>
-                    <div class="font-semibold text-blue-600 dark:text-blue-400">Connection: {conn_id[:8]}</div>
-                    <div class="text-sm space-y-1">
-                        <div>💾 Disk: {info["disk"]["used_gb"]}GB / {info["disk"]["total_gb"]}GB</div>
-                        <div>🧠 Memory: {info["memory"]["percent_used"]}% used</div>
-                        <div>🌐 Client: {ip}</div>
-                    </div>
-                </div>
-            </div>
-            '''
-            
-            await ws.send(html_content.strip())
-            await asyncio.sleep(5)
+        if mode != "html":
+            await ws.send(safe_json({"type": "hello", "connection_id": conn_id, "mode": mode, "epoch": sampler.epoch,
+                                     "topics": [name for name in names if name in sampler.topics]}))
+        sampler.connect(client)
+        # Resume: ?epoch=<epoch>&since=cpu:41,disk:7
+        since = parse_since(query.get("since", [""])[0])
+        unknown = sampler.subscribe(client, names, since, query.get("epoch", [None])[0])
+        if unknown:
+            logger.warning(f"[{conn_id}] Unknown topics: {','.join(unknown)}")
+            await client.reply({"type": "error", "error": "unknown topics", "topics": unknown})
+        # Eingehende Nachrichten: subscribe/unsubscribe, bis der Client die Verbindung schließt
+        async for message in ws:
+            await handle_command(client, message)
+        logger.info(f"[{conn_id}] Disconnected (code={ws.close_code}, reason={ws.close_reason})")
 
     except websockets.ConnectionClosed as e:
         logger.info(f"[{conn_id}] Disconnected (code={e.code}, reason={e.reason})")
     except Exception:
         logger.exception(f"[{conn_id}] Unexpected error in handler")
     finally:
-        logger.info(f"[{conn_id}] Session closed.")
+        sampler.disconnect(client)
+        client.stop()
+        metrics.disconnects += 1
+        logger.info(f"[{conn_id}] Session closed (sent={client.sent}, dropped={client.dropped}).")
+
+# --- Sampler-Prozess: misst jedes Thema einmal für alle Worker ---
+# Nachrichten über den Unix-Socket: 4 Byte Länge (big endian) + JSON.
+# Sampler -> Worker: {"epoch"}, dann {"topic", "seq", "epoch", "info"}; Worker -> Sampler: Abos {"clients", "topics"}.
+def frame(data):
+    return len(data).to_bytes(4, "big") + data
+
+async def read_frame(reader):
+    size = int.from_bytes(await reader.readexactly(4), "big")
+    return await reader.readexactly(size)
+
+def encode(name, info, seq):
+    return frame(safe_json({"topic": name, "seq": seq, "epoch": sampler.epoch, "info": info}).encode())
+
+class SnapshotPublisher:
+    def __init__(self):
+        self.workers = {}   # writer -> zuletzt gemeldete Abos
+        for topic in sampler.topics.values():
+            topic.listeners.append(self.publish)
+
+    async def handle_worker(self, reader, writer):
+        self.workers[writer] = {}
+        try:
+            # Erst die epoch, damit Worker sie schon vor dem ersten Messwert kennen
+            writer.write(frame(safe_json({"epoch": sampler.epoch}).encode()))
+            # Neuer Worker (z.B. nach Rolling Restart) erhält den Ringpuffer, damit
+            # seine Clients lückenlos fortsetzen können
+            for topic in sampler.topics.values():
+                for snapshot in topic.history:
+                    writer.write(encode(topic.name, snapshot.info, snapshot.seq))
+            while True:
+                self.workers[writer] = json.loads(await read_frame(reader))
+                self.update()
+        except (asyncio.IncompleteReadError, ConnectionError, ValueError):
+            pass
+        finally:
+            self.workers.pop(writer, None)
+            self.update()
+            writer.close()
+
+    def update(self):
+        """Abos aller Worker zusammenfassen; neu benötigte Themen sofort messen."""
+        sampler.remote_clients = sum(counts.get("clients", 0) for counts in self.workers.values())
+        for name, topic in sampler.topics.items():
+            was_active = topic.active
+            topic.remote = sum(counts.get("topics", {}).get(name, 0) for counts in self.workers.values())
+            if topic.active and not was_active:
+                topic.wake.set()
+
+    def publish(self, name, info, seq):
+        data = encode(name, info, seq)
+        for writer in list(self.workers):
+            # Ein hängender Worker wird getrennt statt gepuffert
+            if writer.transport.get_write_buffer_size() > WRITE_LIMIT:
+                logger.warning("Worker is not reading snapshots, dropping connection")
+                writer.close()
+                continue
+            writer.write(data)
+
+    async def run(self, path=SAMPLER_SOCKET):
+        if os.path.exists(path):
+            os.unlink(path)
+        server = await asyncio.start_unix_server(self.handle_worker, path)
+        logger.info(f"Sampler publishing on {path} (pid {os.getpid()})")
+        async with server:
+            await sampler.run()
+
+async def follow_sampler(path=SAMPLER_SOCKET):
+    """Worker: empfängt Messwerte vom Sampler-Prozess statt selbst zu messen."""
+    while True:
+        try:
+            reader, writer = await asyncio.open_unix_connection(path)
+        except OSError:
+            await asyncio.sleep(1)
+            continue
+
+        def report():
+            if not writer.is_closing():
+                writer.write(frame(safe_json(sampler.counts()).encode()))
+
+        sampler.on_change = report
+        report()
+        try:
+            while True:
+                message = json.loads(await read_frame(reader))
+                if message["epoch"] != sampler.epoch:
+                    # Sampler-Prozess neu gestartet: neue Nummerierung
+                    sampler.epoch = message["epoch"]
+                    for topic in sampler.topics.values():
+                        topic.reset()
+                topic = sampler.topics.get(message.get("topic"))
+                if topic and message["seq"] > topic.seq:
+                    # Worker: Dauer der Verteilung an die eigenen Verbindungen
+                    metrics.sampler_duration[topic.name].observe(topic.publish(message["info"], message["seq"]))
+        except (asyncio.IncompleteReadError, ConnectionError):
+            logger.warning("Lost connection to sampler, reconnecting")
+        finally:
+            sampler.on_change = None
+            writer.close()
+        await asyncio.sleep(1)
 
 # --- Server-Start ---
-async def main():
-    async with websockets.serve(
+async def goodbye(ws, reconnect_after):
+    """Schließt mit 1012 und Reconnect-Hinweis; JSON-Clients erhalten ihn zusätzlich als Nachricht."""
+    with contextlib.suppress(websockets.ConnectionClosed):
+        if ws.subprotocol in MODES and ws.subprotocol != "html":
+            await ws.send(safe_json({"type": "goodbye", "reconnect_after": reconnect_after}))
+        await ws.close(1012, f"reconnect_after={reconnect_after}")
+
+async def drain(server, window=DRAIN_WINDOW, deadline=DRAIN_TIMEOUT, jitter=RECONNECT_JITTER):
+    """Graceful Shutdown: Port schließen, Verbindungen verteilt über window Sekunden beenden."""
+    metrics.draining = True
+    # Nimmt keine neuen Verbindungen mehr an; offene Handshakes erhalten 503
+    server.close(close_connections=False)
+    connections = list(server.connections)
+    random.shuffle(connections)
+    logger.info(f"Draining {len(connections)} connections over {window}s (deadline {deadline}s)")
+
+    async def close_later(ws, delay):
+        await asyncio.sleep(delay)
+        await goodbye(ws, round(random.uniform(0, jitter), 1))
+
+    # Gleichmäßig verteilt statt alle auf einmal -> kein Reconnect-Sturm beim Nachfolger
+    tasks = [asyncio.create_task(close_later(ws, window * index / len(connections)))
+             for index, ws in enumerate(connections)]
+    try:
+        await asyncio.wait_for(server.wait_closed(), deadline)
+        logger.info("Drained all connections")
+    except asyncio.TimeoutError:
+        # Auch Verbindungen, deren Close-Handshake noch hängt
+        left = [ws for ws in connections if ws.state is not websockets.State.CLOSED]
+        logger.warning(f"Drain deadline reached, aborting {len(left)} connections")
+        for ws in left:
+            ws.transport.abort()
+        await server.wait_closed()
+    finally:
+        for task in tasks:
+            task.cancel()
+
+async def serve(feed, reuse_port=False, metrics_port=METRICS_PORT):
+    """Startet den WebSocket-Server; SIGTERM leert ihn kontrolliert (drain) und beendet ihn."""
+    loop = asyncio.get_running_loop()
+    stop = loop.create_future()
+    loop.add_signal_handler(signal.SIGTERM, stop.set_result, None)
+    feed_task = asyncio.create_task(feed)
+    metrics_task = asyncio.create_task(serve_metrics(metrics_port, lambda: sampler.subscribers, reuse_port))
+    try:
+        server = await websockets.serve(
             handler, HOST, PORT,
-            ping_interval=20, ping_timeout=20):
-        logger.info(f"WebSocket server listening on ws://{HOST}:{PORT}")
-        await asyncio.Future()
+            ping_interval=20, ping_timeout=20,
+            write_limit=WRITE_LIMIT,
+            subprotocols=list(MODES),
+            select_subprotocol=select_subprotocol,
+            process_request=select_extensions,
+            reuse_port=reuse_port)
+        logger.info(f"WebSocket server listening on ws://{HOST}:{PORT} (pid {os.getpid()})")
+        await stop
+        # Messwerte laufen während des Drains weiter
+        await drain(server)
+    finally:
+        feed_task.cancel()
+        metrics_task.cancel()
+
+async def main():
+    await serve(sampler.run())
+
+# --- Supervisor: N Worker auf demselben Port (SO_REUSEPORT) + 1 Sampler ---
+def run_worker(path, index):
+    signal.signal(signal.SIGHUP, signal.SIG_IGN)   # Neustarts steuert der Supervisor
+    try:
+        metrics_port = METRICS_PORT + 1 + index if METRICS_PORT else 0
+        asyncio.run(serve(follow_sampler(path), reuse_port=True, metrics_port=metrics_port))
+    except KeyboardInterrupt:
+        pass
+
+async def publish_snapshots(path):
+    metrics_task = asyncio.create_task(serve_metrics(METRICS_PORT))
+    try:
+        await SnapshotPublisher().run(path)
+    finally:
+        metrics_task.cancel()
+
+def run_sampler(path):
+    signal.signal(signal.SIGHUP, signal.SIG_IGN)
+    try:
+        asyncio.run(publish_snapshots(path))
+    except KeyboardInterrupt:
+        pass
+
+class Supervisor:
+    """Startet Sampler und Worker, ersetzt abgestürzte Prozesse.
+
+    SIGHUP: Worker nacheinander neu starten (der neue bindet den Port, bevor
+            der alte seine Verbindungen schließt); die Schleife überwacht
+            währenddessen weiter alle Prozesse
+    SIGTERM/SIGINT: alle Worker leeren und beenden, danach den Sampler
+    """
+
+    def __init__(self, workers, path=SAMPLER_SOCKET):
+        self.count, self.path = workers, path
+        self.context = multiprocessing.get_context("spawn")
+        self.sampler = None
+        self.workers = []
+        self.stopping = self.restarting = False
+        self.restart_queue = collections.deque()   # Indizes der noch zu ersetzenden Worker
+        self.replacing = None    # (alter Worker, Startzeit des neuen)
+        self.retiring = {}       # alter Worker -> Frist bis SIGKILL
+
+    def spawn(self, target, *args):
+        process = self.context.Process(target=target, args=(self.path, *args))
+        process.start()
+        return process
+
+    def stop_processes(self, *processes):
+        """SIGTERM an alle (Worker leeren parallel), nach SHUTDOWN_GRACE SIGKILL."""
+        for process in processes:
+            process.terminate()
+        deadline = time.monotonic() + SHUTDOWN_GRACE
+        for process in processes:
+            process.join(max(0, deadline - time.monotonic()))
+            if process.is_alive():
+                process.kill()
+                process.join()
+
+    def start_rolling_restart(self):
+        if self.restart_queue or self.replacing or self.retiring:
+            logger.info("Rolling restart already in progress")
+            return
+        logger.info("Rolling restart of workers")
+        self.restart_queue.extend(range(len(self.workers)))
+
+    def rolling_restart(self):
+        """Ein Schritt des Rolling Restarts pro Schleifendurchlauf, ohne zu blockieren.
+
+        Der nächste Worker wird erst ersetzt, wenn der vorige alte beendet ist.
+        """
+        now = time.monotonic()
+        for old, deadline in list(self.retiring.items()):
+            if old.is_alive() and now < deadline:
+                continue
+            if old.is_alive():
+                old.kill()
+            old.join()
+            del self.retiring[old]
+        if self.replacing is not None:
+            old, started = self.replacing
+            if now - started >= BIND_DELAY:
+                # Der alte Worker leert sich über DRAIN_WINDOW, der neue nimmt die Clients auf
+                old.terminate()
+                self.retiring[old] = now + SHUTDOWN_GRACE
+                self.replacing = None
+        elif self.restart_queue and not self.retiring:
+            index = self.restart_queue.popleft()
+            self.replacing = (self.workers[index], now)
+            self.workers[index] = self.spawn(run_worker, index)
+
+    def run(self):
+        signal.signal(signal.SIGTERM, self.request_stop)
+        signal.signal(signal.SIGINT, self.request_stop)
+        signal.signal(signal.SIGHUP, self.request_restart)
+
+        self.sampler = self.spawn(run_sampler)
+        self.workers = [self.spawn(run_worker, index) for index in range(self.count)]
+        logger.info(f"Supervisor started {self.count} workers on ws://{HOST}:{PORT}")
+        try:
+            while not self.stopping:
+                if self.restarting:
+                    self.restarting = False
+                    self.start_rolling_restart()
+                self.rolling_restart()
+                if not self.sampler.is_alive():
+                    logger.warning(f"Sampler exited (code={self.sampler.exitcode}), restarting")
+                    self.sampler = self.spawn(run_sampler)
+                for index, process in enumerate(self.workers):
+                    if not process.is_alive():
+                        logger.warning(f"Worker {process.pid} exited (code={process.exitcode}), restarting")
+                        self.workers[index] = self.spawn(run_worker, index)
+                time.sleep(0.5)
+        finally:
+            old = [self.replacing[0]] if self.replacing else []
+            self.stop_processes(*self.workers, *old, *self.retiring)
+            self.stop_processes(self.sampler)
+            if os.path.exists(self.path):
+                os.unlink(self.path)
+            logger.info("Supervisor stopped")
+
+    def request_stop(self, signum, frame):
+        self.stopping = True
+
+    def request_restart(self, signum, frame):
+        self.restarting = True
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Insight UI live metrics WebSocket server")
+    parser.add_argument("--workers", type=int, default=WORKERS,
+                        help="Anzahl der Worker-Prozesse (>1 startet den Supervisor)")
+    return parser.parse_args(argv)
 
 if __name__ == "__main__":
+    args = parse_args()
     try:
-        asyncio.run(main())
+        if args.workers > 1:
+            Supervisor(args.workers).run()
+        else:
+            asyncio.run(main())
     except KeyboardInterrupt:
         logger.info("Server stopped via CTRL+C")
     except Exception:
@@ -1,8 +1,16 @@
+import argparse
 import asyncio
-import websockets
+import collections
+import datetime
 import json
-import signal
 import logging
+import platform
+import resource
+import signal
+import time
+
+import psutil
+import websockets
 
 URL = "ws://localhost:8765"
 logging.basicConfig(level=logging.INFO, format='[%(asctime)s] %(levelname)s - %(message)s')
@@ -14,20 +22,22 @@ def shutdown_handler(signum, frame):
     is_running = False
     logging.info("Client wird beendet (Signal empfangen)")
 
-signal.signal(signal.SIGINT, shutdown_handler)   # CTRL+C
-signal.signal(signal.SIGTERM, shutdown_handler)  # kill
-
-async def main():
+# --- Einzelner Client: Nachrichten mitlesen (--watch) ---
+async def watch(url):
     global is_running
     try:
-        async with websockets.connect(URL) as websocket:
-            logging.info(f"Verbunden mit {URL}")
+        async with websockets.connect(url, subprotocols=["json"]) as websocket:
+            logging.info(f"Verbunden mit {url} (Modus: {websocket.subprotocol or 'html'})")
+            connection_id = None
             while is_running:
                 try:
                     message = await asyncio.wait_for(websocket.recv(), timeout=10)
                     try:
                         data = json.loads(message)
-                        logging.info(f"[{data.get('connection_id')}] Daten empfangen:\n{json.dumps(data['content'], indent=2)}")
+                        if data.get("type") == "hello":
+                            connection_id = data["connection_id"]
+                            continue
+                        logging.info(f"[{connection_id}] Daten empfangen:\n{json.dumps(data['content'], indent=2)}")
                     except json.JSONDecodeError:
                         logging.warning(f"Ungültige Nachricht:\n{message}")
                 except asyncio.TimeoutError:
@@ -35,5 +45,174 @@ async def main():
     except Exception as e:
         logging.error(f"Verbindungsfehler: {e}")
 
+# --- Lastgenerator ---
+def percentiles(values, scale=1000.0):
+    """p50/p95/p99/max in Millisekunden (Nearest-Rank)."""
+    if not values:
+        return {"count": 0, "p50": None, "p95": None, "p99": None, "max": None}
+    ordered = sorted(values)
+    def rank(p):
+        return round(ordered[min(len(ordered) - 1, int(p / 100 * len(ordered)))] * scale, 3)
+    return {"count": len(ordered), "p50": rank(50), "p95": rank(95), "p99": rank(99),
+            "max": round(ordered[-1] * scale, 3)}
+
+def find_server_pid(port):
+    """Sucht den Prozess, der auf dem Port lauscht (im Supervisor-Modus der Supervisor)."""
+    pids = set()
+    for conn in psutil.net_connections(kind="inet"):
+        if conn.status == psutil.CONN_LISTEN and conn.laddr and conn.laddr.port == port and conn.pid:
+            pids.add(conn.pid)
+    if not pids:
+        return None
+    # Mehrere Worker (SO_REUSEPORT): gemeinsamer Elternprozess
+    parents = {psutil.Process(pid).ppid() for pid in pids}
+    return parents.pop() if len(pids) > 1 and len(parents) == 1 else min(pids)
+
+def server_rss(pid):
+    """RSS des Servers inklusive Kindprozessen (Worker, Sampler) in Bytes."""
+    if pid is None:
+        return None
+    try:
+        process = psutil.Process(pid)
+        return sum(p.memory_info().rss for p in [process, *process.children(recursive=True)])
+    except psutil.Error:
+        return None
+
+def raise_fd_limit():
+    soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+    if soft < hard:
+        resource.setrlimit(resource.RLIMIT_NOFILE, (hard, hard))
+    return resource.getrlimit(resource.RLIMIT_NOFILE)[0]
+
+class Stats:
+    def __init__(self):
+        self.connect_times = []
+        self.latencies = []
+        self.messages = 0
+        self.bytes = 0
+        self.errors = collections.Counter()
+        self.measuring = False
+
+    def record(self, message, received):
+        if not self.measuring:
+            return
+        self.messages += 1
+        self.bytes += len(message)
+        if isinstance(message, bytes) or not message.startswith("{"):
+            return   # html-Modus: kein Server-Zeitstempel
+        timestamp = json.loads(message).get("content", {}).get("timestamp")
+        if timestamp:
+            self.latencies.append(received - datetime.datetime.fromisoformat(timestamp).timestamp())
+
+async def client(url, mode, stats, connect_slots, connected):
+    async with connect_slots:
+        start = time.perf_counter()
+        try:
+            ws = await websockets.connect(url, subprotocols=[mode] if mode != "html" else None,
+                                          open_timeout=30, ping_interval=None)
+        except Exception as e:
+            stats.errors[type(e).__name__] += 1
+            return
+        stats.connect_times.append(time.perf_counter() - start)
+    connected.append(ws)
+    try:
+        async for message in ws:
+            stats.record(message, time.time())
+    except websockets.ConnectionClosed as e:
+        stats.errors[f"closed_{e.rcvd.code if e.rcvd else 1006}"] += 1
+    except Exception as e:
+        stats.errors[type(e).__name__] += 1
+
+async def benchmark(args):
+    fd_limit = raise_fd_limit()
+    if args.clients + 100 > fd_limit:
+        logging.warning(f"Dateideskriptor-Limit {fd_limit} reicht evtl. nicht für {args.clients} Verbindungen")
+
+    pid = args.server_pid or find_server_pid(args.port)
+    rss_before = server_rss(pid)
+    stats, connected = Stats(), []
+    connect_slots = asyncio.Semaphore(args.connect_concurrency)
+
+    logging.info(f"Öffne {args.clients} Verbindungen zu {args.url} (Modus {args.mode}, Server-PID {pid})")
+    started = datetime.datetime.now(datetime.timezone.utc)
+    connect_start = time.perf_counter()
+    tasks = [asyncio.create_task(client(args.url, args.mode, stats, connect_slots, connected))
+             for _ in range(args.clients)]
+    while len(stats.connect_times) + sum(stats.errors.values()) < args.clients:
+        await asyncio.sleep(0.05)
+    connect_seconds = time.perf_counter() - connect_start
+    logging.info(f"{len(stats.connect_times)} verbunden in {connect_seconds:.2f}s")
+
+    await asyncio.sleep(args.settle)
+    rss_after = server_rss(pid)
+
+    stats.measuring = True
+    measure_start = time.perf_counter()
+    while is_running and time.perf_counter() - measure_start < args.duration:
+        await asyncio.sleep(0.2)
+    measured = time.perf_counter() - measure_start
+    stats.measuring = False
+
+    await asyncio.gather(*(ws.close() for ws in connected), return_exceptions=True)
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+
+    succeeded = len(stats.connect_times)
+    rss_per_conn = (rss_after - rss_before) / succeeded if succeeded and rss_after and rss_before else None
+    report = {
+        "started": started.isoformat(),
+        "config": {"url": args.url, "clients": args.clients, "mode": args.mode, "topics": args.topics,
+                   "duration_s": args.duration, "connect_concurrency": args.connect_concurrency},
+        "environment": {"python": platform.python_version(), "websockets": websockets.__version__,
+                        "platform": platform.platform(), "cpu_count": psutil.cpu_count()},
+        "connect": {"attempted": args.clients, "succeeded": succeeded,
+                    "failed": args.clients - succeeded, "seconds": round(connect_seconds, 3),
+                    "rate_per_s": round(succeeded / connect_seconds, 1) if connect_seconds else None,
+                    "latency_ms": percentiles(stats.connect_times)},
+        "messages": {"received": stats.messages, "bytes": stats.bytes, "seconds": round(measured, 3),
+                     "per_s": round(stats.messages / measured, 1) if measured else None,
+                     "bytes_per_message": round(stats.bytes / stats.messages, 1) if stats.messages else None},
+        # Server-Zeitstempel des Messwerts bis zum Empfang (gleiche Uhr nur bei lokalem Server)
+        "fanout_latency_ms": percentiles(stats.latencies),
+        "server": {"pid": pid,
+                   "rss_before_mb": round(rss_before / 2**20, 2) if rss_before else None,
+                   "rss_after_mb": round(rss_after / 2**20, 2) if rss_after else None,
+                   "rss_per_connection_kb": round(rss_per_conn / 1024, 2) if rss_per_conn is not None else None},
+        "errors": dict(stats.errors),
+    }
+    return report
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Lastgenerator und Benchmark für den Insight UI WebSocket-Server")
+    parser.add_argument("--url", default=URL)
+    parser.add_argument("--clients", type=int, default=1000, help="Gleichzeitige Verbindungen")
+    parser.add_argument("--duration", type=float, default=30, help="Messdauer in Sekunden")
+    parser.add_argument("--mode", choices=("html", "json", "json-delta"), default="json")
+    parser.add_argument("--topics", help="Themen, z.B. cpu,memory (Standard: Server-Vorgabe)")
+    parser.add_argument("--connect-concurrency", type=int, default=200, help="Gleichzeitige Verbindungsaufbauten")
+    parser.add_argument("--settle", type=float, default=2, help="Wartezeit vor der RSS-Messung")
+    parser.add_argument("--server-pid", type=int, help="PID des Servers (sonst Suche über den Port)")
+    parser.add_argument("--report", help="Pfad für den JSON-Bericht (Standard: benchmark-<Zeit>.json)")
+    parser.add_argument("--watch", action="store_true", help="Nur einen Client verbinden und Nachrichten ausgeben")
+    args = parser.parse_args(argv)
+    if args.topics:
+        args.url += ("&" if "?" in args.url else "/?") + f"topics={args.topics}"
+    args.port = int(args.url.rsplit(":", 1)[-1].split("/")[0]) if args.url.count(":") > 1 else 80
+    return args
+
 if __name__ == "__main__":
-    asyncio.run(main())
+    signal.signal(signal.SIGINT, shutdown_handler)   # CTRL+C
+    signal.signal(signal.SIGTERM, shutdown_handler)  # kill
+    args = parse_args()
+    if args.watch:
+        asyncio.run(watch(args.url))
+    else:
+        report = asyncio.run(benchmark(args))
+        path = args.report or f"benchmark-{datetime.datetime.now():%Y%m%d-%H%M%S}.json"
+        with open(path, "w") as f:
+            json.dump(report, f, indent=2)
+        logging.info(f"Bericht geschrieben: {path}")
+        print(json.dumps({"connect_rate_per_s": report["connect"]["rate_per_s"],
+                          "fanout_latency_ms": report["fanout_latency_ms"],
+                          "rss_per_connection_kb": report["server"]["rss_per_connection_kb"]}, indent=2))
@@ -0,0 +1,347 @@
+"""Tests für Ausgangs-Queues und Resume des WebSocket-Servers (ohne Server)."""
+
+import asyncio
+import contextlib
+import json
+import logging
+import tempfile
+import unittest
+from unittest import mock
+
+
+def import_main():
+    """Importiert main.py, ohne Logging und app.log des Testlaufs zu verändern."""
+    root = logging.getLogger()
+    handlers, level = root.handlers[:], root.level
+    with tempfile.TemporaryDirectory() as directory, contextlib.chdir(directory):
+        import main
+    for handler in root.handlers:
+        if handler not in handlers:
+            handler.close()
+    root.handlers[:] = handlers
+    root.setLevel(level)
+    return main
+
+
+main = import_main()
+
+
+class FakeWebSocket:
+    """Zeichnet gesendete Nachrichten auf; ``send`` wartet auf ``open``."""
+
+    def __init__(self, open=True):
+        self.sent = []
+        self.closed = None
+        self.open = asyncio.Event()
+        if open:
+            self.open.set()
+
+    async def send(self, data):
+        await self.open.wait()
+        self.sent.append(data)
+
+    async def close(self, code, reason):
+        self.closed = (code, reason)
+
+
+def snapshots(topic, count, start=1):
+    return [
+        main.Snapshot(topic, {"value": seq}, seq=seq)
+        for seq in range(start, start + count)
+    ]
+
+
+class ClientPolicyTest(unittest.IsolatedAsyncioTestCase):
+    """Tests für coalesce, drop-oldest und disconnect."""
+
+    def client(self, policy, max_queue=3, max_lag=5.0, mode="json", ws=None):
+        return main.Client(ws or FakeWebSocket(), "test", policy=policy,
+                           max_queue=max_queue, max_lag=max_lag, mode=mode)
+
+    def test_unknown_policy(self):
+        """Unbekannte Policies werden abgelehnt."""
+        with self.assertRaises(ValueError):
+            self.client("block")
+
+    def test_coalesce_keeps_latest_per_topic(self):
+        """coalesce: pro Thema wartet nur die neueste Nachricht."""
+        client = self.client("coalesce", max_queue=1)
+        for snapshot in [*snapshots("cpu", 3), *snapshots("disk", 2)]:
+            client.offer(snapshot)
+        self.assertEqual(client.depth, 2)
+        self.assertEqual(client.dropped, 3)
+        queued = [(snapshot.topic, snapshot.seq) for snapshot in client.queue]
+        self.assertEqual(queued, [("cpu", 3), ("disk", 2)])
+
+    def test_drop_oldest(self):
+        """drop-oldest: höchstens max_queue Nachrichten, die älteste fällt weg."""
+        client = self.client("drop-oldest")
+        for snapshot in snapshots("cpu", 5):
+            client.offer(snapshot)
+        self.assertEqual(client.depth, 3)
+        self.assertEqual(client.dropped, 2)
+        self.assertEqual([s.seq for s in client.queue], [3, 4, 5])
+
+    def test_behind_since(self):
+        """Der Rückstand beginnt mit der ersten Nachricht hinter einer wartenden."""
+        client = self.client("drop-oldest")
+        first, second = snapshots("cpu", 2)
+        client.offer(first)
+        self.assertIsNone(client.behind_since)
+        self.assertEqual(client.lag, 0.0)
+        client.offer(second)
+        self.assertIsNotNone(client.behind_since)
+
+    async def test_writer_resets_behind_since(self):
+        """Hat der Client aufgeholt, gilt er nicht mehr als im Rückstand."""
+        ws = FakeWebSocket()
+        client = self.client("drop-oldest", ws=ws).start()
+        self.addCleanup(client.stop)
+        for snapshot in snapshots("cpu", 2):
+            client.offer(snapshot)
+        while client.queue or len(ws.sent) < 2:
+            await asyncio.sleep(0)
+        await asyncio.sleep(0)
+        self.assertIsNone(client.behind_since)
+        self.assertEqual(client.sent, 2)
+
+    async def test_disconnect_below_max_lag_drops_oldest(self):
+        """disconnect: bis max_lag verhält sich die Queue wie drop-oldest."""
+        client = self.client("disconnect")
+        for snapshot in snapshots("cpu", 5):
+            client.offer(snapshot)
+        self.assertEqual(client.depth, 3)
+        self.assertEqual(client.dropped, 2)
+        self.assertFalse(client.disconnected)
+
+    async def test_disconnect_after_max_lag(self):
+        """disconnect: nach max_lag Sekunden Rückstand wird mit 1013 getrennt."""
+        ws = FakeWebSocket(open=False)
+        client = self.client("disconnect", ws=ws).start()
+        first, second, third, late = snapshots("cpu", 4)
+        client.offer(first)
+        await asyncio.sleep(0)   # der Writer hängt nun in send()
+        client.offer(second)
+        client.offer(third)
+        client.behind_since -= client.max_lag + 1
+        with self.assertLogs(main.logger, "WARNING"):
+            client.offer(late)
+        self.assertTrue(client.disconnected)
+        self.assertEqual(client.depth, 0)
+        await client.closing
+        self.assertEqual(ws.closed, (1013, "client too slow"))
+        with self.assertRaises(asyncio.CancelledError):
+            await client.task
+        client.offer(snapshots("cpu", 1, start=5)[0])
+        self.assertEqual(client.depth, 0)
+
+    async def test_drop_resets_delta_base(self):
+        """json-delta: nach einer verworfenen Nachricht folgt ein voller Stand."""
+        ws = FakeWebSocket()
+        client = self.client("drop-oldest", max_queue=1, mode="json-delta", ws=ws)
+        topic = main.Topic("cpu")
+        for value in range(3):
+            topic.publish({"value": value})
+        client.delta_base.add("cpu")
+        client.offer(topic.history[1])
+        client.offer(topic.history[2])
+        self.assertEqual(client.dropped, 1)
+        self.assertNotIn("cpu", client.delta_base)
+        client.start()
+        self.addCleanup(client.stop)
+        while not ws.sent:
+            await asyncio.sleep(0)
+        message = json.loads(ws.sent[0])
+        self.assertEqual((message["type"], message["seq"]), ("snapshot", 3))
+        self.assertIn("cpu", client.delta_base)
+
+
+class DiffTest(unittest.TestCase):
+    """Tests für die Deltas von json-delta."""
+
+    def test_changed_fields(self):
+        """Nur geänderte Felder, verschachtelt; entfernte Schlüssel werden None."""
+        previous = {"cpu": 10, "memory": {"used": 1, "free": 3}, "old": 1}
+        current = {"cpu": 10, "memory": {"used": 2, "free": 3}, "new": 5}
+        self.assertEqual(
+            main.diff(previous, current), {"memory": {"used": 2}, "old": None, "new": 5}
+        )
+        self.assertEqual(main.diff(current, current), {})
+
+
+class ResumeTest(unittest.IsolatedAsyncioTestCase):
+    """Tests für Topic.since, Client.replay und Sampler.subscribe."""
+
+    def setUp(self):
+        self.sampler = main.Sampler()
+        self.topic = self.sampler.register("cpu", interval=60)
+        for value in range(5):
+            self.topic.publish({"value": value})
+
+    def client(self, mode="json", ws=None):
+        return main.Client(ws or FakeWebSocket(), "test", policy="drop-oldest",
+                           max_queue=8, mode=mode)
+
+    def resume(self, client, seq):
+        epoch = self.sampler.epoch
+        self.sampler.subscribe(client, ["cpu"], since={"cpu": seq}, epoch=epoch)
+
+    def queued(self, client):
+        return [snapshot.seq for snapshot in client.queue]
+
+    def test_since(self):
+        """Genau die fehlenden Nachrichten, solange sie lückenlos vorliegen."""
+        self.assertEqual([s.seq for s in self.topic.since(2)], [3, 4, 5])
+        self.assertEqual(self.topic.since(5), [])
+        self.assertIsNone(self.topic.since(6))
+        self.assertIsNone(main.Topic("leer").since(0))
+
+    def test_since_beyond_buffer(self):
+        """Ist die Lücke größer als der Ringpuffer, gibt es keinen Replay."""
+        topic = main.Topic("disk")
+        topic.history = main.collections.deque(maxlen=3)
+        for value in range(6):
+            topic.publish({"value": value})
+        self.assertIsNone(topic.since(2))
+        self.assertEqual([s.seq for s in topic.since(3)], [4, 5, 6])
+
+    def test_exact_gap_replays_missing_messages(self):
+        """Passende epoch: nur die verpassten Nachrichten werden eingereiht."""
+        client = self.client()
+        self.resume(client, 3)
+        self.assertEqual(self.queued(client), [4, 5])
+        self.assertIn("cpu", client.delta_base)
+
+    def test_wrong_epoch_gets_full_state(self):
+        """Andere epoch (neuer Datenstrom): voller Stand statt Replay."""
+        client = self.client()
+        self.sampler.subscribe(client, ["cpu"], since={"cpu": 3}, epoch="anders")
+        self.assertEqual(self.queued(client), [5])
+        self.assertNotIn("cpu", client.delta_base)
+
+    def test_gap_beyond_buffer_gets_full_state(self):
+        """Liegt die Lücke nicht mehr im Puffer, gibt es den vollen Stand."""
+        self.topic.history = main.collections.deque(list(self.topic.history)[-2:])
+        client = self.client()
+        self.resume(client, 1)
+        self.assertEqual(self.queued(client), [5])
+        self.assertNotIn("cpu", client.delta_base)
+
+    def test_html_gets_latest_fragment(self):
+        """html-Clients erhalten immer nur das neueste Fragment."""
+        client = self.client(mode="html")
+        self.resume(client, 3)
+        self.assertEqual(self.queued(client), [5])
+
+    async def test_delta_base_valid_after_replay(self):
+        """json-delta: verpasste Deltas werden als Deltas nachgereicht."""
+        ws = FakeWebSocket()
+        client = self.client(mode="json-delta", ws=ws)
+        self.resume(client, 3)
+        client.start()
+        self.addCleanup(client.stop)
+        self.topic.publish({"value": 5})
+        while len(ws.sent) < 3:
+            await asyncio.sleep(0)
+        messages = [json.loads(message) for message in ws.sent]
+        self.assertEqual(
+            [(message["type"], message["seq"]) for message in messages],
+            [("delta", 4), ("delta", 5), ("delta", 6)],
+        )
+        self.assertEqual(messages[0]["content"], {"value": 3})
+
+
+class FakeProcess:
+    """Prozess-Attrappe: ``terminate`` beendet erst nach ``exit()``."""
+
+    def __init__(self, name):
+        self.name = name
+        self.alive = True
+        self.terminated = self.killed = False
+
+    def is_alive(self):
+        return self.alive
+
+    def terminate(self):
+        self.terminated = True
+
+    def kill(self):
+        self.killed = True
+        self.alive = False
+
+    def exit(self):
+        self.alive = False
+
+    def join(self, timeout=None):
+        pass
+
+
+class RollingRestartTest(unittest.TestCase):
+    """Tests für den nicht blockierenden Rolling Restart des Supervisors."""
+
+    def setUp(self):
+        self.now = 0.0
+        patcher = mock.patch.object(main.time, "monotonic", lambda: self.now)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.supervisor = main.Supervisor(2)
+        self.spawned = 0
+        self.supervisor.spawn = self.spawn
+        self.old = [FakeProcess("old-0"), FakeProcess("old-1")]
+        self.supervisor.workers = list(self.old)
+
+    def spawn(self, target, *args):
+        self.spawned += 1
+        return FakeProcess(f"new-{args[0]}")
+
+    def step(self, seconds=0.0):
+        self.now += seconds
+        self.supervisor.rolling_restart()
+
+    def names(self):
+        return [process.name for process in self.supervisor.workers]
+
+    def test_one_worker_at_a_time(self):
+        """Pro Schritt passiert höchstens eine Aktion; nichts wartet blockierend."""
+        self.supervisor.start_rolling_restart()
+        self.step()
+        self.assertEqual(self.names(), ["new-0", "old-1"])
+        self.step(0.5)
+        self.assertFalse(self.old[0].terminated)
+        self.step(main.BIND_DELAY)
+        self.assertTrue(self.old[0].terminated)
+        self.step(0.5)
+        self.assertEqual(self.names(), ["new-0", "old-1"])  # old-0 leert sich noch
+        self.old[0].exit()
+        self.step()
+        self.assertEqual(self.names(), ["new-0", "new-1"])
+        self.step(main.BIND_DELAY)
+        self.old[1].exit()
+        self.step()
+        self.assertEqual(self.spawned, 2)
+        self.assertFalse(self.supervisor.retiring)
+        self.assertIsNone(self.supervisor.replacing)
+
+    def test_kill_after_grace(self):
+        """Ein alter Worker, der nicht endet, wird nach SHUTDOWN_GRACE getötet."""
+        self.supervisor.start_rolling_restart()
+        self.step()
+        self.step(main.BIND_DELAY)
+        self.step(main.SHUTDOWN_GRACE - 1)
+        self.assertFalse(self.old[0].killed)
+        self.step(1)
+        self.assertTrue(self.old[0].killed)
+        self.assertNotIn(self.old[0], self.supervisor.retiring)
+
+    def test_restart_in_progress(self):
+        """Ein weiteres SIGHUP während des Restarts wird ignoriert."""
+        self.supervisor.start_rolling_restart()
+        self.step()
+        with self.assertLogs(main.logger, "INFO") as logs:
+            self.supervisor.start_rolling_restart()
+        self.assertIn("already in progress", logs.output[0])
+        self.assertEqual(list(self.supervisor.restart_queue), [1])
+
+
+if __name__ == "__main__":
+    unittest.main()